@@ -29,7 +29,8 @@ from inspirehep.accounts.decorators import login_required, login_required_with_r
 from inspirehep.accounts.roles import Roles
 from inspirehep.files.api import current_s3_instance
 from inspirehep.matcher.api import match_references
-from inspirehep.matcher.utils import create_journal_dict, map_refextract_to_schema
+from inspirehep.matcher.cache import get_cached_journal_dict
+from inspirehep.matcher.utils import map_refextract_to_schema
 from inspirehep.pidstore.api.base import PidStoreBase
 from inspirehep.records.api import InspireRecord
 from inspirehep.rt import tickets
@@ -256,7 +257,10 @@ def refextract_text():
     """Run refextract on a piece of text."""
     if current_app.config.get("FEATURE_FLAG_ENABLE_REFEXTRACT_SERVICE"):
         headers = {"Content-Type": "application/json", "Accept": "application/json"}
-        data = {"journal_kb_data": create_journal_dict(), "text": request.json["text"]}
+        data = {
+            "journal_kb_data": get_cached_journal_dict(),
+            "text": request.json["text"],
+        }
         response = requests.post(
             f"{current_app.config['REFEXTRACT_SERVICE_URL']}/extract_references_from_text",
             headers=headers,
@@ -268,7 +272,7 @@ def refextract_text():
     else:
         extracted_references = extract_references_from_string(
             request.json["text"],
-            override_kbs_files={"journals": create_journal_dict()},
+            override_kbs_files={"journals": get_cached_journal_dict()},
             reference_format="{title},{volume},{page}",
         )
     deduplicated_extracted_references = dedupe_list(extracted_references)
@@ -283,7 +287,10 @@ def refextract_url():
     """Run refextract on a URL."""
     if current_app.config.get("FEATURE_FLAG_ENABLE_REFEXTRACT_SERVICE"):
         headers = {"Content-Type": "application/json", "Accept": "application/json"}
-        data = {"journal_kb_data": create_journal_dict(), "url": request.json["url"]}
+        data = {
+            "journal_kb_data": get_cached_journal_dict(),
+            "url": request.json["url"],
+        }
         response = requests.post(
             f"{current_app.config['REFEXTRACT_SERVICE_URL']}/extract_references_from_url",
             headers=headers,
@@ -295,7 +302,7 @@ def refextract_url():
     else:
         extracted_references = extract_references_from_url(
             request.json["url"],
-            override_kbs_files={"journals": create_journal_dict()},
+            override_kbs_files={"journals": get_cached_journal_dict()},
             reference_format="{title},{volume},{page}",
         )
     deduplicated_extracted_references = dedupe_list(extracted_references)
@@ -5,9 +5,14 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+from time import time
+
 from flask import current_app
 
 from inspirehep.records.api import AuthorsRecord, ConferencesRecord, LiteratureRecord
+from inspirehep.utils import get_redis
+
+PENDING_REFERENCES_KEY = "indexer:references:pending"
 
 
 def get_references_to_update(record):
@@ -33,3 +38,31 @@ def get_references_to_update(record):
         )
 
     return uuids_to_reindex
+
+
+def add_pending_references(uuids):
+    """Mark the records as pending to be reindexed as references.
+
+    Entries older than ``INDEXER_REFERENCES_PENDING_TTL`` seconds are
+    considered stale (e.g. their task was lost) and are replaced.
+
+    Args:
+        uuids (iterable): UUIDs of the records to reindex.
+
+    Returns:
+        list: UUIDs of the records which weren't already pending.
+    """
+    uuids = list(uuids)
+    now = time()
+    ttl = current_app.config["INDEXER_REFERENCES_PENDING_TTL"]
+    with get_redis().pipeline() as pipeline:
+        pipeline.zremrangebyscore(PENDING_REFERENCES_KEY, "-inf", now - ttl)
+        for uuid in uuids:
+            pipeline.zadd(PENDING_REFERENCES_KEY, {uuid: now}, nx=True)
+        _, *added = pipeline.execute()
+    return [uuid for uuid, is_added in zip(uuids, added) if is_added]
+
+
+def remove_pending_references(uuids):
+    if uuids:
+        get_redis().zrem(PENDING_REFERENCES_KEY, *uuids)
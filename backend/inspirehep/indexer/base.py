@@ -5,6 +5,8 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+from time import monotonic
+
 import structlog
 from elasticsearch import ConflictError, NotFoundError, RequestError, TransportError
 from elasticsearch.helpers import streaming_bulk
@@ -15,7 +17,13 @@ from invenio_indexer.signals import before_record_index
 from invenio_indexer.utils import _es7_expand_action
 from invenio_search import current_search_client as es
 from kombu.exceptions import EncodeError
-from sqlalchemy.orm.exc import NoResultFound
+
+from inspirehep.search.cache import (
+    get_search_results_cache_write_arguments,
+    invalidate_search_results_cache,
+    refresh_and_invalidate_search_results_cache,
+)
+from inspirehep.utils import chunker
 
 LOGGER = structlog.getLogger()
 
@@ -73,25 +81,47 @@ class InspireRecordIndexer(RecordIndexer):
             "_source": self._prepare_record(record, index, doc_type),
         }
 
-    def bulk_index(self, records_uuids, request_timeout=None, max_chunk_bytes=None):
+    def bulk_index(
+        self, records_uuids, request_timeout=None, max_chunk_bytes=None, index=None
+    ):
         """Starts bulk indexing for specified records
 
         Args:
             records_uuids(list[str): List of strings which are UUID's of records
                 to reindex
             request_timeout(int): Maximum time after which es will throw an exception
+            index(str): Name of the index (without prefix) in which records
+                should be indexed. Determined automatically from record metadata
+                if not provided.
 
         Returns:
             dict: dict with success count and failure list
-                (with uuids of failed records)
+                (with uuids of failed records), ``elapsed_time`` of the bulk
+                indexing and ``es_bulk_time`` spent waiting for ES, in seconds.
 
         """
+        start_time = monotonic()
+        actions_time = 0
+        indexes = set()
+
+        def timed_bulk_iterator():
+            nonlocal actions_time
+            actions = self.bulk_iterator(records_uuids, index=index)
+            while True:
+                action_start_time = monotonic()
+                action = next(actions, None)
+                actions_time += monotonic() - action_start_time
+                if action is None:
+                    return
+                indexes.add(action["_index"])
+                yield action
+
         if not request_timeout:
             request_timeout = current_app.config["INDEXER_BULK_REQUEST_TIMEOUT"]
         max_chunk_bytes = max_chunk_bytes or 100 * 1014 * 1024  # default ES setting
         result = streaming_bulk(
             es,
-            self.bulk_iterator(records_uuids),
+            timed_bulk_iterator(),
             request_timeout=request_timeout,
             raise_on_error=False,
             raise_on_exception=False,
@@ -106,6 +136,7 @@ class InspireRecordIndexer(RecordIndexer):
             if not action_success:
                 failures.append(
                     {
+                        "uuid": action_data["index"].get("_id"),
                         "status_code": action_data["index"]["status"],
                         "error_type": str(
                             get_value(action_data, "index.error.type", "")
@@ -116,42 +147,83 @@ class InspireRecordIndexer(RecordIndexer):
                     }
                 )
 
+        # a new index being filled isn't searched
+        if not index:
+            refresh_and_invalidate_search_results_cache(*indexes)
         number_of_failures = len(failures)
+        elapsed_time = monotonic() - start_time
 
         return {
             "uuids": records_uuids,
             "success_count": len(records_uuids) - number_of_failures,
             "failures_count": number_of_failures,
             "failures": failures,
+            "elapsed_time": elapsed_time,
+            "es_bulk_time": elapsed_time - actions_time,
         }
 
-    def bulk_iterator(self, records_uuids):
-        for record_uuid in records_uuids:
-            data = self.bulk_action(record_uuid)
-            if not data:
-                continue
-            yield data
+    def bulk_iterator(self, records_uuids, index=None):
+        """Yields bulk actions for the given records.
 
-    def bulk_action(self, record_uuid):
-        try:
-            from inspirehep.records.api import InspireRecord
+        Records are loaded from the DB in batches of
+        ``INDEXER_BULK_DB_BATCH_SIZE`` (one query per batch), data shared by the
+        whole batch is precomputed with ``prepare_records_batch`` and every
+        action is yielded as soon as it's built, so it can be streamed to ES.
+        """
+        from inspirehep.records.api import InspireRecord
 
-            record = InspireRecord.get_record(record_uuid, with_deleted=True)
+        batch_size = current_app.config["INDEXER_BULK_DB_BATCH_SIZE"]
+        for batch in chunker(records_uuids, max_chunk_size=batch_size):
+            records = list(
+                InspireRecord.get_records_batched(
+                    batch, with_deleted=True, max_batch=batch_size
+                )
+            )
+            self.prepare_records_batch(records)
+            for record in records:
+                data = self.bulk_action(record, index=index)
+                if not data:
+                    continue
+                yield data
+
+            loaded_uuids = {str(record.id) for record in records}
+            for record_uuid in {str(uuid) for uuid in batch} - loaded_uuids:
+                LOGGER.error("Record failed to load", uuid=record_uuid)
+
+    @staticmethod
+    def prepare_records_batch(records):
+        """Precompute data needed to serialize all the records of the batch.
+
+        Args:
+            records (list(InspireRecord)): records which are about to be indexed.
+        """
+        from inspirehep.records.api import LiteratureRecord
+        from inspirehep.records.api.mixins import CitationMixin
+
+        records = [record for record in records if not record.get("deleted", False)]
+        CitationMixin.prefetch_citation_aggregates(records)
+        LiteratureRecord.prefetch_linked_authors_facet_names(
+            [record for record in records if isinstance(record, LiteratureRecord)]
+        )
+
+    def bulk_action(self, record, index=None):
+        try:
             if record.get("deleted", False):
+                if index:
+                    # a new index is being filled, there's nothing to remove
+                    return None
                 try:
                     # When record is not in es then dsl is throwing TransportError(404)
                     record.index(delay=False, force_delete=True)
                 except TransportError:
                     LOGGER.warning("Record not found in ES!", uuid=str(record.id))
                 return None
-            return self._process_bulk_record_for_index(record)
-        except NoResultFound:
-            LOGGER.exception("Record failed to load", uuid=str(record_uuid))
+            return self._process_bulk_record_for_index(record, index=index)
         except RequestError:
-            LOGGER.exception("Cannot process request on ES", uuid=str(record_uuid))
+            LOGGER.exception("Cannot process request on ES", uuid=str(record.id))
         except EncodeError:
             LOGGER.exception(
-                "Kombu is not able to process response!", uuid=str(record_uuid)
+                "Kombu is not able to process response!", uuid=str(record.id)
             )
 
     def _get_indexing_arguments(self):
@@ -159,18 +231,26 @@ class InspireRecordIndexer(RecordIndexer):
         pass
 
     def index(self, record, force_delete=None, record_version=None):
+        index, doc_type = self.record_to_index(record)
+        write_arguments = get_search_results_cache_write_arguments()
         if not force_delete:
             deleted = record.get("deleted", False)
 
         if force_delete or deleted:
             try:
-                self.delete(record)
+                self.delete(record, **write_arguments)
                 LOGGER.debug("Record removed from ES", uuid=str(record.id))
             except NotFoundError:
                 LOGGER.debug("Record to delete not found", uuid=str(record.id))
         else:
             try:
-                super().index(record, arguments=self._get_indexing_arguments())
+                super().index(
+                    record,
+                    arguments={
+                        **(self._get_indexing_arguments() or {}),
+                        **write_arguments,
+                    },
+                )
             except ConflictError as err:
                 LOGGER.warning(
                     "VersionConflict on record indexing.",
@@ -179,9 +259,32 @@ class InspireRecordIndexer(RecordIndexer):
                     force_delete=force_delete,
                     error=err,
                 )
+        invalidate_search_results_cache(self._prepare_index(index, doc_type)[0])
 
 
 class LiteratureRecordFulltextIndexer(InspireRecordIndexer):
+    @staticmethod
+    def prepare_records_batch(records):
+        """Precompute data needed to serialize all the records of the batch.
+
+        On top of the data needed by ``InspireRecordIndexer``, the fulltexts of
+        the documents are fetched concurrently.
+
+        Args:
+            records (list(InspireRecord)): records which are about to be indexed.
+        """
+        from inspirehep.records.api import LiteratureRecord
+
+        InspireRecordIndexer.prepare_records_batch(records)
+        LiteratureRecord.prefetch_documents_fulltexts(
+            [
+                record
+                for record in records
+                if isinstance(record, LiteratureRecord)
+                and not record.get("deleted", False)
+            ]
+        )
+
     def _prepare_record(self, record, index, doc_type="_doc", arguments=None, **kwargs):
         data = record.serialize_for_es_with_fulltext()
         before_record_index.send(
@@ -218,7 +321,7 @@ class LiteratureRecordFulltextIndexer(InspireRecordIndexer):
         """
         ingestion_pipeline_name = current_app.config["ES_FULLTEXT_PIPELINE_NAME"]
         payload = super()._process_bulk_record_for_index(
-            record, version_type="external_gte", index=None, doc_type=None
+            record, version_type="external_gte", index=index, doc_type=None
         )
         payload["pipeline"] = ingestion_pipeline_name
         return payload
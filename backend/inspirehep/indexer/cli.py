@@ -6,10 +6,12 @@
 # the terms of the MIT License; see LICENSE file for more details.
 
 import re
-from os import makedirs, path
-from time import sleep
+from datetime import datetime
+from os import makedirs, path, replace
+from time import monotonic, sleep
 
 import click
+import orjson
 import structlog
 from click import UsageError
 from elasticsearch.client.ingest import IngestClient
@@ -17,12 +19,21 @@ from flask import current_app
 from flask.cli import with_appcontext
 from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.models import RecordMetadata
 from invenio_search import current_search
 from invenio_search.cli import index
+from invenio_search.utils import build_alias_name, build_index_name, timestamp_suffix
+from sqlalchemy import type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 
+from inspirehep.indexer.base import (
+    InspireRecordIndexer,
+    LiteratureRecordFulltextIndexer,
+)
 from inspirehep.indexer.tasks import batch_index, batch_index_literature_fulltext
 from inspirehep.records.api import InspireRecord
-from inspirehep.utils import next_batch
+from inspirehep.search.cache import invalidate_search_results_cache
+from inspirehep.utils import chunker, next_batch
 
 LOGGER = structlog.getLogger()
 FULLTEXT_PIPELINE_SETUP = {
@@ -69,11 +80,13 @@ FULLTEXT_PIPELINE_SETUP = {
 }
 
 
-def get_query_records_to_index(pid_types):
+def get_query_records_to_index(pid_types, after_uuid=None):
     """Return a query for retrieving all records by pid_type.
 
     Args:
         pid_types(List[str]): a list of pid types
+        after_uuid(str): if set, only the records with a greater UUID are
+            retrieved, ordered by UUID.
 
     Return:
         SQLAlchemy query for non deleted record with pid type in `pid_types`
@@ -85,6 +98,10 @@ def get_query_records_to_index(pid_types):
             (PIDStatus.REGISTERED, PIDStatus.REDIRECTED, PIDStatus.DELETED)
         ),
     )  # noqa
+    if after_uuid:
+        query = query.filter(PersistentIdentifier.object_uuid > after_uuid).order_by(
+            PersistentIdentifier.object_uuid
+        )
     return query
 
 
@@ -93,6 +110,227 @@ def _prepare_logdir(log_path):
         makedirs(path.dirname(log_path))
 
 
+def _load_reindex_checkpoint(checkpoint_path):
+    if not path.exists(checkpoint_path):
+        return {"pid_types": {}, "failed_uuids": []}
+    with open(checkpoint_path, "rb") as checkpoint_file:
+        return orjson.loads(checkpoint_file.read())
+
+
+def _save_reindex_checkpoint(checkpoint_path, checkpoint):
+    _prepare_logdir(checkpoint_path)
+    tmp_checkpoint_path = f"{checkpoint_path}.tmp"
+    with open(tmp_checkpoint_path, "wb") as checkpoint_file:
+        checkpoint_file.write(orjson.dumps(checkpoint))
+    replace(tmp_checkpoint_path, checkpoint_path)
+
+
+def _schedule_indexing_tasks(query, schedule, batch_size, db_batch_size, label):
+    """Schedule the indexing tasks of the records of the query, in batches.
+
+    Args:
+        query: SQLAlchemy query of the UUIDs of the records.
+        schedule(callable): schedules the task for a list of UUIDs.
+
+    Returns:
+        tuple: the scheduled tasks with their UUIDs and the number of records.
+    """
+    total = query.count()
+    tasks_and_uuids = []
+
+    with click.progressbar(
+        query.yield_per(db_batch_size), length=total, label=label
+    ) as items:
+        batch = next_batch(items, batch_size)
+
+        while batch:
+            tasks_and_uuids.append(schedule([str(item[0]) for item in batch]))
+            batch = next_batch(items, batch_size)
+    return tasks_and_uuids, total
+
+
+class ReindexProgress:
+    """Progress of the bulk indexing tasks of a reindex, per pid type.
+
+    For every pid type the checkpoint keeps the last UUID up to which all the
+    records were processed (tasks finish out of order, so it only moves when
+    all the previous tasks are finished) and whether all its records were
+    processed, plus the UUIDs of all the records which failed to be indexed.
+    """
+
+    # pseudo pid type of the tasks retrying the failures of the checkpoint
+    RETRIED_FAILURES = "failed"
+
+    @classmethod
+    def from_checkpoint_path(cls, checkpoint_path=None, resume=False):
+        if not checkpoint_path:
+            return cls()
+        if resume:
+            checkpoint = _load_reindex_checkpoint(checkpoint_path)
+        else:
+            checkpoint = {"pid_types": {}, "failed_uuids": []}
+        return cls(checkpoint, checkpoint_path)
+
+    def __init__(self, checkpoint=None, checkpoint_path=None):
+        self.checkpoint = checkpoint
+        self.checkpoint_path = checkpoint_path
+        self.start_time = monotonic()
+        self.tasks = {}
+        self.stats = {}
+        self.batch_errors = []
+        self.successes_count = 0
+        self.failures_count = 0
+
+    def add_tasks(self, pid_type, tasks_and_uuids, total):
+        self.tasks[pid_type] = {
+            "tasks": tasks_and_uuids,
+            "finished": [False] * len(tasks_and_uuids),
+            "next_unfinished": 0,
+        }
+        self.stats[pid_type] = {
+            "total": total,
+            "processed": 0,
+            "finished_tasks": 0,
+            "es_bulk_time": 0,
+        }
+
+    def get_failed_uuids_to_retry(self):
+        if self.checkpoint is None:
+            return []
+        return list(self.checkpoint["failed_uuids"])
+
+    def is_completed(self, pid_type):
+        if self.checkpoint is None:
+            return False
+        return self.checkpoint["pid_types"].get(pid_type, {}).get("completed", False)
+
+    def get_uuid_to_resume_from(self, pid_type):
+        """Return the UUID after which the records of the pid type are indexed.
+
+        Without checkpoint it's ``None``, otherwise the records are indexed in
+        UUID order, so the reindex can be resumed.
+        """
+        if self.checkpoint is None:
+            return None
+        pid_type_checkpoint = self.checkpoint["pid_types"].setdefault(
+            pid_type, {"last_uuid": None, "completed": False}
+        )
+        return pid_type_checkpoint["last_uuid"] or (
+            "00000000-0000-0000-0000-000000000000"
+        )
+
+    @property
+    def all_tasks_count(self):
+        return sum(len(tasks["tasks"]) for tasks in self.tasks.values())
+
+    @property
+    def finished_tasks_count(self):
+        return sum(stats["finished_tasks"] for stats in self.stats.values())
+
+    def update(self):
+        """Collect the results of the finished tasks and save the checkpoint."""
+        checkpoint_changed = False
+        for pid_type, tasks in self.tasks.items():
+            for position, (task, uuids) in enumerate(tasks["tasks"]):
+                if tasks["finished"][position] or not task.ready():
+                    continue
+                tasks["finished"][position] = True
+                checkpoint_changed = True
+                self._collect_result(pid_type, task, uuids)
+
+            while tasks["next_unfinished"] < len(tasks["tasks"]) and (
+                tasks["finished"][tasks["next_unfinished"]]
+            ):
+                tasks["next_unfinished"] += 1
+            if self.checkpoint is not None and pid_type in self.checkpoint["pid_types"]:
+                pid_type_checkpoint = self.checkpoint["pid_types"][pid_type]
+                if tasks["next_unfinished"]:
+                    _, uuids = tasks["tasks"][tasks["next_unfinished"] - 1]
+                    pid_type_checkpoint["last_uuid"] = uuids[-1]
+                pid_type_checkpoint["completed"] = all(tasks["finished"])
+
+        if self.checkpoint_path and checkpoint_changed:
+            _save_reindex_checkpoint(self.checkpoint_path, self.checkpoint)
+
+    def wait_for_tasks(self, report_interval):
+        """Wait for all the tasks to finish, reporting the progress periodically."""
+        last_report_time = monotonic()
+        with click.progressbar(
+            length=self.all_tasks_count, label="Indexing records"
+        ) as progressbar:
+            self.update()
+            while self.all_tasks_count != self.finished_tasks_count:
+                sleep(0.5)
+                self.update()
+                if monotonic() - last_report_time >= report_interval:
+                    last_report_time = monotonic()
+                    click.echo(f"\n{self.report()}")
+                # this is so click doesn't divide by 0:
+                progressbar.pos = self.finished_tasks_count or 1
+                progressbar.update(0)
+        if self.checkpoint_path:
+            _save_reindex_checkpoint(self.checkpoint_path, self.checkpoint)
+
+    def _collect_result(self, pid_type, task, uuids):
+        stats = self.stats[pid_type]
+        stats["finished_tasks"] += 1
+        stats["processed"] += len(uuids)
+        result = task.result
+        failed_uuids = []
+        if task.failed():
+            self.batch_errors.append({"task_id": task.id, "error": result})
+            failed_uuids = uuids
+            LOGGER.error(
+                "Reindexing of the batch failed", task_id=task.id, error=result
+            )
+        else:
+            self.successes_count += result["success_count"]
+            self.failures_count += result["failures_count"]
+            stats["es_bulk_time"] += result.get("es_bulk_time", 0)
+            failed_uuids = [failure.get("uuid") for failure in result["failures"]]
+            if result["failures"]:
+                LOGGER.error(
+                    "Some records in a batch failed during reindexing",
+                    task_id=task.id,
+                    number_of_failures=result["failures_count"],
+                    number_of_success=result["success_count"],
+                    failures=result["failures"],
+                )
+        if self.checkpoint is not None:
+            if pid_type == self.RETRIED_FAILURES:
+                retried_uuids = set(uuids)
+                self.checkpoint["failed_uuids"] = [
+                    uuid
+                    for uuid in self.checkpoint["failed_uuids"]
+                    if uuid not in retried_uuids
+                ]
+            self.checkpoint["failed_uuids"].extend(
+                uuid for uuid in failed_uuids if uuid
+            )
+
+    def report(self):
+        """Return the throughput, ES latency and ETA of every pid type."""
+        elapsed_time = monotonic() - self.start_time
+        lines = []
+        for pid_type, stats in self.stats.items():
+            docs_per_second = stats["processed"] / elapsed_time if elapsed_time else 0
+            es_bulk_latency = (
+                stats["es_bulk_time"] / stats["finished_tasks"]
+                if stats["finished_tasks"]
+                else 0
+            )
+            remaining = stats["total"] - stats["processed"]
+            eta = (
+                f"{remaining / docs_per_second:.0f}s" if docs_per_second else "unknown"
+            )
+            lines.append(
+                f"{pid_type}: {stats['processed']}/{stats['total']} records, "
+                f"{docs_per_second:.1f} docs/s, "
+                f"ES bulk time {es_bulk_latency:.2f}s per batch, ETA {eta}"
+            )
+        return "\n".join(lines)
+
+
 @index.command("reindex")  # noqa
 @click.option("--all", is_flag=True, help="Reindex all the records.", show_default=True)
 @click.option(
@@ -139,10 +377,40 @@ def _prepare_logdir(log_path):
     help="The path of the indexing logs. Default is /tmp/inspire.",
     show_default=True,
 )
+@click.option(
+    "-c",
+    "--checkpoint-path",
+    default=None,
+    help="The file where the progress of the reindex is saved, to resume it later.",
+)
+@click.option(
+    "-r",
+    "--resume",
+    is_flag=True,
+    help="Resume the reindex from the checkpoint, retrying the failed records.",
+)
+@click.option(
+    "-ri",
+    "--report-interval",
+    default=30,
+    help="The number of seconds between progress reports.",
+    show_default=True,
+)
 @with_appcontext
 @click.pass_context
 def reindex_records(
-    ctx, all, pidtype, pid, fulltext, queue_name, batch_size, db_batch_size, log_path
+    ctx,
+    all,
+    pidtype,
+    pid,
+    fulltext,
+    queue_name,
+    batch_size,
+    db_batch_size,
+    log_path,
+    checkpoint_path,
+    resume,
+    report_interval,
 ):
     """(Inspire) Reindex records in ElasticSearch.
 
@@ -170,6 +438,13 @@ def reindex_records(
         * Reindex only one record:
 
             >>> inspirehep index reindex -id lit 123456
+
+
+        * Reindex literature records saving the progress, then resume it:
+
+            >>> inspirehep index reindex -p lit -c /tmp/inspire/reindex.json
+
+            >>> inspirehep index reindex -p lit -c /tmp/inspire/reindex.json --resume
     """
     if not bool(all) ^ bool(pidtype) ^ bool(pid):
         raise UsageError(
@@ -203,81 +478,67 @@ def reindex_records(
     if not log_path:
         raise ValueError("Specified empty log path.")
 
-    request_timeout = current_app.config.get("INDEXER_BULK_REQUEST_TIMEOUT")
-    all_tasks = []
-    uuid_records_per_tasks = {}
-    query = get_query_records_to_index(pidtype)
+    if resume and not checkpoint_path:
+        raise UsageError("Please, specify the checkpoint path to resume from.")
 
-    with click.progressbar(
-        query.yield_per(db_batch_size),
-        length=query.count(),
-        label=f"Scheduling indexing tasks to the '{queue_name}' queue.",
-    ) as items:
-        batch = next_batch(items, batch_size)
-
-        while batch:
-            uuids = [str(item[0]) for item in batch]
-            if len(pidtype) == 1 and "lit" in pidtype and fulltext:
-                indexer_task = batch_index_literature_fulltext.apply_async(
-                    kwargs={"records_uuids": uuids, "request_timeout": request_timeout},
-                    queue=queue_name,
-                )
-            else:
-                indexer_task = batch_index.apply_async(
-                    kwargs={"records_uuids": uuids, "request_timeout": request_timeout},
-                    queue=queue_name,
-                )
-
-            uuid_records_per_tasks[indexer_task.id] = uuids
-            all_tasks.append(indexer_task)
-            batch = next_batch(items, batch_size)
+    request_timeout = current_app.config.get("INDEXER_BULK_REQUEST_TIMEOUT")
+    indexer_task = (
+        batch_index_literature_fulltext
+        if len(pidtype) == 1 and "lit" in pidtype and fulltext
+        else batch_index
+    )
 
-    click.secho("Created {} bulk-indexing tasks.".format(len(all_tasks)), fg="green")
+    def _schedule(uuids):
+        task = indexer_task.apply_async(
+            kwargs={"records_uuids": uuids, "request_timeout": request_timeout},
+            queue=queue_name,
+        )
+        return task, uuids
+
+    progress = ReindexProgress.from_checkpoint_path(checkpoint_path, resume)
+    failed_uuids = progress.get_failed_uuids_to_retry()
+    if failed_uuids:
+        progress.add_tasks(
+            ReindexProgress.RETRIED_FAILURES,
+            [_schedule(uuids) for uuids in chunker(failed_uuids, batch_size)],
+            len(failed_uuids),
+        )
 
-    with click.progressbar(
-        length=len(all_tasks), label="Indexing records"
-    ) as progressbar:
+    for pid_type in pidtype:
+        if progress.is_completed(pid_type):
+            click.secho(f"Skipping '{pid_type}', already reindexed.")
+            continue
+        query = get_query_records_to_index(
+            [pid_type], after_uuid=progress.get_uuid_to_resume_from(pid_type)
+        )
+        tasks_and_uuids, total = _schedule_indexing_tasks(
+            query,
+            _schedule,
+            batch_size,
+            db_batch_size,
+            f"Scheduling '{pid_type}' indexing tasks to the '{queue_name}' queue.",
+        )
+        progress.add_tasks(pid_type, tasks_and_uuids, total)
 
-        def _finished_tasks_count():
-            return len([task for task in all_tasks if task.ready()])
+    click.secho(
+        "Created {} bulk-indexing tasks.".format(progress.all_tasks_count), fg="green"
+    )
 
-        while len(all_tasks) != _finished_tasks_count():
-            sleep(0.5)
-            # this is so click doesn't divide by 0:
-            progressbar.pos = _finished_tasks_count() or 1
-            progressbar.update(0)
+    progress.wait_for_tasks(report_interval)
 
-    failures_count = 0
-    successes_count = 0
-    batch_errors = []
-
-    for task in all_tasks:
-        result = task.result
-        if task.failed():
-            batch_errors.append({"task_id": task.id, "error": result})
-            LOGGER.error(
-                "Reindexing of the batch failed", task_id=task.id, error=result
-            )
-        else:
-            successes_count += result["success_count"]
-            failures_count += result["failures_count"]
-            if result["failures"]:
-                LOGGER.error(
-                    "Some records in a batch failed during reindexing",
-                    task_id=task.id,
-                    number_of_failures=result["failures_count"],
-                    number_of_success=result["success_count"],
-                    failures=result["failures"],
-                )
+    failures_count = progress.failures_count
+    successes_count = progress.successes_count
+    batch_errors = progress.batch_errors
 
     color = "red" if failures_count > 0 or batch_errors else "green"
     LOGGER.info(
         "Reindexing completed!",
         number_of_batch_errors=len(batch_errors),
-        number_of_batch_success=len(all_tasks) - len(batch_errors),
+        number_of_batch_success=progress.all_tasks_count - len(batch_errors),
         number_of_success=successes_count,
         number_of_failures=failures_count,
     )
+    click.echo(progress.report())
     click.secho(
         f"Reindex completed!\n{successes_count} succeeded\n{failures_count} failed\n{len(batch_errors)} entire batches failed",
         fg=color,
@@ -341,6 +602,259 @@ def remap_indexes(ctx, yes_i_know, indexes, ignore_checks):
     click.echo("remapped indexes %s" % [i[0] for i in created_indexes])
 
 
+def get_pid_types_for_index(index_name):
+    endpoints = current_app.config["RECORDS_REST_ENDPOINTS"].values()
+    return sorted(
+        {
+            endpoint["pid_type"]
+            for endpoint in endpoints
+            if endpoint.get("search_index") == index_name
+        }
+    )
+
+
+def _rebuild_index(
+    index_name, queue_name, batch_size, db_batch_size, report_interval, delete_old
+):
+    client = current_search.client
+    alias = build_alias_name(index_name)
+    if client.indices.exists(index=alias) and not client.indices.exists_alias(
+        name=alias
+    ):
+        click.secho(f"'{alias}' is an index, not an alias, it can't be swapped.")
+        return False
+    old_indexes = (
+        client.indices.get_alias(name=alias)
+        if client.indices.exists_alias(name=alias)
+        else {}
+    )
+    old_settings = {
+        "refresh_interval": None,
+        "number_of_replicas": None,
+    }
+    if old_indexes:
+        index_settings = client.indices.get_settings(index=",".join(old_indexes))
+        old_settings.update(
+            {
+                key: value
+                for key, value in next(iter(index_settings.values()))["settings"][
+                    "index"
+                ].items()
+                if key in old_settings
+            }
+        )
+
+    rebuild_start_date = datetime.utcnow()
+    suffix = timestamp_suffix()
+    new_index = build_index_name(index_name, suffix=suffix)
+    current_search.create_index(index_name, suffix=suffix, create_write_alias=False)
+    # refresh and replicas only slow down the bulk load of an index nobody reads
+    client.indices.put_settings(
+        index=new_index,
+        body={"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+    )
+    click.echo(f"Created '{new_index}', loading records into it.")
+
+    pid_types = get_pid_types_for_index(index_name)
+    if "lit" in pid_types and current_app.config.get("FEATURE_FLAG_ENABLE_FULLTEXT"):
+        indexer_task, indexer = (
+            batch_index_literature_fulltext,
+            LiteratureRecordFulltextIndexer(),
+        )
+    else:
+        indexer_task, indexer = batch_index, InspireRecordIndexer()
+
+    def _schedule(uuids):
+        task = indexer_task.apply_async(
+            kwargs={
+                "records_uuids": uuids,
+                "request_timeout": current_app.config["INDEXER_BULK_REQUEST_TIMEOUT"],
+                "index": f"{index_name}{suffix}",
+            },
+            queue=queue_name,
+        )
+        return task, uuids
+
+    progress = ReindexProgress()
+    for pid_type in pid_types:
+        tasks_and_uuids, total = _schedule_indexing_tasks(
+            get_query_records_to_index([pid_type]),
+            _schedule,
+            batch_size,
+            db_batch_size,
+            f"Scheduling '{pid_type}' indexing tasks to the '{queue_name}' queue.",
+        )
+        progress.add_tasks(pid_type, tasks_and_uuids, total)
+    progress.wait_for_tasks(report_interval)
+    click.echo(progress.report())
+    if progress.failures_count or progress.batch_errors:
+        click.secho(
+            f"{progress.failures_count} records and {len(progress.batch_errors)} "
+            f"entire batches failed, '{alias}' still points to the old index, "
+            f"'{new_index}' is kept for inspection.",
+            fg="red",
+        )
+        return False
+
+    def _index_changed_records():
+        changed_records = (
+            get_query_records_to_index(pid_types)
+            .join(RecordMetadata, RecordMetadata.id == PersistentIdentifier.object_uuid)
+            .filter(RecordMetadata.updated >= rebuild_start_date)
+            .with_entities(
+                PersistentIdentifier.object_uuid,
+                type_coerce(RecordMetadata.json, JSONB)["deleted"],
+            )
+            .all()
+        )
+        changed_uuids = [str(uuid) for uuid, deleted in changed_records if not deleted]
+        for uuids in chunker(changed_uuids, batch_size):
+            indexer.bulk_index(uuids, index=f"{index_name}{suffix}")
+        for uuid, deleted in changed_records:
+            if deleted:
+                client.delete(index=new_index, id=str(uuid), ignore=[404])
+
+    # the records changed during the load were indexed only in the old index
+    _index_changed_records()
+
+    client.indices.put_settings(index=new_index, body={"index": old_settings})
+    client.indices.refresh(index=new_index)
+
+    aliases_by_old_index = {
+        old_index: set(index_aliases["aliases"])
+        for old_index, index_aliases in (
+            client.indices.get_alias(index=",".join(old_indexes)).items()
+            if old_indexes
+            else []
+        )
+    }
+    aliases = {alias}.union(*aliases_by_old_index.values())
+    actions = [
+        {"remove": {"index": old_index, "alias": alias_name}}
+        for old_index, index_aliases in aliases_by_old_index.items()
+        for alias_name in sorted(index_aliases)
+    ]
+    actions.extend(
+        {"add": {"index": new_index, "alias": alias_name}}
+        for alias_name in sorted(aliases)
+    )
+    client.indices.update_aliases(body={"actions": actions})
+    click.echo(f"Swapped aliases {sorted(aliases)} to '{new_index}'.")
+    # and the records changed until the swap as well
+    _index_changed_records()
+    client.indices.refresh(index=new_index)
+    invalidate_search_results_cache(*aliases)
+
+    if delete_old:
+        if set(client.indices.get_alias(name=alias)) != {new_index}:
+            click.secho(
+                f"'{alias}' doesn't point only to '{new_index}', the old indexes "
+                "are kept.",
+                fg="red",
+            )
+            return False
+        for old_index in old_indexes:
+            client.indices.delete(index=old_index)
+            click.echo(f"Deleted '{old_index}'.")
+    click.secho(f"Rebuilt '{index_name}' in '{new_index}'.", fg="green")
+    return True
+
+
+@index.command(
+    "rebuild",
+    help="(Inspire) Rebuilds indexes in new indexes and swaps their aliases to them.",
+)
+@click.option("--yes-i-know", is_flag=True)
+@click.option(
+    "--index",
+    "-i",
+    "indexes",
+    multiple=True,
+    default=None,
+    help="Specify indexes which you want to rebuild (ignore prefix and postfix)",
+)
+@click.option(
+    "-q",
+    "--queue-name",
+    default="indexer_task",
+    help="RabbitMQ queue used for sending indexing tasks.",
+    show_default=True,
+)
+@click.option(
+    "-bs",
+    "--batch-size",
+    default=200,
+    help="The number of documents per batch that will be indexed by workers.",
+    show_default=True,
+)
+@click.option(
+    "-dbs",
+    "--db-batch-size",
+    default=2000,
+    help="The size of the chunk of records loaded from the DB.",
+    show_default=True,
+)
+@click.option(
+    "-ri",
+    "--report-interval",
+    default=30,
+    help="The number of seconds between progress reports.",
+    show_default=True,
+)
+@click.option(
+    "--delete-old-indexes",
+    is_flag=True,
+    help="Delete the old indexes once the aliases point to the new ones.",
+)
+@with_appcontext
+@click.pass_context
+def rebuild_indexes(
+    ctx,
+    yes_i_know,
+    indexes,
+    queue_name,
+    batch_size,
+    db_batch_size,
+    report_interval,
+    delete_old_indexes,
+):
+    """(Inspire) Rebuild indexes without downtime.
+
+    For every index, a new index is created from the current mappings and all
+    the records are bulk indexed into it by the workers, with refresh and
+    replicas disabled. Then its settings are restored and all the aliases of
+    the old index are atomically moved to it, so searches use the old index
+    until the new one is complete.
+
+    Example:
+
+        >>> inspirehep index rebuild -i records-hep -i records-authors
+    """
+    if not yes_i_know:
+        click.confirm(
+            "This operation will replace the selected indexes in ES, do you want to continue?",
+            abort=True,
+        )
+    wrong_indexes = list(set(indexes) - set(current_search.mappings.keys()))
+    if not indexes or wrong_indexes:
+        click.echo("You should specify indexes which you want to rebuild")
+        click.echo(
+            f"Available indexes are: {', '.join(current_search.mappings.keys())}"
+        )
+        ctx.exit(1)
+
+    for index_name in indexes:
+        if not _rebuild_index(
+            index_name,
+            queue_name,
+            batch_size,
+            db_batch_size,
+            report_interval,
+            delete_old_indexes,
+        ):
+            ctx.exit(1)
+
+
 @index.command(
     "create-aliases",
     help="Creates aliases without prefix for indexes if prefix was set",
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+"""Coalescing of the indexing of records which are committed many times.
+
+Instead of sending an ``index_record`` task for every commit, the UUID of the
+record is added to a set of pending records in redis, together with the first
+and last committed versions, and ``flush_coalesced_index_records`` indexes all
+the pending records periodically with one bulk request. The records of a flush
+are kept in redis until their indexing is scheduled, so the records of an
+interrupted flush are taken again by the next one.
+"""
+
+import structlog
+from flask import current_app
+from prometheus_client import Counter
+
+from inspirehep.utils import get_redis
+
+LOGGER = structlog.getLogger()
+
+COALESCED_FIRST_VERSIONS_KEY = "indexer:coalesced:first_versions"
+COALESCED_LAST_VERSIONS_KEY = "indexer:coalesced:last_versions"
+COALESCED_COMMITS_KEY = "indexer:coalesced:commits"
+# the pending records taken by a flush, by key of the pending records
+COALESCED_PROCESSING_KEYS = {
+    COALESCED_FIRST_VERSIONS_KEY: "indexer:coalesced:processing:first_versions",
+    COALESCED_LAST_VERSIONS_KEY: "indexer:coalesced:processing:last_versions",
+    COALESCED_COMMITS_KEY: "indexer:coalesced:processing:commits",
+}
+
+indexer_coalesced_commits = Counter(
+    "indexer_coalesced_commits",
+    "How many commits of records were queued for coalesced indexing.",
+)
+indexer_coalesced_saved_operations = Counter(
+    "indexer_coalesced_saved_operations",
+    "How many index operations were saved by coalescing commits of records.",
+)
+
+
+def is_coalescing_enabled():
+    return current_app.config.get("FEATURE_FLAG_ENABLE_INDEXER_COALESCING", False)
+
+
+def add_record_to_coalesced_index(uuid, record_version):
+    """Queue the record to be indexed by the next flush.
+
+    Args:
+        uuid (str): UUID of the record.
+        record_version (int): committed version of the record.
+    """
+    uuid = str(uuid)
+    with get_redis().pipeline() as pipeline:
+        pipeline.hsetnx(COALESCED_FIRST_VERSIONS_KEY, uuid, record_version)
+        pipeline.hset(COALESCED_LAST_VERSIONS_KEY, uuid, record_version)
+        pipeline.hincrby(COALESCED_COMMITS_KEY, uuid, 1)
+        pipeline.execute()
+    indexer_coalesced_commits.inc()
+
+
+def take_coalesced_records():
+    """Atomically take all the pending records out of the queue.
+
+    The records are moved to the records being processed, until they are
+    removed by ``remove_processed_coalesced_records``. If records of a previous
+    flush are still there, they are taken instead, and the pending records are
+    left for the next flush.
+
+    Returns:
+        dict: the first and last committed versions and the number of commits
+            of every record, by UUID.
+    """
+    with get_redis().pipeline(transaction=True) as pipeline:
+        for key, processing_key in COALESCED_PROCESSING_KEYS.items():
+            pipeline.renamenx(key, processing_key)
+        for processing_key in COALESCED_PROCESSING_KEYS.values():
+            pipeline.hgetall(processing_key)
+        # renaming fails when there are no pending records
+        results = pipeline.execute(raise_on_error=False)
+    first_versions, last_versions, commits = results[len(COALESCED_PROCESSING_KEYS) :]
+
+    return {
+        uuid: {
+            "first_version": int(first_version),
+            "last_version": int(last_versions.get(uuid, first_version)),
+            "commits": int(commits.get(uuid, 1)),
+        }
+        for uuid, first_version in first_versions.items()
+    }
+
+
+def remove_processed_coalesced_records():
+    """Remove the records taken by ``take_coalesced_records``, once processed."""
+    get_redis().delete(*COALESCED_PROCESSING_KEYS.values())
@@ -18,13 +18,28 @@ from sqlalchemy.exc import (
 )
 from sqlalchemy.orm.exc import NoResultFound, StaleDataError
 
-from inspirehep.indexer.api import get_references_to_update
+from inspirehep.indexer.api import (
+    add_pending_references,
+    get_references_to_update,
+    remove_pending_references,
+)
 from inspirehep.indexer.base import (
     InspireRecordIndexer,
     LiteratureRecordFulltextIndexer,
 )
+from inspirehep.indexer.coalescing import (
+    indexer_coalesced_saved_operations,
+    remove_processed_coalesced_records,
+    take_coalesced_records,
+)
+from inspirehep.matcher.cache import (
+    REFERENCE_MATCH_TARGETS_PID_TYPES,
+    invalidate_reference_matches_cache,
+    is_reference_match_target_deleted,
+)
+from inspirehep.matcher.tasks import invalidate_reference_matches
 from inspirehep.records.api import InspireRecord
-from inspirehep.utils import setup_celery_task_signals
+from inspirehep.utils import chunker, setup_celery_task_signals
 
 LOGGER = structlog.getLogger()
 
@@ -44,19 +59,61 @@ CELERY_INDEX_RECORD_RETRY_ON_EXCEPTIONS = (
 
 
 @shared_task(ignore_result=False, bind=True)
-def batch_index(self, records_uuids, request_timeout=None):
+def batch_index(self, records_uuids, request_timeout=None, index=None):
     """Process all provided references and index them in bulk.
     Be sure that uuids are not duplicated in batch.
     Args:
         records_uuids (list): list of uuids to process. All duplicates will be removed.
         request_timeout: Timeout in which ES should respond. Otherwise break.
+        index (str): index to write to instead of the one of the records.
 
     Returns:
         dict: dict with success count and failure list
                 (with uuids of failed records)
     """
     LOGGER.info(f"Starting task `batch_index for {len(records_uuids)} records")
-    return InspireRecordIndexer().bulk_index(records_uuids, request_timeout)
+    return InspireRecordIndexer().bulk_index(
+        records_uuids, request_timeout, index=index
+    )
+
+
+@shared_task(ignore_result=False, bind=True, acks_late=True)
+def batch_index_references(self, records_uuids):
+    """Index in bulk records whose references changed.
+
+    Args:
+        records_uuids (list): list of uuids to process.
+
+    Returns:
+        dict: dict with success count and failure list
+                (with uuids of failed records)
+    """
+    # removed before indexing, so changes made meanwhile are scheduled again
+    remove_pending_references(records_uuids)
+    LOGGER.info(
+        f"Starting task `batch_index_references` for {len(records_uuids)} records"
+    )
+    return InspireRecordIndexer().bulk_index(records_uuids)
+
+
+def schedule_references_indexing(records_uuids):
+    """Send the records to reindex to the references queue, in chunks.
+
+    Records which are already waiting to be reindexed are skipped, so one
+    edit of e.g. a popular author's name can't stall the indexer queue.
+    """
+    uuids_to_schedule = add_pending_references(sorted(records_uuids))
+    LOGGER.info(
+        "Scheduling references indexing",
+        number_of_records=len(records_uuids),
+        number_of_scheduled=len(uuids_to_schedule),
+    )
+    for uuids in chunker(
+        uuids_to_schedule, current_app.config["INDEXER_REFERENCES_BATCH_SIZE"]
+    ):
+        batch_index_references.apply_async(
+            args=(uuids,), queue=current_app.config["INDEXER_REFERENCES_QUEUE"]
+        )
 
 
 @shared_task(
@@ -86,10 +143,71 @@ def index_record(self, uuid, record_version=None, force_delete=None):
     InspireRecordIndexer().index(
         record, record_version=record_version, force_delete=force_delete
     )
+    if is_reference_match_target_deleted(record) or (
+        force_delete and record.pid_type in REFERENCE_MATCH_TARGETS_PID_TYPES
+    ):
+        invalidate_reference_matches_cache()
     uuids_to_reindex = get_references_to_update(record)
 
     if uuids_to_reindex:
-        batch_index(list(uuids_to_reindex))
+        schedule_references_indexing(uuids_to_reindex)
+
+
+@shared_task(ignore_result=True, bind=True)
+def flush_coalesced_index_records(self):
+    """Index all the records committed since the last flush.
+
+    Every record is indexed once, whatever the number of its commits. The
+    references to update are computed for every committed version, as
+    ``index_record`` would do for every commit, so no change is missed. The
+    records are removed from redis once their indexing is scheduled.
+    """
+    pending_records = take_coalesced_records()
+    if not pending_records:
+        return
+
+    uuids_to_reindex = set()
+    failed_uuids = set()
+    # records whose deletion or merge invalidates the cached matches of references
+    deleted_match_targets = set()
+    for uuid, versions in pending_records.items():
+        try:
+            for version in range(
+                versions["first_version"], versions["last_version"] + 1
+            ):
+                record = InspireRecord.get_record(
+                    uuid, with_deleted=True, record_version=version
+                )
+                uuids_to_reindex |= get_references_to_update(record)
+                if is_reference_match_target_deleted(record):
+                    deleted_match_targets.add(uuid)
+        except CELERY_INDEX_RECORD_RETRY_ON_EXCEPTIONS:
+            LOGGER.exception("Cannot coalesce record indexing", uuid=uuid)
+            failed_uuids.add(uuid)
+            index_record.delay(uuid, record_version=versions["last_version"])
+
+    commits_count = sum(versions["commits"] for versions in pending_records.values())
+    saved_operations = commits_count - len(pending_records)
+    indexer_coalesced_saved_operations.inc(saved_operations)
+    LOGGER.info(
+        "Indexing coalesced records",
+        records=len(pending_records),
+        commits=commits_count,
+        saved_operations=saved_operations,
+        uuids_to_reindex=len(uuids_to_reindex),
+    )
+    batch_size = current_app.config["INDEXER_BULK_DB_BATCH_SIZE"]
+    for uuids in chunker(
+        sorted(set(pending_records) - failed_uuids - deleted_match_targets),
+        batch_size,
+    ):
+        batch_index.delay(uuids)
+    # the cached matches are invalidated once the deletions are indexed
+    for uuids in chunker(sorted(deleted_match_targets - failed_uuids), batch_size):
+        batch_index.apply_async(args=(uuids,), link=invalidate_reference_matches.si())
+    if uuids_to_reindex:
+        schedule_references_indexing(uuids_to_reindex)
+    remove_processed_coalesced_records()
 
 
 @shared_task(
@@ -112,12 +230,15 @@ def index_fulltext(self, record_id, record_version):
 
 
 @shared_task(ignore_result=False, bind=True)
-def batch_index_literature_fulltext(self, records_uuids, request_timeout=None):
+def batch_index_literature_fulltext(
+    self, records_uuids, request_timeout=None, index=None
+):
     """Process all provided references and index them in bulk.
     Be sure that uuids are not duplicated in batch.
     Args:
         records_uuids (list): list of uuids to process. All duplicates will be removed.
         request_timeout: Timeout in which ES should respond. Otherwise break.
+        index (str): index to write to instead of the one of the records.
 
     Returns:
         dict: dict with success count and failure list
@@ -133,4 +254,5 @@ def batch_index_literature_fulltext(self, records_uuids, request_timeout=None):
     return LiteratureRecordFulltextIndexer().bulk_index(
         records_uuids,
         max_chunk_bytes=current_app.config.get("ES_FULLTEXT_MAX_BULK_CHUNK_SIZE"),
+        index=index,
     )
@@ -6,13 +6,23 @@
 # the terms of the MIT License; see LICENSE file for more details.
 
 import requests
+from elasticsearch import TransportError
 from flask import current_app
 from inspire_dojson.utils import get_recid_from_ref, get_record_ref
 from inspire_matcher import match
+from inspire_matcher.core import compile as compile_match_query
 from inspire_utils.dedupers import dedupe_list
+from inspire_utils.helpers import force_list
 from inspire_utils.record import get_value
+from invenio_search import current_search_client as es
+from invenio_search.utils import prefix_index
+from werkzeug.utils import import_string
 
+from inspirehep.utils import chunker
+
+from .cache import get_cached_reference_matches
 from .parsers import GrobidReferenceParser
+from .utils import get_literature_recids_by_pids
 
 
 def get_reference_from_grobid(query):
@@ -181,6 +191,253 @@ def match_reference_control_numbers_with_relaxed_journal_titles(reference):
     return matches
 
 
+def _get_match_validator(validator):
+    if callable(validator):
+        return validator
+    try:
+        return import_string(validator)
+    except (KeyError, ImportError):
+        return import_string("inspire_matcher.validators:default_validator")
+
+
+def _get_match_searches(reference, config):
+    """Compile the ES searches that ``inspire_matcher.match`` sends for a config.
+
+    Returns:
+        list: ``(validator, index, body)`` of every search.
+    """
+    index = prefix_index(config["index"])
+    searches = []
+    for step in config["algorithm"]:
+        validator = _get_match_validator(step.get("validator"))
+        for query in step["queries"]:
+            body = compile_match_query(
+                query,
+                reference,
+                collections=config.get("collections"),
+                match_deleted=config.get("match_deleted", False),
+            )
+            if not body:
+                continue
+            body["size"] = config.get("size", 10)
+            if config.get("source"):
+                body["_source"] = config["source"]
+            searches.append((validator, index, body))
+    return searches
+
+
+def _multi_search(searches):
+    """Send the searches with ``_msearch`` requests.
+
+    Args:
+        searches (list): ``(index, body)`` of the searches.
+    Returns:
+        list: the hits of every search.
+    """
+    hits = []
+    max_size = current_app.config["REFERENCE_MATCHER_MSEARCH_MAX_SIZE"]
+    for chunk in chunker(searches, max_size):
+        body = []
+        for index, search_body in chunk:
+            body.extend([{"index": index}, search_body])
+        for response in es.msearch(body=body)["responses"]:
+            if "error" in response:
+                raise TransportError(
+                    response.get("status", "N/A"),
+                    get_value(response, "error.type"),
+                    response["error"],
+                )
+            hits.append(response["hits"]["hits"])
+    return hits
+
+
+def _cast_publication_info_year(reference, cast):
+    # XXX: avoid this type casting.
+    try:
+        reference["reference"]["publication_info"]["year"] = cast(
+            reference["reference"]["publication_info"]["year"]
+        )
+    except KeyError:
+        pass
+
+
+def _get_reference_pids(reference):
+    pids = {
+        ("arxiv", arxiv_eprint)
+        for arxiv_eprint in force_list(get_value(reference, "reference.arxiv_eprint"))
+    }
+    pids.update(
+        ("doi", doi.lower()) for doi in get_value(reference, "reference.dois", [])
+    )
+    return pids
+
+
+def _get_unique_identifiers_matches_from_pidstore(references):
+    """Match the unique identifiers of the references with the pidstore.
+
+    arXiv eprints and DOIs are minted as pids, so they are matched with a single
+    DB query instead of ``REFERENCE_MATCHER_UNIQUE_IDENTIFIERS_CONFIG`` searches.
+    ISBNs are not minted, the references having them are left to ES.
+
+    Returns:
+        dict: the matched recids of the references, by their position.
+    """
+    pids_by_position = {
+        position: _get_reference_pids(reference)
+        for position, reference in enumerate(references)
+        if not get_value(reference, "reference.isbn")
+    }
+    recids_by_pid = get_literature_recids_by_pids(
+        set().union(*pids_by_position.values())
+    )
+    return {
+        position: [recid for pid in pids for recid in recids_by_pid.get(pid, [])]
+        for position, pids in pids_by_position.items()
+    }
+
+
+def _get_matched_recids_by_config(references):
+    """Get the matches of the references for their configs, in batches.
+
+    The searches of every reference for a config are sent together with
+    ``_msearch``. A reference gets the searches of its next config only when
+    it didn't match exactly one record, as otherwise ``match_reference`` would
+    stop there. With ``REFERENCE_MATCHER_UNIQUE_IDENTIFIERS_FROM_PIDSTORE`` the
+    unique identifiers are matched with the pidstore instead.
+
+    Returns:
+        list: for every reference, the list of matched recids of each config
+        searched.
+    """
+    configs = [match_reference_config(reference) for reference in references]
+    matched_recids = [[] for _ in references]
+
+    def needs_next_config(position):
+        return len(dedupe_list(matched_recids[position][-1])) != 1 and len(
+            matched_recids[position]
+        ) < len(configs[position])
+
+    pending = list(range(len(references)))
+    if current_app.config["REFERENCE_MATCHER_UNIQUE_IDENTIFIERS_FROM_PIDSTORE"]:
+        matches = _get_unique_identifiers_matches_from_pidstore(references)
+        for position, recids in matches.items():
+            matched_recids[position].append(recids)
+        pending = [
+            position
+            for position in pending
+            if position not in matches or needs_next_config(position)
+        ]
+    while pending:
+        searches = []
+        for position in pending:
+            config = configs[position][len(matched_recids[position])]
+            matched_recids[position].append([])
+            searches.extend(
+                (position, validator, index, body)
+                for validator, index, body in _get_match_searches(
+                    references[position], config
+                )
+            )
+        hits = _multi_search([(index, body) for _, _, index, body in searches])
+        for (position, validator, _, _), search_hits in zip(searches, hits):
+            matched_recids[position][-1].extend(
+                hit["_source"]["control_number"]
+                for hit in search_hits
+                if validator(references[position], hit)
+            )
+        pending = [position for position in pending if needs_next_config(position)]
+    return matched_recids
+
+
+def _add_match_from_matched_recids(
+    reference, configs, matched_recids_by_config, previous_matched_recid
+):
+    """Add the match to the reference, as ``match_reference`` does."""
+    for config, matched_recids in zip(configs, matched_recids_by_config):
+        matched_recids = dedupe_list(matched_recids)
+        if len(matched_recids) == 1:
+            _add_match_to_reference(reference, matched_recids[0], config["index"])
+        elif previous_matched_recid in matched_recids:
+            _add_match_to_reference(reference, previous_matched_recid, config["index"])
+        if "record" in reference:
+            return
+
+
+def match_references_batch(references_lists, use_cache=True):
+    """Match the references of several records with batched searches.
+
+    The results are the same as calling ``match_references`` for every list,
+    but the ES searches of all the references are sent together, config by
+    config, instead of one by one. With ``FEATURE_FLAG_ENABLE_REFERENCE_MATCHES_CACHE``
+    the matches of references already matched are taken from the cache.
+
+    Args:
+        references_lists (list): the lists of references, of each record.
+        use_cache (bool): whether to take the matches from the cache.
+    Returns:
+        list: the match result of every list of references.
+    """
+    current_record_refs = [
+        [get_value(reference, "record.$ref") for reference in references]
+        for references in references_lists
+    ]
+    references_to_match = []
+    for references in references_lists:
+        for reference in references:
+            if reference.get("curated_relation"):
+                continue
+            reference.pop("record", None)
+            _cast_publication_info_year(reference, str)
+            references_to_match.append(reference)
+
+    if use_cache:
+        matches = get_cached_reference_matches(
+            references_to_match, _get_matched_recids_by_config
+        )
+    else:
+        matches = _get_matched_recids_by_config(references_to_match)
+    matches = iter(matches)
+    results = []
+    for references, record_refs in zip(references_lists, current_record_refs):
+        matched_references, previous_matched_recid = [], None
+        any_link_modified = False
+        added_recids = []
+        removed_recids = []
+        for reference, current_record_ref in zip(references, record_refs):
+            if not reference.get("curated_relation"):
+                _add_match_from_matched_recids(
+                    reference,
+                    match_reference_config(reference),
+                    next(matches),
+                    previous_matched_recid,
+                )
+                _cast_publication_info_year(reference, int)
+            new_record_ref = get_value(reference, "record.$ref")
+
+            if current_record_ref != new_record_ref:
+                any_link_modified = True
+                if current_record_ref:
+                    removed_recids.append(
+                        get_recid_from_ref({"$ref": current_record_ref})
+                    )
+                if new_record_ref:
+                    added_recids.append(get_recid_from_ref({"$ref": new_record_ref}))
+
+            matched_references.append(reference)
+            if "record" in reference:
+                previous_matched_recid = get_recid_from_ref(reference["record"])
+
+        results.append(
+            {
+                "matched_references": matched_references,
+                "any_link_modified": any_link_modified,
+                "added_recids": added_recids,
+                "removed_recids": removed_recids,
+            }
+        )
+    return results
+
+
 def match_references(references):
     """Match references to their respective records in INSPIRE.
     Args:
@@ -188,29 +445,4 @@ def match_references(references):
     Returns:
         dict: the match result
     """
-    matched_references, previous_matched_recid = [], None
-    any_link_modified = False
-    added_recids = []
-    removed_recids = []
-    for reference in references:
-        current_record_ref = get_value(reference, "record.$ref")
-        reference = match_reference(reference, previous_matched_recid)
-        new_record_ref = get_value(reference, "record.$ref")
-
-        if current_record_ref != new_record_ref:
-            any_link_modified = True
-            if current_record_ref:
-                removed_recids.append(get_recid_from_ref({"$ref": current_record_ref}))
-            if new_record_ref:
-                added_recids.append(get_recid_from_ref({"$ref": new_record_ref}))
-
-        matched_references.append(reference)
-        if "record" in reference:
-            previous_matched_recid = get_recid_from_ref(reference["record"])
-
-    return {
-        "matched_references": matched_references,
-        "any_link_modified": any_link_modified,
-        "added_recids": added_recids,
-        "removed_recids": removed_recids,
-    }
+    return match_references_batch([references])[0]
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2020 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+"""Caches of the reference matcher.
+
+Matches of references
+---------------------
+
+The matches are cached by the hash of the reference metadata, so the popular
+references cited by many records are matched once. The cached matches are the
+recids found by every config, before applying the previous matched reference
+rule, which depends on the list of references. A generation number, part of the
+cache keys, is increased when a literature or data record is deleted, merged
+(merged records are deleted) or restored, so all the cached matches are
+invalidated at once. The matches of new records or identifiers are found once
+the cached matches expire after ``REFERENCE_MATCHER_CACHE_TIMEOUT``, or with
+``inspirehep match references --since``, which doesn't read the cache. The
+cache is shared by all the matcher workers.
+
+Journal KB
+----------
+The journal KB given to refextract is built from all the journal records, it
+is cached in redis and in every process by a random version, which is
+replaced on every change of a journal record and expires after
+``REFERENCE_MATCHER_JOURNAL_KB_CACHE_TIMEOUT``.
+"""
+
+import hashlib
+import uuid
+
+import orjson
+import structlog
+from flask import current_app
+from prometheus_client import Counter
+from redis import RedisError
+
+from inspirehep.utils import get_redis
+
+from .utils import create_journal_dict
+
+LOGGER = structlog.getLogger()
+
+GENERATION_KEY = "matcher:references:generation"
+# pid types of the records searched by the reference matcher
+REFERENCE_MATCH_TARGETS_PID_TYPES = {"lit", "dat"}
+JOURNAL_KB_VERSION_KEY = "matcher:journal_kb:version"
+
+# (version, journal KB) of this process
+_journal_kb = (None, None)
+
+reference_matches_cache_requests = Counter(
+    "reference_matches_cache_requests",
+    "References matched in batches, by cache hit or miss.",
+    ["result"],
+)
+
+
+def is_reference_matches_cache_enabled():
+    return current_app.config.get("FEATURE_FLAG_ENABLE_REFERENCE_MATCHES_CACHE", False)
+
+
+def _get_matches_key(generation, reference):
+    reference_hash = hashlib.sha1(
+        orjson.dumps(reference.get("reference", {}), option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    return f"matcher:references:{generation}:{reference_hash}"
+
+
+def get_cached_reference_matches(references, match):
+    """Return the matches of the references, from the cache if possible.
+
+    The references with the same metadata are matched once.
+
+    Args:
+        references (list): the references to match.
+        match (callable): returns the matches of a list of references.
+
+    Returns:
+        list: the matches of every reference.
+    """
+    if not is_reference_matches_cache_enabled() or not references:
+        return match(references)
+    try:
+        redis = get_redis()
+        generation = int(redis.get(GENERATION_KEY) or 0)
+        keys = [_get_matches_key(generation, reference) for reference in references]
+        cached_matches = redis.mget(keys)
+    except RedisError:
+        LOGGER.exception("Cannot read reference matches cache")
+        return match(references)
+
+    matches_by_key = {
+        key: orjson.loads(matches)
+        for key, matches in zip(keys, cached_matches)
+        if matches is not None
+    }
+    references_by_key = {}
+    for key, reference in zip(keys, references):
+        if key not in matches_by_key:
+            references_by_key.setdefault(key, reference)
+    hits = sum(1 for key in keys if key in matches_by_key)
+    reference_matches_cache_requests.labels(result="hit").inc(hits)
+    reference_matches_cache_requests.labels(result="miss").inc(len(keys) - hits)
+
+    if not references_by_key:
+        return [matches_by_key[key] for key in keys]
+
+    new_matches = match(list(references_by_key.values()))
+    matches_by_key.update(zip(references_by_key, new_matches))
+    try:
+        with redis.pipeline() as pipeline:
+            for key, matches in zip(references_by_key, new_matches):
+                pipeline.set(
+                    key,
+                    orjson.dumps(matches),
+                    ex=current_app.config["REFERENCE_MATCHER_CACHE_TIMEOUT"],
+                )
+            pipeline.execute()
+    except RedisError:
+        LOGGER.exception("Cannot write reference matches cache")
+    return [matches_by_key[key] for key in keys]
+
+
+def is_reference_match_target_deleted(record):
+    """Whether the last change of the record deleted or merged it, or restored it.
+
+    Only these changes invalidate the cached matches.
+    """
+    if (
+        not is_reference_matches_cache_enabled()
+        or record.pid_type not in REFERENCE_MATCH_TARGETS_PID_TYPES
+    ):
+        return False
+    return record.have_fields_changed(["deleted"])
+
+
+def invalidate_reference_matches_cache():
+    """Invalidate all the cached matches, after a deletion or merge of a record."""
+    if not is_reference_matches_cache_enabled():
+        return
+    try:
+        get_redis().incr(GENERATION_KEY)
+    except RedisError:
+        LOGGER.exception("Cannot invalidate reference matches cache")
+
+
+def _get_journal_kb_key(version):
+    return f"matcher:journal_kb:{version}"
+
+
+def get_cached_journal_dict():
+    """Return the journal KB of ``create_journal_dict``, from the cache if possible."""
+    global _journal_kb
+    timeout = current_app.config["REFERENCE_MATCHER_JOURNAL_KB_CACHE_TIMEOUT"]
+    try:
+        redis = get_redis()
+        version = redis.get(JOURNAL_KB_VERSION_KEY)
+        if version is None:
+            redis.set(JOURNAL_KB_VERSION_KEY, uuid.uuid4().hex, ex=timeout, nx=True)
+            version = redis.get(JOURNAL_KB_VERSION_KEY)
+        cached_version, journal_kb = _journal_kb
+        if cached_version == version:
+            return journal_kb
+        cached_journal_kb = redis.get(_get_journal_kb_key(version))
+    except RedisError:
+        LOGGER.exception("Cannot read journal KB cache")
+        return create_journal_dict()
+
+    if cached_journal_kb:
+        journal_kb = orjson.loads(cached_journal_kb)
+    else:
+        journal_kb = create_journal_dict()
+        try:
+            redis.set(
+                _get_journal_kb_key(version), orjson.dumps(journal_kb), ex=timeout
+            )
+        except RedisError:
+            LOGGER.exception("Cannot write journal KB cache", version=version)
+    _journal_kb = (version, journal_kb)
+    return journal_kb
+
+
+def invalidate_journal_dict_cache():
+    """Invalidate the cached journal KB, of all the processes."""
+    try:
+        get_redis().set(
+            JOURNAL_KB_VERSION_KEY,
+            uuid.uuid4().hex,
+            ex=current_app.config["REFERENCE_MATCHER_JOURNAL_KB_CACHE_TIMEOUT"],
+        )
+    except RedisError:
+        LOGGER.exception("Cannot invalidate journal KB cache")
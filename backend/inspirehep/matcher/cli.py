@@ -5,14 +5,26 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more detail
 
+from copy import deepcopy
+from datetime import datetime
+from time import monotonic
+
 import click
 import structlog
 from celery import group
+from elasticsearch_dsl import Q
+from flask import current_app
 from flask.cli import with_appcontext
+from inspire_dojson.utils import get_recid_from_ref
+from inspire_utils.record import get_value
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.models import RecordMetadata
 
+from inspirehep.records.api import LiteratureRecord
+from inspirehep.search.api import LiteratureSearch
 from inspirehep.utils import chunker
 
+from .api import match_reference, match_references_batch
 from .tasks import match_references_by_uuids
 
 LOGGER = structlog.getLogger()
@@ -38,20 +50,261 @@ def match():
     help="The size of the chunk of records loaded from the DB, aka yield_per argument",
     show_default=True,
 )
+@click.option(
+    "-s",
+    "--since",
+    help="Match only the references of the records which could cite the literature "
+    "and data records created or updated since the given date (YYYY-MM-DD), "
+    "instead of all the records.",
+)
 @with_appcontext
-def references(batch_size, db_batch_size):
-    literature_uuids_query = PersistentIdentifier.query.filter(
-        PersistentIdentifier.pid_type == "lit",
-        PersistentIdentifier.status == PIDStatus.REGISTERED,
-    ).with_entities(PersistentIdentifier.object_uuid)
+def references(batch_size, db_batch_size, since):
+    if since:
+        try:
+            since = datetime.strptime(since, "%Y-%m-%d")
+        except ValueError:
+            raise click.BadParameter("Date should be in format YYYY-MM-DD.")
+        literature_uuids = _get_uuids_of_records_citing_records_since(
+            since, db_batch_size
+        )
+    else:
+        literature_uuids_query = PersistentIdentifier.query.filter(
+            PersistentIdentifier.pid_type == "lit",
+            PersistentIdentifier.status == PIDStatus.REGISTERED,
+        ).with_entities(PersistentIdentifier.object_uuid)
+        literature_uuids = (
+            uuid for (uuid,) in literature_uuids_query.yield_per(db_batch_size)
+        )
 
     matcher_tasks = []
-    result_chunks = chunker(literature_uuids_query.yield_per(db_batch_size), batch_size)
-    for chunk in result_chunks:
-        serialized_uuids = [str(uuid) for (uuid,) in chunk]
-        matcher_task = match_references_by_uuids.s(serialized_uuids)
+    for chunk in chunker(literature_uuids, batch_size):
+        serialized_uuids = [str(uuid) for uuid in chunk]
+        # the cached matches can be older than the records created since
+        matcher_task = match_references_by_uuids.s(
+            serialized_uuids, use_cache=not since
+        )
         matcher_tasks.append(matcher_task)
 
     matcher_task_group = group(matcher_tasks)
     group_result = matcher_task_group()
     group_result.join()  # waits for all tasks to be finished
+
+
+def _get_citing_references_query(pid_type, record):
+    """Query the literature records whose references could match the record.
+
+    Only the identifiers are looked up, see ``_get_citing_publication_info``
+    for the publication info. The records already linking to a literature
+    record are excluded, as their reference to it is matched already.
+    """
+    dois = get_value(record, "dois.value", [])
+    queries = [
+        Q("term", **{"references.reference.dois.raw": doi.lower()}) for doi in dois
+    ]
+    if pid_type == "lit":
+        queries.extend(
+            Q("term", **{"references.reference.arxiv_eprint.raw": arxiv_eprint})
+            for arxiv_eprint in get_value(record, "arxiv_eprints.value", [])
+        )
+        queries.extend(
+            Q("term", **{"references.reference.isbn": isbn})
+            for isbn in get_value(record, "isbns.value", [])
+        )
+        queries.extend(
+            Q("match_phrase", **{"references.reference.report_numbers": report_number})
+            for report_number in get_value(record, "report_numbers.value", [])
+        )
+        queries.extend(
+            Q("term", **{"references.reference.texkey": texkey})
+            for texkey in record.get("texkeys", [])
+        )
+    if not queries:
+        return None
+    must_not = []
+    if pid_type == "lit":
+        must_not.append(
+            Q("match", **{"references.record.$ref": record["control_number"]})
+        )
+    return Q("bool", should=queries, minimum_should_match=1, must_not=must_not)
+
+
+def _get_publication_info_keys(publication_infos):
+    """Get the (journal title, volume, page) of every complete publication info."""
+    keys = set()
+    for publication_info in publication_infos:
+        journal_title = publication_info.get("journal_title")
+        journal_volume = publication_info.get("journal_volume")
+        pages = {publication_info.get("page_start"), publication_info.get("artid")}
+        for page in pages - {None}:
+            if journal_title and journal_volume:
+                keys.add((journal_title.lower(), str(journal_volume).lower(), page))
+    return keys
+
+
+def _get_citing_publication_info(records):
+    """Get the literature records with a reference to the publication info of records.
+
+    ``references`` isn't a nested field, so a query of the journal title,
+    volume and page of a reference also finds the records with these values in
+    different references. The records found are checked reference by reference,
+    and ``REFERENCE_MATCHER_INCREMENTAL_PUBLICATION_INFO_MAX_HITS`` bounds the
+    records checked by search.
+    """
+    recids_by_key = {}
+    for record in records:
+        for key in _get_publication_info_keys(record.get("publication_info", [])):
+            recids_by_key.setdefault(key, set()).add(record["control_number"])
+    if not recids_by_key:
+        return
+
+    path = "references.reference.publication_info"
+    queries = [
+        Q("match_phrase", **{f"{path}.journal_title": journal_title})
+        & Q("match_phrase", **{f"{path}.journal_volume": journal_volume})
+        & (
+            Q("term", **{f"{path}.page_start": page})
+            | Q("term", **{f"{path}.artid": page})
+        )
+        for journal_title, journal_volume, page in recids_by_key
+    ]
+    max_hits = current_app.config[
+        "REFERENCE_MATCHER_INCREMENTAL_PUBLICATION_INFO_MAX_HITS"
+    ]
+    search = (
+        LiteratureSearch()
+        .query(Q("bool", should=queries, minimum_should_match=1))
+        .source(["references.reference.publication_info", "references.record"])
+    )
+    for hits_count, hit in enumerate(search.scan(), 1):
+        if hits_count > max_hits:
+            LOGGER.warning(
+                "Too many records with references to the publication info",
+                max_hits=max_hits,
+            )
+            return
+        for reference in hit.to_dict().get("references", []):
+            publication_info = get_value(reference, "reference.publication_info")
+            if not publication_info:
+                continue
+            keys = _get_publication_info_keys([publication_info])
+            recids = set().union(*(recids_by_key.get(key, set()) for key in keys))
+            linked_recid = get_recid_from_ref(reference.get("record"))
+            if recids - {linked_recid}:
+                yield hit.meta.id
+                break
+
+
+def _get_uuids_of_records_citing_records_since(since, db_batch_size):
+    """Get the records which could cite the records created or updated since.
+
+    The references of the literature records are indexed with their
+    identifiers and publication info, so the records whose references could
+    match the new records are found with ES, chunk by chunk of new records.
+    """
+    records_query = (
+        RecordMetadata.query.join(
+            PersistentIdentifier,
+            PersistentIdentifier.object_uuid == RecordMetadata.id,
+        )
+        .filter(
+            PersistentIdentifier.pid_type.in_(["lit", "dat"]),
+            PersistentIdentifier.status == PIDStatus.REGISTERED,
+            RecordMetadata.updated >= since,
+        )
+        .with_entities(PersistentIdentifier.pid_type, RecordMetadata.json)
+    )
+    max_size = current_app.config["REFERENCE_MATCHER_INCREMENTAL_RECORDS_PER_QUERY"]
+    found_uuids = set()
+    for chunk in chunker(records_query.yield_per(db_batch_size), max_size):
+        chunk = [
+            (pid_type, record)
+            for pid_type, record in chunk
+            if not record.get("deleted")
+        ]
+        queries = [
+            _get_citing_references_query(pid_type, record) for pid_type, record in chunk
+        ]
+        queries = [query for query in queries if query]
+        uuids = []
+        if queries:
+            search = (
+                LiteratureSearch()
+                .query(Q("bool", should=queries, minimum_should_match=1))
+                .source(False)
+            )
+            uuids.extend(hit.meta.id for hit in search.scan())
+        uuids.extend(
+            _get_citing_publication_info(
+                [record for pid_type, record in chunk if pid_type == "lit"]
+            )
+        )
+        for uuid in uuids:
+            if uuid not in found_uuids:
+                found_uuids.add(uuid)
+                yield uuid
+
+
+def _match_references_one_by_one(references_lists):
+    matched_references_lists = []
+    for references in references_lists:
+        matched_references, previous_matched_recid = [], None
+        for reference in references:
+            reference = match_reference(reference, previous_matched_recid)
+            matched_references.append(reference)
+            if "record" in reference:
+                previous_matched_recid = get_recid_from_ref(reference["record"])
+        matched_references_lists.append(matched_references)
+    return matched_references_lists
+
+
+@match.command(
+    "benchmark", help="Compare matching references one by one and in batches."
+)
+@click.option(
+    "-r",
+    "--recid",
+    "recids",
+    multiple=True,
+    required=True,
+    help="Literature record with references.",
+)
+@click.option(
+    "-n", "--repeat", default=3, help="Runs of every matcher.", show_default=True
+)
+@with_appcontext
+def benchmark(recids, repeat):
+    references_lists = [
+        LiteratureRecord.get_record_by_pid_value(recid).get("references", [])
+        for recid in recids
+    ]
+    references_count = sum(len(references) for references in references_lists)
+
+    one_by_one_times, batch_times = [], []
+    for _ in range(repeat):
+        start_time = monotonic()
+        one_by_one = _match_references_one_by_one(deepcopy(references_lists))
+        one_by_one_times.append(monotonic() - start_time)
+
+        start_time = monotonic()
+        batch = match_references_batch(deepcopy(references_lists), use_cache=False)
+        batch_times.append(monotonic() - start_time)
+
+    for name, times in (("one by one", one_by_one_times), ("batch", batch_times)):
+        median_time = sorted(times)[len(times) // 2]
+        click.echo(
+            f"{name}: {references_count} references in {median_time:.2f}s, "
+            f"{references_count / median_time:.0f} references/s"
+        )
+
+    one_by_one_refs = [
+        get_value(reference, "record.$ref")
+        for references in one_by_one
+        for reference in references
+    ]
+    batch_refs = [
+        get_value(reference, "record.$ref")
+        for result in batch
+        for reference in result["matched_references"]
+    ]
+    if one_by_one_refs != batch_refs:
+        click.secho("The matched records differ!", fg="red")
@@ -8,6 +8,25 @@
 from .validators import authors_validator
 
 GROBID_URL = "https://grobid.inspirebeta.net"
+# Maximum number of searches sent in a single ``_msearch`` request when
+# matching references in batches
+REFERENCE_MATCHER_MSEARCH_MAX_SIZE = 200
+# Match the arXiv eprints and DOIs of references in batches with their pids,
+# without ES, as they are unique identifiers minted for every literature record
+REFERENCE_MATCHER_UNIQUE_IDENTIFIERS_FROM_PIDSTORE = True
+# Seconds for which the matches of references are cached, with
+# ``FEATURE_FLAG_ENABLE_REFERENCE_MATCHES_CACHE``
+REFERENCE_MATCHER_CACHE_TIMEOUT = 86400
+# Seconds for which the journal KB of refextract is cached, it is also rebuilt
+# when a journal record changes
+REFERENCE_MATCHER_JOURNAL_KB_CACHE_TIMEOUT = 86400
+# Number of new records whose citing references are searched with a single ES
+# query by ``inspirehep match references --since``
+REFERENCE_MATCHER_INCREMENTAL_RECORDS_PER_QUERY = 50
+# Maximum number of records checked for references to the publication info of
+# these new records, as the query of the publication info also finds records
+# with the journal, volume and page in different references
+REFERENCE_MATCHER_INCREMENTAL_PUBLICATION_INFO_MAX_HITS = 10000
 
 REFERENCE_MATCHER_UNIQUE_IDENTIFIERS_CONFIG = {
     "algorithm": [
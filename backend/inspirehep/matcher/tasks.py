@@ -18,7 +18,8 @@ from sqlalchemy.exc import InvalidRequestError, StatementError
 
 from inspirehep.records.api import LiteratureRecord
 
-from .api import match_references
+from .api import match_references_batch
+from .cache import invalidate_reference_matches_cache
 
 LOGGER = structlog.getLogger()
 
@@ -39,7 +40,7 @@ MAX_RETRY_COUNT = 3
         TransportError,
     ),
 )
-def match_references_by_uuids(literature_uuids):
+def match_references_by_uuids(literature_uuids, use_cache=True):
     record_json = type_coerce(RecordMetadata.json, JSONB)
     has_references = record_json.has_key("references")  # noqa: W601
     selected_uuids = RecordMetadata.id.in_(literature_uuids)
@@ -51,10 +52,12 @@ def match_references_by_uuids(literature_uuids):
         selected_uuids, has_references, not_deleted
     )
 
-    for record_metadata in with_references_query.all():
-        references = record_metadata.json["references"]
-        match_result = match_references(references)
-
+    records_metadata = with_references_query.all()
+    match_results = match_references_batch(
+        [record_metadata.json["references"] for record_metadata in records_metadata],
+        use_cache=use_cache,
+    )
+    for record_metadata, match_result in zip(records_metadata, match_results):
         if not match_result["any_link_modified"]:
             continue
 
@@ -74,3 +77,9 @@ def match_references_by_uuids(literature_uuids):
             removed_recids=removed_recids,
             removed_recid_count=len(removed_recids),
         )
+
+
+@shared_task(ignore_result=True)
+def invalidate_reference_matches():
+    """Invalidate the cached matches after deleted records were indexed."""
+    invalidate_reference_matches_cache()
@@ -11,9 +11,12 @@ from inspire_schemas.api import ReferenceBuilder
 from inspire_utils.dedupers import dedupe_list_of_dicts
 from inspire_utils.helpers import force_list
 from inspire_utils.record import get_value
+from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
 from invenio_records.models import RecordMetadata
-from sqlalchemy import cast, not_, type_coerce
+from sqlalchemy import and_, cast, not_, or_, type_coerce
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import aliased
 
 RE_PUNCTUATION = re.compile(r"[\.,;'\(\)-]", re.UNICODE)
 
@@ -123,3 +126,67 @@ def normalize_title(raw_title):
     normalized_title = normalized_title.upper()
 
     return normalized_title
+
+
+def get_literature_recids_by_pids(pids):
+    """Get the literature records having the given persistent identifiers.
+
+    The pids of the identifiers (e.g. ``arxiv`` and ``doi``) are kept up to date
+    by the minters, so this is an exact lookup that doesn't need ES.
+
+    Args:
+        pids (set): ``(pid_type, pid_value)`` of the identifiers, DOIs must be
+            lowercased as the ``DoiMinter`` does.
+    Returns:
+        dict: the recids of the records with each identifier, identifiers of
+        no record are missing.
+    """
+    if not pids:
+        return {}
+    values_by_pid_type = {}
+    for pid_type, pid_value in pids:
+        values_by_pid_type.setdefault(pid_type, set()).add(pid_value)
+
+    identifier_pid = aliased(PersistentIdentifier)
+    only_literature = type_coerce(RecordMetadata.json, JSONB)["_collections"].contains(
+        ["Literature"]
+    )
+    only_not_deleted = not_(
+        type_coerce(RecordMetadata.json, JSONB).has_key("deleted")  # noqa
+    ) | not_(  # noqa
+        type_coerce(RecordMetadata.json, JSONB)["deleted"] == cast(True, JSONB)
+    )
+    query = (
+        db.session.query(
+            identifier_pid.pid_type,
+            identifier_pid.pid_value,
+            PersistentIdentifier.pid_value,
+        )
+        .join(
+            PersistentIdentifier,
+            and_(
+                PersistentIdentifier.object_uuid == identifier_pid.object_uuid,
+                PersistentIdentifier.pid_type == "lit",
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+            ),
+        )
+        .join(RecordMetadata, RecordMetadata.id == identifier_pid.object_uuid)
+        .filter(
+            identifier_pid.status == PIDStatus.REGISTERED,
+            or_(
+                *[
+                    and_(
+                        identifier_pid.pid_type == pid_type,
+                        identifier_pid.pid_value.in_(pid_values),
+                    )
+                    for pid_type, pid_values in values_by_pid_type.items()
+                ]
+            ),
+            only_literature,
+            only_not_deleted,
+        )
+    )
+    recids_by_pid = {}
+    for pid_type, pid_value, recid in query:
+        recids_by_pid.setdefault((pid_type, pid_value), []).append(int(recid))
+    return recids_by_pid
@@ -35,6 +35,7 @@ from sqlalchemy.exc import InvalidRequestError, StatementError
 from inspirehep.hal.api import push_to_hal
 from inspirehep.indexer.api import get_references_to_update
 from inspirehep.indexer.tasks import batch_index
+from inspirehep.matcher.cache import invalidate_journal_dict_cache
 from inspirehep.migrator.models import LegacyRecordsMirror
 from inspirehep.migrator.utils import (
     cache_afs_file_locations,
@@ -310,6 +311,7 @@ def create_records_from_mirror_recids(self, recids):
     """
     models_committed.disconnect(index_after_commit)
     processed_records = set()
+    journals_migrated = False
     try:
         for recid in recids:
             LOGGER.info("Migrate record from mirror", recid=recid)
@@ -319,9 +321,12 @@ def create_records_from_mirror_recids(self, recids):
                 )
             if record:
                 processed_records.add(str(record.id))
+                journals_migrated = journals_migrated or record.pid_type == "jou"
             else:
                 LOGGER.warning("Record is empty", recid=recid)
         db.session.commit()
+        if journals_migrated:
+            invalidate_journal_dict_cache()
     except (InvalidRequestError, OperationalError, StatementError, ThreadsTimeoutError):
         LOGGER.exception(
             "Error during batch processing. Retrying.",
@@ -180,6 +180,19 @@ class InspireRecord(Record):
 
     @classmethod
     def get_records_batched(cls, ids, with_deleted=False, max_batch=100):
+        """Get records for the given uuids with one query per batch.
+
+        Every record is returned as an instance of its proper subclass, so
+        ``InspireRecord.get_records_batched`` can be used for mixed record types.
+
+        Args:
+            ids(list): UUIDs of the records to load.
+            with_deleted(bool): when set to True returns also deleted records
+            max_batch(int): maximum number of uuids used in one ``IN`` query.
+
+        Yields:
+            InspireRecord: loaded records (order is not preserved).
+        """
         for batch in chunker(ids, max_chunk_size=max_batch):
             query = cls.model_cls.query.filter(cls.model_cls.id.in_(batch))
             if not with_deleted:
@@ -188,7 +201,8 @@ class InspireRecord(Record):
                     | (cls.model_cls.json["deleted"] != cast("True", JSONB))
                 )
             for data in query.yield_per(100):
-                yield cls(data.json, model=data)
+                record_class = cls.get_class_for_record(data.json)
+                yield record_class(data.json, model=data)
 
     @classmethod
     def get_records_by_pids(cls, pids, max_batch=100):
@@ -570,7 +584,13 @@ class InspireRecord(Record):
             force_delete: set to True if record has to be deleted,
                 If not set, tries to determine automatically if record should be deleted
             delay: if True will start the index task async otherwise async.
+                With ``FEATURE_FLAG_ENABLE_INDEXER_COALESCING`` the record is
+                queued instead, to be indexed by the next coalesced flush.
         """
+        from inspirehep.indexer.coalescing import (
+            add_record_to_coalesced_index,
+            is_coalescing_enabled,
+        )
         from inspirehep.indexer.tasks import index_record
 
         arguments = {
@@ -585,6 +605,11 @@ class InspireRecord(Record):
             arguments=arguments,
         )
         if delay:
+            if not force_delete and is_coalescing_enabled():
+                add_record_to_coalesced_index(
+                    arguments["uuid"], arguments["record_version"]
+                )
+                return
             index_record.delay(**arguments)
             return
         index_record(**arguments)
@@ -612,6 +637,11 @@ class InspireRecord(Record):
 
         return type(self)(data=data)
 
+    def have_fields_changed(self, fields):
+        """Whether any of the fields changed from the previous version."""
+        previous_version = self._previous_version
+        return any(self.get(field) != previous_version.get(field) for field in fields)
+
     @property
     def _schema_type(self):
         return PidStoreBase.get_pid_type_from_schema(self["$schema"])
@@ -4,7 +4,9 @@
 #
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
+import base64
 import datetime
+import math
 import threading
 import uuid
 from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
@@ -15,6 +17,7 @@ import magic
 import orjson
 import requests
 import structlog
+from botocore.exceptions import ClientError
 from flask import current_app
 from hepcrawl.parsers import ArxivParser
 from hepcrawl.parsers.crossref import CrossrefParser
@@ -25,6 +28,8 @@ from inspire_schemas.builders import LiteratureBuilder
 from inspire_schemas.utils import is_arxiv, normalize_arxiv
 from inspire_utils.record import get_value
 from invenio_db import db
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from invenio_records.models import RecordMetadata
 from jsonschema import ValidationError
 from redis import StrictRedis
 
@@ -50,12 +55,14 @@ from inspirehep.records.marshmallow.literature import (
     LiteratureElasticSearchSchema,
     LiteratureFulltextElasticSearchSchema,
 )
+from inspirehep.records.marshmallow.utils import get_facet_author_name_for_author
 from inspirehep.records.utils import (
     download_file_from_url,
     get_authors_phonetic_blocks,
     get_literature_earliest_date,
     get_pid_for_pid,
     get_ref_from_pid,
+    reference_display_cache,
     remove_author_bai_from_id_list,
 )
 from inspirehep.search.api import LiteratureSearch
@@ -91,6 +98,13 @@ class LiteratureRecord(
     pid_type = "lit"
     pidstore_handler = PidStoreLiterature
     nested_record_fields = ["authors", "publication_info", "supervisors"]
+    # Facet names of the linked authors computed for a whole batch of records
+    # by ``prefetch_linked_authors_facet_names``, used instead of loading the
+    # author records of every paper.
+    _linked_authors_facet_names = None
+    # Fulltexts of the documents fetched for a whole batch of records by
+    # ``prefetch_documents_fulltexts``.
+    _documents_fulltexts = None
 
     @property
     def earliest_date(self):
@@ -99,6 +113,257 @@ class LiteratureRecord(
             date = self.created.strftime("%Y-%m-%d")
         return date
 
+    @staticmethod
+    def get_authors_facet_names(authors_records):
+        return {
+            author["control_number"]: get_facet_author_name_for_author(author)
+            for author in authors_records
+        }
+
+    @classmethod
+    def get_linked_authors_facet_names(cls, data):
+        """Return the facet names of the authors linked in ``authors.record``.
+
+        Args:
+            data (dict): literature data, prefetched facet names are used if
+                it's a record prepared with ``prefetch_linked_authors_facet_names``.
+        Returns:
+            dict: facet author names keyed by author control number.
+        """
+        facet_names = getattr(data, "_linked_authors_facet_names", None)
+        if facet_names is not None:
+            return facet_names
+        return cls.get_authors_facet_names(
+            InspireRecord.get_linked_records_from_dict_field(data, "authors.record")
+        )
+
+    @staticmethod
+    def prefetch_linked_authors_facet_names(records):
+        """Compute the facet names of the linked authors of all the records at once.
+
+        Every distinct author linked in the batch is loaded from the DB only
+        once, no matter how many of the records it signed.
+
+        Args:
+            records (list(LiteratureRecord)): records to compute the facet names for.
+        """
+        records_pids = {
+            record.id: record.get_linked_pids_from_field("authors.record")
+            for record in records
+        }
+        all_pids = {pid for pids in records_pids.values() for pid in pids}
+        facet_names = LiteratureRecord.get_authors_facet_names(
+            InspireRecord.get_records_by_pids(list(all_pids), max_batch=1000)
+        )
+        for record in records:
+            record._linked_authors_facet_names = {
+                int(pid_value): facet_names[int(pid_value)]
+                for _, pid_value in records_pids[record.id]
+                if int(pid_value) in facet_names
+            }
+
+    @staticmethod
+    def is_document_with_fulltext(document):
+        return (
+            not document.get("hidden")
+            and document.get("filename", "").endswith("pdf")
+            and document.get("fulltext")
+        ) or document.get("source") == "arxiv"
+
+    @classmethod
+    def get_documents_fulltexts(cls, data):
+        """Return the fulltext fields of the documents of the record.
+
+        Args:
+            data (dict): literature data, fulltexts are only fetched for the
+                documents which were not prefetched by ``prefetch_documents_fulltexts``.
+        Returns:
+            dict: fields to add to the documents keyed by document key, see
+            ``fetch_document_fulltext``.
+        """
+        fulltexts = getattr(data, "_documents_fulltexts", None) or {}
+        missing_documents = [
+            document
+            for document in data.get("documents", [])
+            if cls.is_document_with_fulltext(document)
+            and document.get("key") not in fulltexts
+        ]
+        if missing_documents:
+            fetched_fulltexts = cls.fetch_documents_fulltexts(
+                [{**data, "documents": missing_documents}]
+            )[0]
+            fulltexts = {**fulltexts, **fetched_fulltexts}
+        return fulltexts
+
+    @staticmethod
+    def prefetch_documents_fulltexts(records):
+        """Fetch the fulltexts of the documents of all the records concurrently.
+
+        Fetched files are kept until the records are serialized, so at most
+        ``FULLTEXT_INDEXER_MAX_PREFETCH_CHUNK_RATIO`` times
+        ``ES_FULLTEXT_MAX_BULK_CHUNK_SIZE`` encoded bytes are prefetched, the
+        remaining documents are fetched while serializing their record.
+
+        Args:
+            records (list(LiteratureRecord)): records to fetch the fulltexts for.
+        """
+        max_bytes = int(
+            current_app.config["ES_FULLTEXT_MAX_BULK_CHUNK_SIZE"]
+            * current_app.config["FULLTEXT_INDEXER_MAX_PREFETCH_CHUNK_RATIO"]
+        )
+        records_fulltexts = LiteratureRecord.fetch_documents_fulltexts(
+            records, max_bytes=max_bytes, raise_on_error=False
+        )
+        for record, record_fulltexts in zip(records, records_fulltexts):
+            record._documents_fulltexts = record_fulltexts
+
+    @staticmethod
+    def fetch_documents_fulltexts(records, max_bytes=None, raise_on_error=True):
+        """Fetch the fulltexts of the documents of the records with a thread pool.
+
+        Args:
+            records (list(dict)): literature data.
+            max_bytes (int): maximum size of the encoded files to fetch, the
+                documents over the limit are skipped.
+            raise_on_error (bool): if False documents which failed to be
+                fetched are logged and skipped.
+        Returns:
+            list(dict): for each record, the fields to add to its documents
+            keyed by document key.
+        """
+        app = current_app._get_current_object()
+        indexed_documents = LiteratureRecord.get_indexed_documents_with_fulltext(
+            records
+        )
+        lock = threading.Lock()
+        reserved_bytes = 0
+
+        def reserve_bytes(size):
+            nonlocal reserved_bytes
+            with lock:
+                if max_bytes is not None and reserved_bytes + size > max_bytes:
+                    return False
+                reserved_bytes += size
+                return True
+
+        def fetch(document, recid):
+            with app.app_context():
+                return LiteratureRecord.fetch_document_fulltext(
+                    document,
+                    recid,
+                    indexed_document=indexed_documents.get((recid, document["key"])),
+                    reserve_bytes=reserve_bytes,
+                )
+
+        records_fulltexts = [{} for _ in records]
+        with ThreadPoolExecutor(
+            max_workers=current_app.config["FULLTEXT_INDEXER_MAX_FETCH_THREADS"]
+        ) as executor:
+            tasks = {
+                executor.submit(fetch, document, record.get("control_number")): (
+                    record_fulltexts,
+                    document["key"],
+                )
+                for record, record_fulltexts in zip(records, records_fulltexts)
+                for document in record.get("documents", [])
+                if LiteratureRecord.is_document_with_fulltext(document)
+            }
+            for task in as_completed(tasks):
+                record_fulltexts, key = tasks[task]
+                try:
+                    fulltext = task.result()
+                except Exception:
+                    if raise_on_error:
+                        raise
+                    LOGGER.exception("Cannot fetch fulltext", key=key)
+                    continue
+                if fulltext is not None:
+                    record_fulltexts[key] = fulltext
+        return records_fulltexts
+
+    @staticmethod
+    def fetch_document_fulltext(
+        document, recid, indexed_document=None, reserve_bytes=None
+    ):
+        """Fetch the fulltext of a document from S3.
+
+        If the file didn't change since it was indexed (same ETag), it's not
+        downloaded and the attachment already extracted by ES is reused.
+
+        Args:
+            document (dict): the document.
+            recid (int): control number of the record of the document.
+            indexed_document (dict): the document as indexed in ES.
+            reserve_bytes (callable): called with the encoded size of the file
+                before reading it, the file is not read if it returns False.
+        Returns:
+            dict: the base64 encoded file as ``text`` or the ``attachment``, with
+            the ``_fulltext_etag`` of the file; ``{}`` if the document has no
+            fulltext and ``None`` if the file was not read.
+        """
+        key = document["key"]
+        bucket = current_s3_instance.get_bucket_for_file_key(key)
+        get_object_kwargs = {}
+        if indexed_document and "attachment" in indexed_document:
+            get_object_kwargs["IfNoneMatch"] = indexed_document["_fulltext_etag"]
+        try:
+            file_data = current_s3_instance.client.get_object(
+                Bucket=bucket, Key=key, **get_object_kwargs
+            )
+        except current_s3_instance.client.exceptions.NoSuchKey:
+            LOGGER.error(
+                "File was not found for the given url",
+                document_url=document["url"],
+                record_control_number=recid,
+            )
+            return {}
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "304":
+                raise
+            return {
+                "attachment": indexed_document["attachment"],
+                "_fulltext_etag": indexed_document["_fulltext_etag"],
+            }
+
+        body = file_data["Body"]
+        if file_data.get("ContentType", "") != "application/pdf":
+            body.close()
+            return {}
+        encoded_size = 4 * math.ceil(file_data["ContentLength"] / 3)
+        if reserve_bytes and not reserve_bytes(encoded_size):
+            body.close()
+            return None
+        return {
+            "text": base64.b64encode(body.read()).decode("ascii"),
+            "_fulltext_etag": file_data["ETag"],
+        }
+
+    @staticmethod
+    def get_indexed_documents_with_fulltext(records):
+        """Return the documents with fulltext of the records as indexed in ES.
+
+        Returns:
+            dict: documents keyed by record control number and document key.
+        """
+        uuids = [str(record.id) for record in records if getattr(record, "id", None)]
+        if not uuids:
+            return {}
+        indexed_records = LiteratureSearch().mget(
+            uuids,
+            _source_includes=[
+                "control_number",
+                "documents.key",
+                "documents.attachment",
+                "documents._fulltext_etag",
+            ],
+        )
+        return {
+            (indexed_record.get("control_number"), document.get("key")): document
+            for indexed_record in indexed_records
+            for document in indexed_record.get("documents", [])
+            if "_fulltext_etag" in document
+        }
+
     def update_record_relationships(self):
         self.update_authors_records_table()
         self.update_refs_in_citation_table()
@@ -176,19 +441,92 @@ class LiteratureRecord(
             ]
         """
         pids = cls._get_linked_pids_from_field(data, "record")
-        if pids:
-            results = LiteratureSearch.get_records_by_pids(pids, source=["_ui_display"])
+        if not pids:
+            return []
+        revisions_by_pid_value = cls._get_revisions_by_pid_value(pids)
+        uuids_to_fetch = []
+        for record_uuid, revision_id in revisions_by_pid_value.values():
+            rec_data = reference_display_cache.get(record_uuid, revision_id)
+            if rec_data is None:
+                uuids_to_fetch.append(record_uuid)
+                continue
+            yield LiteratureRecord(rec_data)
+
+        documents = []
+        uuids_without_reference_display = []
+        for document in LiteratureSearch().get_records_by_uuids(
+            uuids_to_fetch, source=["_reference_display"]
+        ):
+            if "_reference_display" in document["_source"]:
+                documents.append(document)
+            else:
+                uuids_without_reference_display.append(document["_id"])
+        # records indexed before ``_reference_display`` existed
+        if uuids_without_reference_display:
+            documents.extend(
+                LiteratureSearch().get_records_by_uuids(
+                    uuids_without_reference_display, source=["_ui_display"]
+                )
+            )
+        for document in documents:
+            rec_data = cls._load_reference_display(document["_source"], document["_id"])
+            if rec_data is None:
+                continue
+            reference_display_cache.set(document["_id"], document["_version"], rec_data)
+            yield LiteratureRecord(rec_data)
+
+        # pids which are not in the DB anymore are looked up in ES
+        missing_pids = [
+            pid for pid in pids if str(pid[-1]) not in revisions_by_pid_value
+        ]
+        if missing_pids:
+            results = LiteratureSearch.get_records_by_pids(
+                missing_pids, source=["_reference_display", "_ui_display"]
+            )
             for result in results:
-                try:
-                    rec_data = orjson.loads(result._ui_display)
-                except AttributeError:
-                    LOGGER.exception(
-                        "Record does not have _ui_display field!", record=result.meta.id
-                    )
-                    continue
-                yield LiteratureRecord(rec_data)
+                rec_data = cls._load_reference_display(result.to_dict(), result.meta.id)
+                if rec_data is not None:
+                    yield LiteratureRecord(rec_data)
         return []
 
+    @staticmethod
+    def _load_reference_display(source, record_uuid):
+        display = source.get("_reference_display") or source.get("_ui_display")
+        if display is None:
+            LOGGER.error(
+                "Record does not have _reference_display field!", record=record_uuid
+            )
+            return None
+        return orjson.loads(display)
+
+    @staticmethod
+    def _get_revisions_by_pid_value(pids):
+        """Get the UUIDs and revisions of the linked literature records.
+
+        Returns:
+            dict: ``(uuid, revision_id)`` of the records by their pid value,
+            the revision is the version of the record in ES.
+        """
+        pid_values = {str(pid[-1]) for pid in pids}
+        query = (
+            PersistentIdentifier.query.with_entities(
+                PersistentIdentifier.pid_value,
+                RecordMetadata.id,
+                RecordMetadata.version_id,
+            )
+            .join(RecordMetadata, RecordMetadata.id == PersistentIdentifier.object_uuid)
+            .filter(
+                PersistentIdentifier.pid_type == "lit",
+                PersistentIdentifier.object_type == "rec",
+                PersistentIdentifier.status == PIDStatus.REGISTERED,
+                PersistentIdentifier.pid_value.in_(pid_values),
+            )
+        )
+        return {
+            pid_value: (record_uuid, version_id - 1)
+            for pid_value, record_uuid, version_id in query
+        }
+
     @staticmethod
     def update_refs_to_conferences(data):
         """Assign $ref to every publication_info which cnum we have in PIDStore"""
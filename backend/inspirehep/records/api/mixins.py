@@ -113,6 +113,10 @@ class PapersAuthorsExtensionMixin:
 
 
 class CitationMixin(PapersAuthorsExtensionMixin):
+    # Citation aggregates computed for a whole batch of records by
+    # ``prefetch_citation_aggregates``, used instead of per-record queries.
+    _citation_aggregates = None
+
     def _citation_query(self, exclude_self_citations=False):
         """Prepares query with all records which cited this one
         Args:
@@ -134,6 +138,8 @@ class CitationMixin(PapersAuthorsExtensionMixin):
             int: Citation count number for this record if it is literature or data
             record.
         """
+        if self._citation_aggregates is not None:
+            return self._citation_aggregates["citation_count"]
         return self._citation_query().count()
 
     @property
@@ -143,6 +149,8 @@ class CitationMixin(PapersAuthorsExtensionMixin):
             int: Citation count number for this record if it is literature or data
             record.
         """
+        if self._citation_aggregates is not None:
+            return self._citation_aggregates["citation_count_without_self_citations"]
         if current_app.config.get("FEATURE_FLAG_ENABLE_SELF_CITATIONS"):
             return self._citation_query(exclude_self_citations=True).count()
         return 0
@@ -165,8 +173,110 @@ class CitationMixin(PapersAuthorsExtensionMixin):
 
     @property
     def citations_by_year(self):
+        if self._citation_aggregates is not None:
+            return self._citation_aggregates["citations_by_year"]
         return self._citations_by_year()
 
+    @property
+    def referenced_authors_bais(self):
+        """BAIs of the authors of all the records cited by this record."""
+        if self._citation_aggregates is not None:
+            return self._citation_aggregates["referenced_authors_bais"]
+        return [
+            result.author_id
+            for result in db.session.query(RecordsAuthors.author_id)
+            .filter(
+                RecordsAuthors.id_type == "INSPIRE BAI",
+                RecordsAuthors.record_id == RecordCitations.cited_id,
+                RecordCitations.citer_id == self.id,
+            )
+            .distinct(RecordsAuthors.author_id)
+            .all()
+        ]
+
+    @staticmethod
+    def prefetch_citation_aggregates(records):
+        """Compute citation aggregates for all the records with grouped queries.
+
+        After this call ``citation_count``, ``citation_count_without_self_citations``,
+        ``citations_by_year`` and ``referenced_authors_bais`` of the given records
+        don't hit the DB anymore, which makes serializing a batch of records
+        for ES independent of the number of records in the batch.
+
+        Args:
+            records (list(CitationMixin)): records to compute the aggregates for.
+        """
+        records_by_uuid = {
+            record.id: record
+            for record in records
+            if isinstance(record, CitationMixin) and record.id
+        }
+        if not records_by_uuid:
+            return
+        uuids = list(records_by_uuid.keys())
+        aggregates = {
+            record_uuid: {
+                "citation_count": 0,
+                "citation_count_without_self_citations": 0,
+                "citations_by_year": [],
+                "referenced_authors_bais": [],
+            }
+            for record_uuid in uuids
+        }
+        self_citations_enabled = current_app.config.get(
+            "FEATURE_FLAG_ENABLE_SELF_CITATIONS"
+        )
+
+        counts_query = (
+            db.session.query(
+                RecordCitations.cited_id,
+                func.count(RecordCitations.citer_id).label("count"),
+                func.count(RecordCitations.citer_id)
+                .filter(RecordCitations.is_self_citation.is_(False))
+                .label("count_without_self_citations"),
+            )
+            .filter(RecordCitations.cited_id.in_(uuids))
+            .group_by(RecordCitations.cited_id)
+        )
+        for row in counts_query:
+            aggregates[row.cited_id]["citation_count"] = row.count
+            if self_citations_enabled:
+                aggregates[row.cited_id][
+                    "citation_count_without_self_citations"
+                ] = row.count_without_self_citations
+
+        year = func.date_trunc("year", RecordCitations.citation_date).label("year")
+        by_year_query = (
+            db.session.query(
+                RecordCitations.cited_id,
+                year,
+                func.count(RecordCitations.citation_date).label("sum"),
+            )
+            .filter(RecordCitations.cited_id.in_(uuids))
+            .group_by(RecordCitations.cited_id, year)
+            .order_by(year)
+        )
+        for row in by_year_query:
+            if row.year:
+                aggregates[row.cited_id]["citations_by_year"].append(
+                    {"year": row.year.year, "count": row.sum}
+                )
+
+        referenced_authors_query = (
+            db.session.query(RecordCitations.citer_id, RecordsAuthors.author_id)
+            .filter(
+                RecordsAuthors.id_type == "INSPIRE BAI",
+                RecordsAuthors.record_id == RecordCitations.cited_id,
+                RecordCitations.citer_id.in_(uuids),
+            )
+            .distinct()
+        )
+        for row in referenced_authors_query:
+            aggregates[row.citer_id]["referenced_authors_bais"].append(row.author_id)
+
+        for record_uuid, record in records_by_uuid.items():
+            record._citation_aggregates = aggregates[record_uuid]
+
     def hard_delete(self):
         with db.session.begin_nested():
             LOGGER.warning("Hard Deleting citations")
@@ -7,6 +7,7 @@
 
 import datetime
 import os
+from time import monotonic
 
 import click
 import orjson
@@ -16,12 +17,21 @@ from flask import current_app
 from flask.cli import with_appcontext
 from invenio_db import db
 from invenio_records.api import RecordMetadata
+from invenio_records_rest.facets import _aggregations
 from sqlalchemy import DateTime, cast, not_, or_, type_coerce
 from sqlalchemy.dialects.postgresql import JSONB
 
 from inspirehep.mailing.api.jobs import send_job_deadline_reminder
 from inspirehep.pidstore.api import PidStoreBase
-from inspirehep.records.api import InspireRecord, JobsRecord
+from inspirehep.records.api import InspireRecord, JobsRecord, LiteratureRecord
+from inspirehep.records.utils import reference_display_cache
+from inspirehep.search.api import LiteratureAggregationsSearch, LiteratureSearch
+from inspirehep.search.facets import (
+    H_INDEX_AGGREGATIONS,
+    citation_summary,
+    get_h_index_from_terms_aggregation,
+)
+from inspirehep.search.factories.filter import inspire_filter_factory
 
 LOGGER = structlog.getLogger()
 
@@ -151,6 +161,118 @@ def citations():
     """Command for citations"""
 
 
+def _run_citation_summary(engine):
+    original_engine = current_app.config["CITATION_SUMMARY_H_INDEX_ENGINE"]
+    current_app.config["CITATION_SUMMARY_H_INDEX_ENGINE"] = engine
+    try:
+        facets = citation_summary()
+    finally:
+        current_app.config["CITATION_SUMMARY_H_INDEX_ENGINE"] = original_engine
+    search, _ = inspire_filter_factory(LiteratureAggregationsSearch(), "records-hep")
+    search = _aggregations(search, facets["aggs"]).params(size=0)
+
+    start_time = monotonic()
+    response = search.execute().to_dict()
+    elapsed_time = monotonic() - start_time
+
+    h_index = response["aggregations"]["citation_summary"]["h-index"]
+    if engine == "terms":
+        h_index = get_h_index_from_terms_aggregation(h_index)
+    return h_index["value"], response["took"], elapsed_time
+
+
+@citations.command(
+    "benchmark-summary",
+    help="Compare the h-index engines of the citation summary on author profiles.",
+)
+@click.option(
+    "-a",
+    "--author",
+    "authors",
+    multiple=True,
+    required=True,
+    help="Author of the profile, as in the facet (e.g. 1234_Name).",
+)
+@click.option(
+    "-n", "--repeat", default=5, help="Runs of every engine.", show_default=True
+)
+@click.option("--exclude-self-citations", is_flag=True)
+@with_appcontext
+def benchmark_citation_summary(authors, repeat, exclude_self_citations):
+    query_string = {"facet_name": "citation-summary"}
+    if exclude_self_citations:
+        query_string["exclude-self-citations"] = "true"
+    for author in authors:
+        with current_app.test_request_context(
+            "/api/literature/facets", query_string={**query_string, "author": author}
+        ):
+            h_indexes = {}
+            for engine in H_INDEX_AGGREGATIONS:
+                runs = [_run_citation_summary(engine) for _ in range(repeat)]
+                h_indexes[engine] = runs[0][0]
+                es_times = sorted(took for _, took, _ in runs)
+                elapsed_times = sorted(elapsed for _, _, elapsed in runs)
+                click.echo(
+                    f"{author} {engine}: h-index {runs[0][0]}, "
+                    f"median ES time {es_times[len(runs) // 2]}ms, "
+                    f"median request time {elapsed_times[len(runs) // 2] * 1000:.0f}ms"
+                )
+            if len({tuple(sorted(value.items())) for value in h_indexes.values()}) > 1:
+                click.secho(f"{author}: h-indexes differ {h_indexes}", fg="red")
+
+
+def _time_references_resolution(record):
+    pids = LiteratureRecord._get_linked_pids_from_field(record["references"], "record")
+    start_time = monotonic()
+    resolved_by_terms = LiteratureSearch.get_records_by_pids(
+        pids, source=["_ui_display"]
+    )
+    terms_time = monotonic() - start_time
+    reference_display_cache.clear()
+    start_time = monotonic()
+    resolved_by_mget = list(
+        LiteratureRecord.get_es_linked_references(record["references"])
+    )
+    mget_time = monotonic() - start_time
+    return (
+        len(pids),
+        len(resolved_by_terms),
+        terms_time,
+        len(resolved_by_mget),
+        mget_time,
+    )
+
+
+@citations.command(
+    "benchmark-references",
+    help="Compare the resolution of the references with terms queries and mget.",
+)
+@click.option(
+    "-r",
+    "--recid",
+    "recids",
+    multiple=True,
+    required=True,
+    help="Literature record with references.",
+)
+@click.option(
+    "-n", "--repeat", default=5, help="Runs of every strategy.", show_default=True
+)
+@with_appcontext
+def benchmark_references(recids, repeat):
+    for recid in recids:
+        record = LiteratureRecord.get_record_by_pid_value(recid)
+        runs = [_time_references_resolution(record) for _ in range(repeat)]
+        references, terms_found, _, mget_found, _ = runs[0]
+        terms_times = sorted(run[2] for run in runs)
+        mget_times = sorted(run[4] for run in runs)
+        click.echo(
+            f"{recid}: {references} linked references, "
+            f"terms {terms_found} found in {terms_times[len(runs) // 2] * 1000:.0f}ms, "
+            f"mget {mget_found} found in {mget_times[len(runs) // 2] * 1000:.0f}ms"
+        )
+
+
 @click.group()
 def jobs():
     """Command for jobs"""
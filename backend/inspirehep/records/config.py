@@ -677,6 +677,7 @@ LITERATURE_SOURCE_INCLUDES_BY_CONTENT_TYPE = {
 LITERATURE_SOURCE_EXCLUDES_BY_CONTENT_TYPE = {
     "application/json": [
         "_ui_display",
+        "_reference_display",
         "_latex_us_display",
         "_latex_eu_display",
         "_bibtex_display",
@@ -689,3 +690,10 @@ LITERATURE_SOURCE_EXCLUDES_BY_CONTENT_TYPE = {
 ADDITIONAL_LINKS = {"LITERATURE": {"citations": build_citation_search_link}}
 
 FILES_RESTRICTED_MIMETYPES = ("text/html", "text/javascript")
+
+# Number of parsed ``_reference_display`` of referenced records cached by every
+# process, 0 disables the cache
+RECORDS_REFERENCE_DISPLAY_CACHE_SIZE = 1000
+# Seconds for which the parsed ``_reference_display`` are cached, as they change
+# without new revision when the records they link to change
+RECORDS_REFERENCE_DISPLAY_CACHE_TIMEOUT = 300
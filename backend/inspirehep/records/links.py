@@ -4,10 +4,13 @@
 #
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
-from flask import current_app, request, url_for
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from flask import current_app, g, request, url_for
 from invenio_records_rest import current_records_rest
 
 from inspirehep.pidstore.api import PidStoreBase
+from inspirehep.search.utils import encode_search_after_cursor
 
 
 def inspire_detail_links_factory(pid, record=None, record_hit=None, *args, **kwargs):
@@ -70,6 +73,40 @@ def inspire_search_links(links):
     return links
 
 
+def _set_url_parameter(url, parameter, value):
+    """Set the value of the query parameter of the URL."""
+    url_parts = urlsplit(url)
+    query = [
+        (name, parameter_value)
+        for name, parameter_value in parse_qsl(url_parts.query, keep_blank_values=True)
+        if name != parameter
+    ]
+    query.append((parameter, value))
+    return urlunsplit(url_parts._replace(query=urlencode(query)))
+
+
+def inspire_search_after_links(links, search_result):
+    """Replace the page links by the ``search_after`` ones.
+
+    The ``next`` link has the cursor of the last hit, it's missing on the
+    last page, which has less hits than the size of the search.
+    """
+    self_url = links.get("self") if links else None
+    if not self_url:
+        return links
+    links.pop("prev", None)
+    links.pop("next", None)
+    cursor = request.values.get("search_after", "", type=str)
+    links["self"] = _set_url_parameter(self_url, "search_after", cursor)
+
+    hits = search_result["hits"]["hits"]
+    size = g.get("search_after_size")
+    if hits and len(hits) == size and "sort" in hits[-1]:
+        next_cursor = encode_search_after_cursor(hits[-1]["sort"])
+        links["next"] = _set_url_parameter(self_url, "search_after", next_cursor)
+    return links
+
+
 def find_record_endpoint(pid, record_hit=None, **kwargs):
     """gets endpoint from pid type or from `$schema` if record_data is from search results,
     as all pid_types from search_result are `recid`.
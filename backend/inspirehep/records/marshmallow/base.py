@@ -5,7 +5,7 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 import warnings
-from copy import deepcopy
+from copy import copy, deepcopy
 
 import orjson
 from flask import abort
@@ -52,13 +52,23 @@ class ElasticSearchBaseSchema:
 
 
 class BaseSchema(Schema):
-    """Base schema."""
+    """Base schema.
+
+    The dumped object is deep copied first, so ``pre_dump`` methods can modify
+    it. When the object is already a private copy (e.g. the record dumped again
+    while it's being serialized for ES) ``shallow_copy`` can be set in the
+    schema context to only copy its top level, as the schemas don't modify
+    nested data.
+    """
 
     class Meta:
         json_module = orjson
 
     def dump(self, obj, *args, **kwargs):
-        obj_copy = deepcopy(obj)
+        if self.context.get("shallow_copy"):
+            obj_copy = copy(obj)
+        else:
+            obj_copy = deepcopy(obj)
         if hasattr(obj, "model"):
             obj_copy.model = obj.model
         return super().dump(obj_copy, *args, **kwargs)
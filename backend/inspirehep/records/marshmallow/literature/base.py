@@ -29,6 +29,7 @@ FIELDS_TO_EXCLUDE = [
     "citations_by_year",
     "id",
     "_ui_display",
+    "_reference_display",
     "_latex_us_display",
     "_latex_eu_display",
     "_bibtex_display",
@@ -58,9 +59,13 @@ class LiteraturePublicSchema(LiteratureRawSchema):
         for document in documents:
             if "hidden" in document:
                 continue
-            if "_error" in document:
-                del document["_error"]
-            non_hidden_documents.append(document)
+            non_hidden_documents.append(
+                {
+                    key: value
+                    for key, value in document.items()
+                    if key not in ("_error", "_fulltext_etag")
+                }
+            )
         return non_hidden_documents
 
 
@@ -22,6 +22,7 @@ from inspirehep.records.marshmallow.literature.utils import (
 )
 
 from ..base import BaseSchema
+from ..utils import get_memoized_value
 
 
 class BibTexCommonSchema(BaseSchema):
@@ -148,6 +149,36 @@ class BibTexCommonSchema(BaseSchema):
             only_publications, key=lambda item: item.get("year", float("inf"))
         )[0]
 
+    def get_memoized_best_publication_info(self, data):
+        return get_memoized_value(
+            self.context,
+            ("best_publication_info", data.get("control_number")),
+            BibTexCommonSchema.get_best_publication_info,
+            data,
+        )
+
+    def get_memoized_parent_record(self, data):
+        return get_memoized_value(
+            self.context,
+            (
+                "parent_record",
+                data.get("control_number"),
+                data.get("doc_type") == "inproceedings",
+            ),
+            get_parent_record,
+            data,
+        )
+
+    def get_memoized_date(self, data):
+        doc_type = data.get("doc_type")
+        return get_memoized_value(
+            self.context,
+            ("bibtex_date", data.get("control_number"), doc_type),
+            self.get_date,
+            data,
+            doc_type,
+        )
+
     def get_authors_with_role_author(self, data):
         return self.get_authors_with_role(data.get("authors", []), "author")
 
@@ -178,14 +209,12 @@ class BibTexCommonSchema(BaseSchema):
         return get_value(data, "dois.value[0]")
 
     def get_month(self, data):
-        doc_type = data.get("doc_type")
-        date = self.get_date(data, doc_type)
+        date = self.get_memoized_date(data)
         if date:
             return date.month
 
     def get_year(self, data):
-        doc_type = data.get("doc_type")
-        date = self.get_date(data, doc_type)
+        date = self.get_memoized_date(data)
         if date:
             return date.year
 
@@ -246,7 +275,7 @@ class BibTexCommonSchema(BaseSchema):
         )
 
     def get_number(self, data):
-        return BibTexCommonSchema.get_best_publication_info(data).get("journal_issue")
+        return self.get_memoized_best_publication_info(data).get("journal_issue")
 
     def get_address(self, data):
         conference = ConferenceReader(data)
@@ -284,19 +313,19 @@ class BibTexCommonSchema(BaseSchema):
         return latex_encode(get_value(data, "book_series.title[0]"))
 
     def get_book_title(self, data):
-        parent_record = get_parent_record(data)
+        parent_record = self.get_memoized_parent_record(data)
         parent_title = self.get_title(parent_record)
 
         return parent_title
 
     def get_book_editors(self, data):
-        parent_record = get_parent_record(data)
+        parent_record = self.get_memoized_parent_record(data)
         parent_editors = self.get_authors_with_role_editor(parent_record)
 
         return parent_editors
 
     def get_volume(self, data):
-        publication_volume = BibTexCommonSchema.get_best_publication_info(data).get(
+        publication_volume = self.get_memoized_best_publication_info(data).get(
             "journal_volume"
         )
         bookseries_volume = get_value(data, "book_series.volume[0]")
@@ -304,7 +333,7 @@ class BibTexCommonSchema(BaseSchema):
 
     def get_pages(self, data):
         return LiteratureReader.get_page_artid_for_publication_info(
-            BibTexCommonSchema.get_best_publication_info(data), "--"
+            self.get_memoized_best_publication_info(data), "--"
         )
 
     def get_edition(self, data):
@@ -312,7 +341,7 @@ class BibTexCommonSchema(BaseSchema):
 
     def get_journal(self, data):
         return latex_encode(
-            BibTexCommonSchema.get_best_publication_info(data)
+            self.get_memoized_best_publication_info(data)
             .get("journal_title")
             .replace(".", ". ")
             .rstrip(" ")
@@ -35,5 +35,4 @@ class ConferenceInfoItemSchemaV1(Schema):
         titles = conference.get("titles")
         if not titles:
             return {}
-        pub_info_item.update(conference)
-        return pub_info_item
+        return {**pub_info_item, **conference}
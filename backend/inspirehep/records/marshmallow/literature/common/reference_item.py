@@ -58,9 +58,15 @@ class ReferenceItemSchemaV1(Schema):
         if not data.get("record"):
             collaborations = get_value(data, "reference.collaborations")
             if collaborations:
-                data["reference"]["collaborations"] = [
-                    {"value": collaboration} for collaboration in collaborations
-                ]
+                data = {
+                    **data,
+                    "reference": {
+                        **data["reference"],
+                        "collaborations": [
+                            {"value": collaboration} for collaboration in collaborations
+                        ],
+                    },
+                }
         return data
 
     def get_reference_data(self, reference, reference_records):
@@ -5,7 +5,7 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
-import base64
+from functools import wraps
 from itertools import chain
 
 import orjson
@@ -13,13 +13,11 @@ import structlog
 from flask import current_app
 from inspire_utils.helpers import force_list
 from inspire_utils.record import get_value
-from invenio_db import db
 from marshmallow import fields, missing, pre_dump
+from prometheus_client import Histogram
 
-from inspirehep.files.api import current_s3_instance
 from inspirehep.oai.utils import is_cds_set, is_cern_arxiv_set
 from inspirehep.pidstore.api import PidStoreBase
-from inspirehep.records.api import InspireRecord
 from inspirehep.records.marshmallow.literature.common.abstract import AbstractSource
 from inspirehep.records.marshmallow.literature.common.author import (
     AuthorsInfoSchemaForES,
@@ -29,21 +27,50 @@ from inspirehep.records.marshmallow.literature.common.author import (
 from inspirehep.records.marshmallow.literature.common.thesis_info import (
     ThesisInfoSchemaForESV1,
 )
-from inspirehep.records.models import RecordCitations, RecordsAuthors
 
 from ..base import ElasticSearchBaseSchema
-from ..utils import get_display_name_for_author_name, get_facet_author_name_for_author
+from ..utils import get_display_name_for_author_name, get_memoized_value
 from .base import LiteratureRawSchema
 from .ui import LiteratureDetailSchema
 
 LOGGER = structlog.getLogger()
 
+literature_display_field_serialization_time = Histogram(
+    "literature_display_field_serialization_seconds",
+    "Time spent serializing the display fields of literature records for ES",
+    ["field"],
+)
+
+# Fields of the UI display used to display the record in reference lists, of
+# the lists only the first item is displayed
+REFERENCE_DISPLAY_FIELDS = [
+    "authors",
+    "collaborations",
+    "control_number",
+    "publication_info",
+    "urls",
+]
+REFERENCE_DISPLAY_FIRST_ITEM_FIELDS = ["titles", "arxiv_eprints", "dois"]
+
+
+def timed_display_field(field):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with literature_display_field_serialization_time.labels(field=field).time():
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
 
 class LiteratureElasticSearchSchema(ElasticSearchBaseSchema, LiteratureRawSchema):
     """Elasticsearch serialzier"""
 
     _oai = fields.Method("get_oai", dump_only=True)
     _ui_display = fields.Method("get_ui_display", dump_only=True)
+    _reference_display = fields.Method("get_reference_display", dump_only=True)
     _latex_us_display = fields.Method("get_latex_us_display", dump_only=True)
     _latex_eu_display = fields.Method("get_latex_eu_display", dump_only=True)
     _bibtex_display = fields.Method("get_bibtex_display", dump_only=True)
@@ -67,53 +94,93 @@ class LiteratureElasticSearchSchema(ElasticSearchBaseSchema, LiteratureRawSchema
 
     @staticmethod
     def get_referenced_authors_bais(record):
-        return [
-            result.author_id
-            for result in db.session.query(RecordsAuthors.author_id)
-            .filter(
-                RecordsAuthors.id_type == "INSPIRE BAI",
-                RecordsAuthors.record_id == RecordCitations.cited_id,
-                RecordCitations.citer_id == record.id,
-            )
-            .distinct(RecordsAuthors.author_id)
-            .all()
-        ]
-
+        return record.referenced_authors_bais
+
+    def dump(self, obj, *args, **kwargs):
+        # ``record`` is already a copy made by this ``dump``, so the display
+        # serializers don't need to deep copy it again, and values they all
+        # need (parent record, publication info...) are computed only once.
+        self.display_context = {"shallow_copy": True, "memo": {}}
+        return super().dump(obj, *args, **kwargs)
+
+    def get_ui_data(self, record):
+        """Dump the data of the UI display, which is shared with the reference display."""
+        return get_memoized_value(
+            self.display_context,
+            ("ui", record.get("control_number")),
+            LiteratureDetailSchema(context=self.display_context).dump,
+            record,
+        ).data
+
+    @timed_display_field("_ui_display")
     def get_ui_display(self, record):
-        return orjson.dumps(LiteratureDetailSchema().dump(record).data).decode("utf-8")
+        return orjson.dumps(self.get_ui_data(record)).decode("utf-8")
+
+    @timed_display_field("_reference_display")
+    def get_reference_display(self, record):
+        ui_data = self.get_ui_data(record)
+        reference_data = {
+            field: ui_data[field]
+            for field in REFERENCE_DISPLAY_FIELDS
+            if field in ui_data
+        }
+        for field in REFERENCE_DISPLAY_FIRST_ITEM_FIELDS:
+            if ui_data.get(field):
+                reference_data[field] = ui_data[field][:1]
+        return orjson.dumps(reference_data).decode("utf-8")
+
+    def get_latex_data(self, record):
+        """Dump the data of the LaTeX displays, which is the same for all formats."""
+        from inspirehep.records.serializers.latex import latex_US
 
+        return get_memoized_value(
+            self.display_context,
+            ("latex", record.get("control_number")),
+            latex_US.dump,
+            record,
+            self.display_context,
+        )
+
+    @timed_display_field("_latex_us_display")
     def get_latex_us_display(self, record):
         from inspirehep.records.serializers.latex import latex_US
 
         try:
             return latex_US.latex_template().render(
-                data=latex_US.dump(record), format=latex_US.format
+                data=self.get_latex_data(record), format=latex_US.format
             )
         except Exception:
             LOGGER.exception("Cannot get latex us display", record=record)
             return " "
 
+    @timed_display_field("_latex_eu_display")
     def get_latex_eu_display(self, record):
         from inspirehep.records.serializers.latex import latex_EU
 
         try:
             return latex_EU.latex_template().render(
-                data=latex_EU.dump(record), format=latex_EU.format
+                data=self.get_latex_data(record), format=latex_EU.format
             )
         except Exception:
             LOGGER.exception("Cannot get latex eu display", record=record)
             return " "
 
+    @timed_display_field("_bibtex_display")
     def get_bibtex_display(self, record):
         from inspirehep.records.serializers.bibtex import literature_bibtex
 
-        return literature_bibtex.serialize(None, record)
+        return literature_bibtex.serialize(
+            None, record, marshmallow_context=self.display_context
+        )
 
+    @timed_display_field("_cv_format")
     def get_cv_format(self, record):
         from inspirehep.records.serializers.cv import literature_cv_html
 
         try:
-            return literature_cv_html.serialize_inner(None, record)
+            return literature_cv_html.serialize_inner(
+                None, record, marshmallow_context=self.display_context
+            )
         except Exception:
             LOGGER.exception("Cannot get cv format", record=record)
             return " "
@@ -135,36 +202,30 @@ class LiteratureElasticSearchSchema(ElasticSearchBaseSchema, LiteratureRawSchema
 
     def get_facet_author_name(self, record):
         """Prepare record for ``facet_author_name`` field."""
-        authors_with_record = list(
-            InspireRecord.get_linked_records_from_dict_field(record, "authors.record")
-        )
-        found_authors_control_numbers = set(
-            [
-                author["control_number"]
-                for author in authors_with_record
-                if author.get("control_number")
-            ]
-        )
-        authors_without_record = [
-            author
-            for author in record.get("authors", [])
-            if "record" not in author
-            or int(
-                PidStoreBase.get_pid_from_record_uri(author["record"].get("$ref"))[1]
-            )
-            not in found_authors_control_numbers
-        ]
-        result = []
-
-        for author in authors_with_record:
-            result.append(get_facet_author_name_for_author(author))
+        from inspirehep.records.api import LiteratureRecord
 
-        for author in authors_without_record:
-            result.append(
-                "NOREC_{}".format(get_display_name_for_author_name(author["full_name"]))
+        linked_authors_facet_names = LiteratureRecord.get_linked_authors_facet_names(
+            record
+        )
+        authors_with_record = []
+        authors_without_record = []
+        for author in record.get("authors", []):
+            author_control_number = (
+                int(PidStoreBase.get_pid_from_record_uri(author["record"]["$ref"])[1])
+                if "record" in author
+                else None
             )
+            facet_name = linked_authors_facet_names.get(author_control_number)
+            if facet_name is None:
+                authors_without_record.append(
+                    "NOREC_{}".format(
+                        get_display_name_for_author_name(author["full_name"])
+                    )
+                )
+            elif facet_name not in authors_with_record:
+                authors_with_record.append(facet_name)
 
-        return result
+        return authors_with_record + authors_without_record
 
     def get_bookautocomplete(self, record):
         """prepare ```bookautocomplete`` field."""
@@ -242,30 +303,10 @@ class LiteratureFulltextElasticSearchSchema(LiteratureElasticSearchSchema):
     documents = fields.Method("get_documents_with_fulltext")
 
     def get_documents_with_fulltext(self, record_data):
+        from inspirehep.records.api import LiteratureRecord
+
+        fulltexts = LiteratureRecord.get_documents_fulltexts(record_data)
         documents = record_data.get("documents", [])
         for document in documents:
-            if (
-                not document.get("hidden")
-                and document.get("filename", "").endswith("pdf")
-                and document.get("fulltext")
-            ) or document.get("source") == "arxiv":
-                try:
-                    key = document["key"]
-                    bucket = current_s3_instance.get_bucket_for_file_key(key)
-                    file_data = current_s3_instance.client.get_object(
-                        Bucket=bucket, Key=key
-                    )
-                    mimetype = file_data.get("ContentType", "")
-                    body = file_data["Body"]
-                    if mimetype != "application/pdf":
-                        continue
-                    encoded_file = base64.b64encode(body.read()).decode("ascii")
-                    document["text"] = encoded_file
-                except current_s3_instance.client.exceptions.NoSuchKey:
-                    LOGGER.error(
-                        "File was not found for the given url",
-                        document_url=document["url"],
-                        record_control_number=record_data["control_number"],
-                    )
-                    continue
+            document.update(fulltexts.get(document.get("key"), {}))
         return documents
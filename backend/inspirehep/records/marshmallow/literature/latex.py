@@ -15,6 +15,7 @@ from isbn import ISBNError
 from marshmallow import fields, missing
 
 from ..base import BaseSchema
+from ..utils import get_memoized_value
 from .bibtex import BibTexCommonSchema
 from .utils import latex_encode
 
@@ -72,7 +73,12 @@ class LatexSchema(BaseSchema):
         return [name.replace(". ", ".~") for name in author_names]
 
     def get_publication_info(self, data):
-        publication_info = BibTexCommonSchema.get_best_publication_info(data)
+        publication_info = get_memoized_value(
+            self.context,
+            ("best_publication_info", data.get("control_number")),
+            BibTexCommonSchema.get_best_publication_info,
+            data,
+        )
         if publication_info == {}:
             return missing
 
@@ -116,12 +122,11 @@ class LatexSchema(BaseSchema):
         return erratums or None
 
     def get_dois(self, data):
-        dois = get_value(data, "dois", []).copy()
-        if not dois:
-            return missing
-        for doi_data in dois:
-            doi_data["value"] = latex_encode(doi_data.get("value"))
-        return dois or None
+        dois = [
+            {**doi_data, "value": latex_encode(doi_data.get("value"))}
+            for doi_data in get_value(data, "dois", [])
+        ]
+        return dois or missing
 
     def get_book_publication_info(self, data):
         if "book" not in get_value(data, "document_type", []):
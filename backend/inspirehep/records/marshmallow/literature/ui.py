@@ -27,6 +27,7 @@ from inspirehep.records.utils import get_literature_earliest_date
 from ..base import EnvelopeSchema
 from ..common import AcceleratorExperimentSchemaV1
 from ..fields import ListWithLimit, NonHiddenNested
+from ..utils import get_memoized_value
 from .base import LiteraturePublicSchema
 from .common import (
     AuthorSchemaV1,
@@ -183,7 +184,16 @@ class LiteratureDetailSchema(
         return self.get_len_or_missing(references)
 
     def get_linked_book(self, data):
-        parent = get_parent_record(data)
+        parent = get_memoized_value(
+            self.context,
+            (
+                "parent_record",
+                data.get("control_number"),
+                data.get("doc_type") == "inproceedings",
+            ),
+            get_parent_record,
+            data,
+        )
         if parent and "titles" in parent and "control_number" in parent:
             endpoint = PidStoreBase.get_endpoint_from_pid_type(
                 PidStoreBase.get_pid_type_from_schema(data["$schema"])
@@ -209,8 +219,9 @@ class LiteratureDetailSchema(
         ads_ids = get_values_for_schema(external_system_ids, "ADS")
 
         if arxiv_id and not ads_ids:
-            external_system_ids.append({"schema": "ADS", "value": f"arXiv:{arxiv_id}"})
-            data["external_system_identifiers"] = external_system_ids
+            data["external_system_identifiers"] = external_system_ids + [
+                {"schema": "ADS", "value": f"arXiv:{arxiv_id}"}
+            ]
 
         return data
 
@@ -250,15 +261,15 @@ class LiteratureDetailSchema(
         return dataset_links or missing
 
     def get_documents_without_fulltext(self, data):
-        documents = data.get("documents", [])
-        for document in documents:
-            if "attachment" in document:
-                del document["attachment"]
-            if "text" in document:
-                del document["text"]
-            if "_error" in document:
-                del document["_error"]
-        return documents
+        fulltext_fields = {"attachment", "text", "_error", "_fulltext_etag"}
+        return [
+            {
+                key: value
+                for key, value in document.items()
+                if key not in fulltext_fields
+            }
+            for document in data.get("documents", [])
+        ]
 
 
 class LiteratureListWrappedSchema(EnvelopeSchema):
@@ -6,6 +6,7 @@
 # the terms of the MIT License; see LICENSE file for more details.
 
 import re
+from functools import lru_cache
 
 from pylatexenc.latexencode import (
     RULE_DICT,
@@ -34,6 +35,19 @@ def get_parent_record(data):
     return next(book_records, {})
 
 
+@lru_cache(maxsize=None)
+def get_latex_encoder():
+    conversion_rules = [
+        UnicodeToLatexConversionRule(RULE_DICT, {ord("{"): "{", ord("}"): "}"}),
+        "defaults",
+    ]
+
+    return UnicodeToLatexEncoder(
+        replacement_latex_protection="braces-after-macro",
+        conversion_rules=conversion_rules,
+    ).unicode_to_latex
+
+
 def latex_encode(text, contains_math=False):
     """Encode a string for use in a LaTeX format.
 
@@ -45,15 +59,7 @@ def latex_encode(text, contains_math=False):
     if text is None:
         return None
 
-    conversion_rules = [
-        UnicodeToLatexConversionRule(RULE_DICT, {ord("{"): "{", ord("}"): "}"}),
-        "defaults",
-    ]
-
-    encode = UnicodeToLatexEncoder(
-        replacement_latex_protection="braces-after-macro",
-        conversion_rules=conversion_rules,
-    ).unicode_to_latex
+    encode = get_latex_encoder()
 
     if not (contains_math and ("$" in text or r"\(" in text)):
         return encode(text)
@@ -72,3 +72,23 @@ def get_acquisition_source_without_email(data):
     if "email" in acquisition_source.keys():
         del acquisition_source["email"]
     return acquisition_source
+
+
+def get_memoized_value(context, key, func, *args):
+    """Return ``func(*args)`` memoized in the ``memo`` dict of a schema context.
+
+    It allows schemas dumping the same record (e.g. all the display fields of a
+    literature record for ES) to compute derived values only once. Without
+    ``memo`` in the context ``func`` is always called.
+
+    Args:
+        context (dict): the schema context.
+        key (hashable): key of the value, it has to identify the record.
+        func (callable): function computing the value.
+    """
+    memo = context.get("memo")
+    if memo is None:
+        return func(*args)
+    if key not in memo:
+        memo[key] = func(*args)
+    return memo[key]
@@ -11,6 +11,11 @@ from flask_sqlalchemy import models_committed
 from invenio_records.models import RecordMetadata
 
 from inspirehep.indexer.tasks import index_fulltext
+from inspirehep.matcher.cache import (
+    REFERENCE_MATCH_TARGETS_PID_TYPES,
+    invalidate_journal_dict_cache,
+    invalidate_reference_matches_cache,
+)
 from inspirehep.pidstore.api.base import PidStoreBase
 from inspirehep.records.api import InspireRecord
 from inspirehep.records.tasks import redirect_references_to_merged_record
@@ -34,17 +39,22 @@ def index_after_commit(sender, changes):
                     change=change,
                     uuid=str(model_instance.id),
                 )
+                pid_type = PidStoreBase.get_pid_type_from_schema(
+                    model_instance.json["$schema"]
+                )
                 force_delete = "delete" == change
+                if force_delete and pid_type in REFERENCE_MATCH_TARGETS_PID_TYPES:
+                    # hard deleted records were removed from ES already
+                    invalidate_reference_matches_cache()
+                if pid_type == "jou":
+                    invalidate_journal_dict_cache()
                 InspireRecord(model_instance.json, model=model_instance).index(
                     force_delete=force_delete
                 )
                 if "new_record" in model_instance.json:
                     redirect_references_to_merged_record.delay(str(model_instance.id))
                 if (
-                    PidStoreBase.get_pid_type_from_schema(
-                        model_instance.json["$schema"]
-                    )
-                    == "lit"
+                    pid_type == "lit"
                     and "documents" in model_instance.json
                     and current_app.config["FEATURE_FLAG_ENABLE_FULLTEXT"]
                 ):
@@ -84,8 +84,11 @@ class BibTexSerializer:
     def __init__(self, schema_class=BibTexCommonSchema):
         self.schema_class = schema_class()
 
-    def create_bibliography_entry(self, record):
-        data = self.schema_class.dump(record).data
+    def create_bibliography_entry(self, record, marshmallow_context=None):
+        schema = self.schema_class
+        if marshmallow_context:
+            schema = type(self.schema_class)(context=marshmallow_context)
+        data = schema.dump(record).data
         doc_type = data.pop("doc_type", None)
         texkey = data.pop("texkey", None)
         authors = [Person(person) for person in data.pop("authors_with_role_author")]
@@ -103,17 +106,17 @@ class BibTexSerializer:
         data_bibtex = (texkey, data_entry)
         return data_bibtex
 
-    def create_bibliography(self, record):
-        texkey, entries = self.create_bibliography_entry(record)
+    def create_bibliography(self, record, marshmallow_context=None):
+        texkey, entries = self.create_bibliography_entry(record, marshmallow_context)
         data = {texkey: entries}
 
         bib_data = BibliographyData(data)
         writer = BibtexWriter()
         return writer.to_string(bib_data)
 
-    def serialize(self, pid, record, links_factory=None):
+    def serialize(self, pid, record, links_factory=None, marshmallow_context=None):
         try:
-            return self.create_bibliography(record)
+            return self.create_bibliography(record, marshmallow_context)
         except Exception as e:
             LOGGER.exception(
                 "Bibtex serialization error",
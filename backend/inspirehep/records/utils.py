@@ -17,11 +17,18 @@ from inspire_utils.helpers import force_list
 from inspire_utils.record import get_value, get_values_for_schema
 from invenio_db import db
 from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+from prometheus_client import Counter
 from sqlalchemy.orm import aliased
 
 from inspirehep.pidstore.api import PidStoreBase
 from inspirehep.records.errors import DownloadFileError
-from inspirehep.utils import get_inspirehep_url
+from inspirehep.utils import LRUCache, get_inspirehep_url
+
+reference_display_cache_requests = Counter(
+    "records_reference_display_cache_requests",
+    "Resolution of linked references, by cache hit, miss or eviction.",
+    ["result"],
+)
 
 
 def get_literature_earliest_date(data):
@@ -140,3 +147,42 @@ def remove_author_bai_from_id_list(author):
     author["ids"] = [
         author_id for author_id in author["ids"] if author_id["schema"] != "INSPIRE BAI"
     ]
+
+
+class ReferenceDisplayCache:
+    """In-process LRU cache of the parsed reference display of literature records.
+
+    The payloads are cached by record UUID and revision, so a new revision of
+    a record is never served from the cache. A record is also reindexed when
+    the records it links to change, without new revision, so the payloads
+    expire after ``RECORDS_REFERENCE_DISPLAY_CACHE_TIMEOUT`` seconds.
+    """
+
+    def __init__(self):
+        self.payloads = LRUCache(reference_display_cache_requests)
+
+    @staticmethod
+    def get_max_size():
+        return current_app.config.get("RECORDS_REFERENCE_DISPLAY_CACHE_SIZE", 0)
+
+    def get(self, uuid, revision_id):
+        if not self.get_max_size():
+            return None
+        return self.payloads.get((str(uuid), revision_id))
+
+    def set(self, uuid, revision_id, payload):
+        max_size = self.get_max_size()
+        if not max_size:
+            return
+        self.payloads.set(
+            (str(uuid), revision_id),
+            payload,
+            max_size,
+            timeout=current_app.config["RECORDS_REFERENCE_DISPLAY_CACHE_TIMEOUT"],
+        )
+
+    def clear(self):
+        self.payloads.clear()
+
+
+reference_display_cache = ReferenceDisplayCache()
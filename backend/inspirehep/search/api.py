@@ -25,9 +25,14 @@ from inspirehep.matcher.api import (
     match_reference_control_numbers_with_relaxed_journal_titles,
 )
 from inspirehep.pidstore.api import PidStoreBase
+from inspirehep.search.cache import (
+    get_cached_search_results,
+    is_search_results_cache_enabled,
+)
 from inspirehep.search.errors import MaximumSearchPageSizeExceeded
 from inspirehep.search.factories import inspire_query_factory
-from inspirehep.search.utils import RecursionLimit
+from inspirehep.search.utils import RecursionLimit, decode_search_after_cursor
+from inspirehep.utils import chunker
 
 IQ = inspire_query_factory()
 LOGGER = structlog.getLogger()
@@ -80,7 +85,11 @@ class SearchMixin(object):
                 body={"ids": uuids},
                 **kwargs,
             )
-            results = [document["_source"] for document in documents["docs"]]
+            results = [
+                document["_source"]
+                for document in documents["docs"]
+                if document.get("found")
+            ]
         except RequestError:
             pass
 
@@ -90,10 +99,45 @@ class SearchMixin(object):
 class InspireSearch(RecordsSearch, SearchMixin):
     """Base Inspire search classs."""
 
+    _results_cache = False
+
     def __init__(self, **kwargs):
         kwargs["extra"] = {"track_total_hits": True}
         super().__init__(**kwargs)
 
+    def _clone(self):
+        search = super()._clone()
+        search._results_cache = self._results_cache
+        return search
+
+    def with_results_cache(self):
+        """Cache the results of the search for anonymous users."""
+        search = self._clone()
+        search._results_cache = True
+        return search
+
+    def with_search_after(self, cursor=None):
+        """Paginate with ``search_after`` instead of ``from``.
+
+        The sort gets ``control_number`` as tiebreaker, so the sort values of
+        the last hit of a page identify where the next page starts.
+
+        Args:
+            cursor (str): the cursor of the previous page, ``None`` for the
+                first page.
+        """
+        sort = list(self._sort) or ["-_score"]
+        sort_fields = {
+            next(iter(key)) if isinstance(key, dict) else key.lstrip("-")
+            for key in sort
+        }
+        if "control_number" not in sort_fields:
+            sort.append({"control_number": {"order": "desc"}})
+        search = self.sort(*sort).extra(**{"from": 0})
+        if cursor:
+            search = search.extra(search_after=decode_search_after_cursor(cursor))
+        return search
+
     @staticmethod
     def get_record_data_from_es(record):
         """Queries Elastic Search for this record and returns it as dictionary
@@ -122,8 +166,25 @@ class InspireSearch(RecordsSearch, SearchMixin):
             if size > max_page_size:
                 raise MaximumSearchPageSizeExceeded(max_size=max_page_size)
         with RecursionLimit(current_app.config.get("SEARCH_MAX_RECURSION_LIMIT", 5000)):
+            if self._results_cache and is_search_results_cache_enabled():
+                return self._execute_with_results_cache(*args, **kwargs)
             return super().execute(*args, **kwargs)
 
+    def _execute_with_results_cache(self, *args, **kwargs):
+        def execute():
+            return super(InspireSearch, self).execute(*args, **kwargs).to_dict()
+
+        params = {
+            key: value for key, value in self._params.items() if key != "preference"
+        }
+        results = get_cached_search_results(
+            self.alias,
+            {"index": self._index, "body": self.to_dict(), "params": params},
+            execute,
+        )
+        self._response = self._response_class(self, results)
+        return self._response
+
 
 class LiteratureSearch(InspireSearch):
     """Elasticsearch-dsl specialized class to search in Literature database."""
@@ -273,19 +334,60 @@ class LiteratureSearch(InspireSearch):
 
     @staticmethod
     def get_records_by_pids(pids, source=None, size=10000):
-        if not pids:
-            return []
-        should = []
-        for pid in pids:
-            should.append(Q("match", **{"control_number": pid[-1]}))
-        results = (
-            LiteratureSearch()
-            .query(Q("bool", should=should, minimum_should_match=1))
-            .params(size=size)
-        )
-        if source:
-            results = results.params(_source=source)
-        return results.execute().hits
+        """Get the records with the given pids with ``terms`` queries.
+
+        The control numbers are sent in chunks of ``SEARCH_TERMS_QUERY_MAX_SIZE``,
+        so records with thousands of references don't make huge queries.
+
+        Args:
+            pids (list): (pid_type, pid_value) of the records.
+            source (list): fields of the records to return.
+            size (int): maximum number of records to return.
+
+        Returns:
+            list: ES hits of the found records.
+        """
+        hits = []
+        control_numbers = [pid[-1] for pid in pids]
+        chunk_size = current_app.config["SEARCH_TERMS_QUERY_MAX_SIZE"]
+        for chunk in chunker(control_numbers, chunk_size):
+            results = (
+                LiteratureSearch()
+                .filter("terms", control_number=chunk)
+                .params(size=min(len(chunk), size - len(hits)))
+            )
+            if source:
+                results = results.params(_source=source)
+            hits.extend(results.execute().hits)
+            if len(hits) >= size:
+                break
+        return hits
+
+    def get_records_by_uuids(self, uuids, source=None):
+        """Get the records with the given UUIDs with ``mget`` requests.
+
+        Args:
+            uuids (list): UUIDs of the records.
+            source (list): fields of the records to return.
+
+        Returns:
+            list: ES documents of the found records, with their ``_id``,
+            ``_version`` and ``_source``.
+        """
+        kwargs = {"_source_includes": source} if source else {}
+        chunk_size = current_app.config["SEARCH_TERMS_QUERY_MAX_SIZE"]
+        documents = []
+        for chunk in chunker([str(uuid) for uuid in uuids], chunk_size):
+            response = es.mget(
+                index=self.alias,
+                doc_type=self.Meta.doc_types,
+                body={"ids": chunk},
+                **kwargs,
+            )
+            documents.extend(
+                document for document in response["docs"] if document.get("found")
+            )
+        return documents
 
 
 class LiteratureAggregationsSearch(LiteratureSearch):
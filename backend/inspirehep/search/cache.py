@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+"""Cache of the search results for anonymous users.
+
+The results are cached by the body and the parameters of the ES request, which
+include the query, filters, sort, page, size and requested source. Every index
+alias has a generation number, part of the cache keys, which is increased after
+every write to the index, so the cached results of an index are invalidated at
+once and expire after ``SEARCH_RESULTS_CACHE_TIMEOUT``.
+"""
+
+import hashlib
+
+import orjson
+import structlog
+from flask import current_app
+from invenio_search import current_search_client as es
+from prometheus_client import Counter
+from redis import RedisError
+
+from inspirehep.accounts.api import is_user_logged_in
+from inspirehep.utils import get_redis
+
+LOGGER = structlog.getLogger()
+
+search_results_cache_requests = Counter(
+    "search_results_cache_requests",
+    "Search requests of anonymous users, by index and cache hit or miss.",
+    ["index", "result"],
+)
+
+
+def is_search_results_cache_enabled():
+    return (
+        current_app.config.get("FEATURE_FLAG_ENABLE_SEARCH_RESULTS_CACHE", False)
+        and not is_user_logged_in()
+    )
+
+
+def _get_generation_key(index):
+    return f"search:results:generation:{index}"
+
+
+def _get_results_key(index, generation, request):
+    request_hash = hashlib.sha1(
+        orjson.dumps(request, option=orjson.OPT_SORT_KEYS)
+    ).hexdigest()
+    return f"search:results:{index}:{generation}:{request_hash}"
+
+
+def get_cached_search_results(index, request, execute):
+    """Return the results of the ES request, from the cache if possible.
+
+    Args:
+        index (str): alias of the index of the search.
+        request (dict): body and parameters of the ES request.
+        execute (callable): executes the request and returns the raw results.
+
+    Returns:
+        dict: raw results of the ES request.
+    """
+    try:
+        redis = get_redis()
+        generation = int(redis.get(_get_generation_key(index)) or 0)
+        key = _get_results_key(index, generation, request)
+        cached_results = redis.get(key)
+    except RedisError:
+        LOGGER.exception("Cannot read search results cache", index=index)
+        return execute()
+
+    if cached_results:
+        search_results_cache_requests.labels(index=index, result="hit").inc()
+        return orjson.loads(cached_results)
+
+    search_results_cache_requests.labels(index=index, result="miss").inc()
+    results = execute()
+    try:
+        redis.set(
+            key,
+            orjson.dumps(results),
+            ex=current_app.config["SEARCH_RESULTS_CACHE_TIMEOUT"],
+        )
+    except RedisError:
+        LOGGER.exception("Cannot write search results cache", index=index)
+    return results
+
+
+def get_search_results_cache_write_arguments():
+    """Arguments of the ES writes, which wait for the writes to be searchable.
+
+    The cached results must be invalidated only when the writes are searchable,
+    otherwise the results of a search done in between would be cached again.
+    """
+    if not current_app.config.get("FEATURE_FLAG_ENABLE_SEARCH_RESULTS_CACHE", False):
+        return {}
+    return {"refresh": "wait_for"}
+
+
+def invalidate_search_results_cache(*indexes):
+    """Invalidate the cached results of the given indexes.
+
+    It must be called after the writes to the indexes are searchable.
+
+    Args:
+        indexes (str): aliases of the indexes.
+    """
+    if not current_app.config.get("FEATURE_FLAG_ENABLE_SEARCH_RESULTS_CACHE", False):
+        return
+    try:
+        with get_redis().pipeline() as pipeline:
+            for index in set(indexes):
+                pipeline.incr(_get_generation_key(index))
+            pipeline.execute()
+    except RedisError:
+        LOGGER.exception("Cannot invalidate search results cache", indexes=indexes)
+
+
+def refresh_and_invalidate_search_results_cache(*indexes):
+    """Refresh the indexes and invalidate their cached results, after bulk writes.
+
+    The bulk writes don't wait for a refresh, the indexes are refreshed once
+    they are all done.
+
+    Args:
+        indexes (str): aliases of the indexes.
+    """
+    if not indexes or not current_app.config.get(
+        "FEATURE_FLAG_ENABLE_SEARCH_RESULTS_CACHE", False
+    ):
+        return
+    es.indices.refresh(index=",".join(sorted(set(indexes))))
+    invalidate_search_results_cache(*indexes)
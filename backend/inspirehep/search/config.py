@@ -6,6 +6,27 @@
 # the terms of the MIT License; see LICENSE file for more details.
 
 SEARCH_MAX_SEARCH_PAGE_SIZE = 1000
+# Seconds for which the search results of anonymous users are cached, with
+# ``FEATURE_FLAG_ENABLE_SEARCH_RESULTS_CACHE``
+SEARCH_RESULTS_CACHE_TIMEOUT = 300
+# Number of parsed queries cached by every process, 0 disables the cache
+SEARCH_PARSED_QUERY_CACHE_SIZE = 2000
+# Request parameters read by the facet builders, the facets are built once for
+# every combination of their values
+SEARCH_FACETS_REQUEST_PARAMETERS = ["author", "timezone", "exclude-self-citations"]
+# Settings read by the facet builders, the facets are built again when they change
+SEARCH_FACETS_CONFIG_PARAMETERS = [
+    "CITATION_SUMMARY_H_INDEX_ENGINE",
+    "CITATION_SUMMARY_H_INDEX_TERMS_SIZE",
+    "CITATIONS_BY_YEAR_ENGINE",
+    "CITATIONS_BY_YEAR_MAX_YEARS",
+    "CONFERENCES_FILTERS",
+    "EXPERIMENTS_FILTERS",
+    "HEP_FILTERS",
+    "JOBS_FILTERS",
+    "SEMINARS_FILTERS",
+    "SUBJECT_MISSING_VALUE",
+]
 FORBIDDEN_MIMETYPES_FOR_API_FILTERING = [
     "application/vnd+inspire.record.ui+json",
     "application/x-bibtex",
@@ -13,3 +34,24 @@ FORBIDDEN_MIMETYPES_FOR_API_FILTERING = [
     "application/vnd+inspire.latex.eu+x-latex",
     "application/vnd+inspire.latex.us+x-latex",
 ]
+# Aggregation used to compute the h-indexes of the citation summary:
+# "scripted_metric" sorts all the citation counts in a painless script,
+# "terms" gets the number of papers per distinct citation count.
+CITATION_SUMMARY_H_INDEX_ENGINE = "scripted_metric"
+CITATION_SUMMARY_H_INDEX_TERMS_SIZE = 10000
+# Aggregation used to compute the citations by year graph:
+# "scripted_metric" sums the citations by year of ``_source`` in a painless script,
+# "nested" sums their doc values, it needs records-hep to be rebuilt with
+# ``citations_by_year`` mapped as nested field.
+CITATIONS_BY_YEAR_ENGINE = "scripted_metric"
+# Maximum number of years in the citations by year graph, with the "nested" engine
+CITATIONS_BY_YEAR_MAX_YEARS = 500
+# Maximum number of values in ``terms`` queries and ``mget`` requests made to
+# get records by their identifiers, bigger lists are split
+SEARCH_TERMS_QUERY_MAX_SIZE = 1000
+# Streaming export of literature searches: results read by every scroll
+# request and exports allowed per user (or IP) in every window of seconds
+SEARCH_EXPORT_SCAN_SIZE = 500
+SEARCH_EXPORT_SCROLL = "5m"
+SEARCH_EXPORT_RATE_LIMIT = 10
+SEARCH_EXPORT_RATE_LIMIT_WINDOW = 3600
@@ -25,3 +25,36 @@ class FieldsParamForbidden(BaseRestError):
     description = (
         "'fields' parameter cannot be used with the requested format or MIME type."
     )
+
+
+class InvalidSearchAfterCursor(BaseRestError):
+    code = 400
+    description = "Invalid 'search_after' cursor."
+
+
+class SearchAfterWithPageForbidden(BaseRestError):
+    code = 400
+    description = "'search_after' parameter cannot be used with 'page'."
+
+
+class SearchAfterWithExportForbidden(BaseRestError):
+    code = 400
+    description = "'search_after' parameter cannot be used with the export."
+
+
+class ExportFormatNotSupported(BaseRestError):
+    code = 400
+
+    def __init__(self, formats=None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if formats:
+            self.description = (
+                f"Export format not supported, use one of: {', '.join(formats)}."
+            )
+        else:
+            self.description = "Export format not supported."
+
+
+class ExportRateLimitExceeded(BaseRestError):
+    code = 429
+    description = "Too many exports, try again later."
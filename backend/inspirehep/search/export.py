@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+"""Streaming export of the results of literature searches.
+
+The results are read with the ES scan API and written one by one, so the
+memory used doesn't depend on the number of results. They are written in the
+requested order, the scan is unordered only without sort. BibTeX and LaTeX are
+taken from the display fields computed at index time.
+"""
+
+from time import time
+
+import orjson
+import structlog
+from flask import current_app, request
+from flask_login import current_user
+from redis import RedisError
+
+from inspirehep.accounts.api import is_superuser_or_cataloger_logged_in
+from inspirehep.records.marshmallow.literature import (
+    LiteratureAdminSchema,
+    LiteraturePublicListSchema,
+)
+from inspirehep.search.api import LiteratureSearch
+from inspirehep.search.errors import (
+    ExportFormatNotSupported,
+    ExportRateLimitExceeded,
+    SearchAfterWithExportForbidden,
+)
+from inspirehep.search.factories.search import search_factory_without_aggs
+from inspirehep.utils import get_redis
+
+LOGGER = structlog.getLogger()
+
+# format: (mimetype, file extension, display field)
+EXPORT_FORMATS = {
+    "json": ("application/x-ndjson", "jsonl", None),
+    "bibtex": ("application/x-bibtex", "bib", "_bibtex_display"),
+    "latex-eu": ("application/x-latex", "tex", "_latex_eu_display"),
+    "latex-us": ("application/x-latex", "tex", "_latex_us_display"),
+}
+
+
+def get_export_format(requested_format):
+    if requested_format not in EXPORT_FORMATS:
+        raise ExportFormatNotSupported(EXPORT_FORMATS)
+    return EXPORT_FORMATS[requested_format]
+
+
+def check_export_rate_limit():
+    """Allow ``SEARCH_EXPORT_RATE_LIMIT`` exports per user, or IP for anonymous
+    users, in every window of ``SEARCH_EXPORT_RATE_LIMIT_WINDOW`` seconds."""
+    limit = current_app.config["SEARCH_EXPORT_RATE_LIMIT"]
+    if not limit:
+        return
+    window = current_app.config["SEARCH_EXPORT_RATE_LIMIT_WINDOW"]
+    if current_user.is_authenticated:
+        identity = f"user:{current_user.get_id()}"
+    else:
+        identity = f"ip:{request.remote_addr}"
+    key = f"search:export:rate:{identity}:{int(time() // window)}"
+    try:
+        with get_redis().pipeline() as pipeline:
+            pipeline.incr(key)
+            pipeline.expire(key, window)
+            exports, _ = pipeline.execute()
+    except RedisError:
+        LOGGER.exception("Cannot check export rate limit", identity=identity)
+        return
+    if exports > limit:
+        raise ExportRateLimitExceeded()
+
+
+def get_export_search(display_field):
+    # the whole result is scrolled, a scroll can't start after a cursor
+    if "search_after" in request.values:
+        raise SearchAfterWithExportForbidden()
+    search, _ = search_factory_without_aggs(None, LiteratureSearch())
+    if display_field:
+        search = search.source([display_field])
+    elif not request.values.get("fields"):
+        search = search.source(
+            {
+                "excludes": current_app.config[
+                    "LITERATURE_SOURCE_EXCLUDES_BY_CONTENT_TYPE"
+                ]["application/json"]
+            }
+        )
+    return search.params(
+        size=current_app.config["SEARCH_EXPORT_SCAN_SIZE"],
+        scroll=current_app.config["SEARCH_EXPORT_SCROLL"],
+        preserve_order="sort" in search.to_dict(),
+    )
+
+
+def export_json(search):
+    if is_superuser_or_cataloger_logged_in():
+        schema = LiteratureAdminSchema()
+    else:
+        schema = LiteraturePublicListSchema()
+    for hit in search.scan():
+        yield orjson.dumps(schema.dump(hit.to_dict()).data) + b"\n"
+
+
+def export_display(search, display_field):
+    for hit in search.scan():
+        display = getattr(hit, display_field, None)
+        if display:
+            yield f"{display}\n\n"
+
+
+def export_literature(requested_format):
+    """Return the generator of the export and its mimetype and file extension.
+
+    The request is validated here, ES is searched only once the generator is
+    consumed.
+    """
+    mimetype, extension, display_field = get_export_format(requested_format)
+    search = get_export_search(display_field)
+    if display_field:
+        return export_display(search, display_field), mimetype, extension
+    return export_json(search), mimetype, extension
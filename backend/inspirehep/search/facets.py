@@ -360,19 +360,8 @@ def records_hep(order=None):
     }
 
 
-def citation_summary():
-    excluded_filters = [
-        "citeable",
-        "refereed",
-        "citation_count",
-        "citation_count_without_self_citations",
-    ]
-    filters = get_filters_without_excluded(hep_filters(), excluded_filters)
-    if "exclude-self-citations" in request.values:
-        field = "citation_count_without_self_citations"
-    else:
-        field = "citation_count"
-
+def h_index_scripted_metric_aggregation(field):
+    """Compute h-indexes by sorting all the citation counts in the reduce phase."""
     map_script = (
         "if (doc.refereed.length >0 && doc.refereed[0]) {"
         f"    state.citations_refereed.add(doc.{field}[0])"
@@ -400,20 +389,101 @@ def citation_summary():
         }
         return ['published': i, 'all': j]
     """
+    return {
+        "scripted_metric": {
+            "init_script": "state.citations_non_refereed = []; state.citations_refereed = []",
+            "map_script": minify_painless(map_script),
+            "combine_script": "return state",
+            "reduce_script": minify_painless(reduce_script),
+        }
+    }
+
+
+def h_index_terms_aggregation(field):
+    """Compute h-indexes from the number of papers per citation count.
+
+    Only the distinct citation counts are returned by ES, the h-indexes are
+    computed from them by ``get_h_index_from_terms_aggregation``.
+    """
+    return {
+        "filters": {
+            "filters": {
+                "published": {"term": {"refereed": "true"}},
+                "all": {"match_all": {}},
+            }
+        },
+        "aggs": {
+            "citation_counts": {
+                "terms": {
+                    "field": field,
+                    "order": {"_key": "desc"},
+                    "size": current_app.config["CITATION_SUMMARY_H_INDEX_TERMS_SIZE"],
+                }
+            }
+        },
+        "meta": {"h_index_engine": "terms"},
+    }
+
+
+def get_h_index(citation_counts_buckets):
+    """Compute the h-index from the number of papers per citation count.
+
+    Args:
+        citation_counts_buckets (list): terms buckets of the citation counts,
+            sorted from the highest citation count.
+
+    Returns:
+        int: the highest ``h`` such that ``h`` papers have at least ``h``
+            citations.
+    """
+    h_index = 0
+    papers_count = 0
+    for bucket in citation_counts_buckets:
+        papers_count += bucket["doc_count"]
+        h_index = max(h_index, min(int(bucket["key"]), papers_count))
+    return h_index
+
+
+def get_h_index_from_terms_aggregation(aggregation):
+    """Convert the result of ``h_index_terms_aggregation`` to the result of
+    ``h_index_scripted_metric_aggregation``."""
+    return {
+        "value": {
+            name: get_h_index(bucket["citation_counts"]["buckets"])
+            for name, bucket in aggregation["buckets"].items()
+        }
+    }
+
+
+H_INDEX_AGGREGATIONS = {
+    "scripted_metric": h_index_scripted_metric_aggregation,
+    "terms": h_index_terms_aggregation,
+}
+
+
+def citation_summary():
+    excluded_filters = [
+        "citeable",
+        "refereed",
+        "citation_count",
+        "citation_count_without_self_citations",
+    ]
+    filters = get_filters_without_excluded(hep_filters(), excluded_filters)
+    if "exclude-self-citations" in request.values:
+        field = "citation_count_without_self_citations"
+    else:
+        field = "citation_count"
+
+    h_index_aggregation = H_INDEX_AGGREGATIONS[
+        current_app.config["CITATION_SUMMARY_H_INDEX_ENGINE"]
+    ]
     return {
         "filters": {**filters},
         "aggs": {
             "citation_summary": {
                 "filter": {"term": {"citeable": "true"}},
                 "aggs": {
-                    "h-index": {
-                        "scripted_metric": {
-                            "init_script": "state.citations_non_refereed = []; state.citations_refereed = []",
-                            "map_script": minify_painless(map_script),
-                            "combine_script": "return state",
-                            "reduce_script": minify_painless(reduce_script),
-                        }
-                    },
+                    "h-index": h_index_aggregation(field),
                     "citations": {
                         "filters": {
                             "filters": {
@@ -446,18 +516,8 @@ def citation_summary():
     }
 
 
-def citations_by_year():
-    excluded_filters = [
-        "citeable",
-        "refereed",
-        "citation_count",
-        "citation_count_without_self_citations",
-        "author_count",
-        "earliest_date",
-        "collaboration",
-    ]
-    filters = get_filters_without_excluded(hep_filters(), excluded_filters)
-
+def citations_by_year_scripted_metric_aggregation():
+    """Sum the citations by year of the ``_source`` of every record."""
     map_script = """
         def years = params._source.citations_by_year != null ? params._source.citations_by_year : [];
         for (element in years) {
@@ -475,20 +535,72 @@ def citations_by_year():
         return results
     """
     return {
-        "filters": {**filters},
-        "filter": {"term": {"citeable": "true"}},
+        "scripted_metric": {
+            "map_script": minify_painless(map_script),
+            "combine_script": "return state",
+            "reduce_script": minify_painless(reduce_script),
+        }
+    }
+
+
+def citations_by_year_nested_aggregation():
+    """Sum the citations by year with the doc values of the nested field.
+
+    It needs the mapping of ``citations_by_year`` as nested field.
+    """
+    return {
+        "nested": {"path": "citations_by_year"},
         "aggs": {
-            "citations_by_year": {
-                "scripted_metric": {
-                    "map_script": minify_painless(map_script),
-                    "combine_script": "return state",
-                    "reduce_script": minify_painless(reduce_script),
-                }
+            "years": {
+                "terms": {
+                    "field": "citations_by_year.year",
+                    "size": current_app.config["CITATIONS_BY_YEAR_MAX_YEARS"],
+                },
+                "aggs": {"count": {"sum": {"field": "citations_by_year.count"}}},
             }
         },
     }
 
 
+def get_citations_by_year_from_nested_aggregation(aggregation):
+    """Convert the result of ``citations_by_year_nested_aggregation`` to the
+    result of ``citations_by_year_scripted_metric_aggregation``."""
+    return {
+        "value": {
+            str(bucket["key"]): int(bucket["count"]["value"])
+            for bucket in aggregation["years"]["buckets"]
+        }
+    }
+
+
+CITATIONS_BY_YEAR_AGGREGATIONS = {
+    "scripted_metric": citations_by_year_scripted_metric_aggregation,
+    "nested": citations_by_year_nested_aggregation,
+}
+
+
+def citations_by_year():
+    excluded_filters = [
+        "citeable",
+        "refereed",
+        "citation_count",
+        "citation_count_without_self_citations",
+        "author_count",
+        "earliest_date",
+        "collaboration",
+    ]
+    filters = get_filters_without_excluded(hep_filters(), excluded_filters)
+
+    citations_by_year_aggregation = CITATIONS_BY_YEAR_AGGREGATIONS[
+        current_app.config["CITATIONS_BY_YEAR_ENGINE"]
+    ]
+    return {
+        "filters": {**filters},
+        "filter": {"term": {"citeable": "true"}},
+        "aggs": {"citations_by_year": citations_by_year_aggregation()},
+    }
+
+
 def records_jobs(order=None):
     if order is None:
         order = count(start=1)
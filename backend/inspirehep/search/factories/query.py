@@ -4,11 +4,61 @@
 #
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
+from copy import deepcopy
+from datetime import date
+
 import inspire_query_parser
 from elasticsearch_dsl import Q
 from flask import current_app
+from prometheus_client import Counter
 
 from inspirehep.search.utils import RecursionLimit
+from inspirehep.utils import LRUCache
+
+parsed_query_cache_requests = Counter(
+    "search_parsed_query_cache_requests",
+    "Parsing of search queries, by cache hit, miss or eviction.",
+    ["result"],
+)
+
+
+class ParsedQueryCache:
+    """In-process LRU cache of the queries parsed by the query parser.
+
+    The parsed queries are returned as copies, as the ES DSL objects built
+    from them can be modified. The parser converts relative dates (e.g.
+    ``today``, ``last month``) to absolute ones, so the queries are cached by
+    the current date too.
+    """
+
+    def __init__(self):
+        self.parsed_queries = LRUCache(parsed_query_cache_requests)
+
+    def get(self, query_string):
+        max_size = current_app.config.get("SEARCH_PARSED_QUERY_CACHE_SIZE", 0)
+        if not max_size:
+            return self.parse(query_string)
+
+        key = (date.today(), query_string)
+        parsed_query = self.parsed_queries.get(key)
+        if parsed_query is not None:
+            return deepcopy(parsed_query)
+
+        parsed_query = self.parse(query_string)
+        if not isinstance(parsed_query, dict):
+            return parsed_query
+        self.parsed_queries.set(key, deepcopy(parsed_query), max_size)
+        return parsed_query
+
+    @staticmethod
+    def parse(query_string):
+        return inspire_query_parser.parse_query(query_string)
+
+    def clear(self):
+        self.parsed_queries.clear()
+
+
+parsed_query_cache = ParsedQueryCache()
 
 
 def inspire_query_factory():
@@ -16,6 +66,6 @@ def inspire_query_factory():
 
     def inspire_query(query_string, search):
         with RecursionLimit(current_app.config.get("SEARCH_MAX_RECURSION_LIMIT", 5000)):
-            return Q(inspire_query_parser.parse_query(query_string))
+            return Q(parsed_query_cache.get(query_string))
 
     return inspire_query
@@ -6,11 +6,11 @@
 # the terms of the MIT License; see LICENSE file for more details.
 
 import structlog
-from flask import current_app, request
+from flask import current_app, g, request
 from invenio_records_rest.errors import InvalidQueryRESTError
 from invenio_records_rest.sorter import default_sorter_factory
 
-from ..errors import FieldsParamForbidden
+from ..errors import FieldsParamForbidden, SearchAfterWithPageForbidden
 from .facet import inspire_facets_factory
 from .filter import inspire_filter_factory
 
@@ -47,6 +47,22 @@ def get_search_with_source(search):
     return search
 
 
+def get_search_with_search_after(search):
+    """Paginate with ``search_after`` when the ``search_after`` parameter is given.
+
+    The first page is requested with an empty ``search_after`` and the next
+    ones with the cursor in the ``next`` link of the previous page. The size of
+    the page is kept in ``g.search_after_size`` for the ``next`` link.
+    """
+    if "search_after" not in request.values:
+        return search
+    if request.values.get("page", 1, type=int) != 1:
+        raise SearchAfterWithPageForbidden()
+    search = search.with_search_after(request.values.get("search_after", type=str))
+    g.search_after_size = search.to_dict().get("size", 10)
+    return search
+
+
 def inspire_search_factory(self, search):
     query_string = request.values.get("q", "")
 
@@ -70,7 +86,8 @@ def search_factory_with_aggs(self, search):
     for key, value in sortkwargs.items():
         urlkwargs.add(key, value)
 
-    search = get_search_with_source(search)
+    search = get_search_with_source(search).with_results_cache()
+    search = get_search_with_search_after(search)
 
     urlkwargs.add("q", query_string)
     return search, urlkwargs
@@ -87,6 +104,7 @@ def search_factory_without_aggs(self, search):
         urlkwargs.add(key, value)
 
     search = get_search_with_source(search)
+    search = get_search_with_search_after(search)
 
     urlkwargs.add("q", query_string)
     return search, urlkwargs
@@ -99,6 +117,6 @@ def search_factory_only_with_aggs(self, search):
     search, urlkwargs = inspire_filter_factory(search, search_index)
 
     # make sure no hits are returned
-    search = search.params(size=0)
+    search = search.params(size=0).with_results_cache()
     urlkwargs.add("q", query_string)
     return search, urlkwargs
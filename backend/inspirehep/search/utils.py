@@ -5,13 +5,19 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 import sys
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64DecodeError
 from contextlib import AbstractContextManager
+from copy import deepcopy
+from functools import lru_cache
 
+import orjson
 from flask import current_app, request
 from six import string_types
 from werkzeug.utils import import_string
 
 from inspirehep.accounts.api import is_superuser_or_cataloger_logged_in
+from inspirehep.search.errors import InvalidSearchAfterCursor
 
 
 def get_facet_configuration(search_index):
@@ -29,13 +35,47 @@ def get_facet_configuration(search_index):
     """
     facet_name = request.values.get("facet_name")
 
-    if is_superuser_or_cataloger_logged_in():
+    is_cataloger = is_superuser_or_cataloger_logged_in()
+    if is_cataloger:
         facet_data = current_app.config["CATALOGER_RECORDS_REST_FACETS"]
     else:
         facet_data = current_app.config["RECORDS_REST_FACETS"]
 
     facet = facet_data.get(facet_name) or facet_data.get(search_index)
 
+    if isinstance(facet, string_types) or callable(facet):
+        request_signature = tuple(
+            (parameter, tuple(request.values.getlist(parameter)))
+            for parameter in current_app.config["SEARCH_FACETS_REQUEST_PARAMETERS"]
+        )
+        config_signature = orjson.dumps(
+            {
+                parameter: current_app.config.get(parameter)
+                for parameter in current_app.config["SEARCH_FACETS_CONFIG_PARAMETERS"]
+            },
+            default=repr,
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return deepcopy(
+            _build_facet_configuration(
+                facet, is_cataloger, request_signature, config_signature
+            )
+        )
+    return facet
+
+
+@lru_cache(maxsize=1024)
+def _build_facet_configuration(
+    facet, is_cataloger, request_signature, config_signature
+):
+    """Build the facet configuration, once per role, request and config signature.
+
+    The facets are built from the request parameters listed in
+    ``SEARCH_FACETS_REQUEST_PARAMETERS`` and the settings listed in
+    ``SEARCH_FACETS_CONFIG_PARAMETERS``, so their values (the signatures) are
+    part of the cache key, even if the builders read them from the request
+    and the config.
+    """
     if isinstance(facet, string_types):
         facet = import_string(facet)
 
@@ -60,3 +100,19 @@ class RecursionLimit(AbstractContextManager):
 
     def __exit__(self, exc_type, exc_value, traceback):
         sys.setrecursionlimit(self.original_limit)
+
+
+def encode_search_after_cursor(sort_values):
+    """Encode the sort values of the last hit of a page as ``search_after`` cursor."""
+    return urlsafe_b64encode(orjson.dumps(sort_values)).decode("ascii")
+
+
+def decode_search_after_cursor(cursor):
+    """Decode a ``search_after`` cursor to the sort values to search after."""
+    try:
+        sort_values = orjson.loads(urlsafe_b64decode(cursor.encode("ascii")))
+    except (Base64DecodeError, UnicodeEncodeError, orjson.JSONDecodeError):
+        raise InvalidSearchAfterCursor()
+    if not isinstance(sort_values, list):
+        raise InvalidSearchAfterCursor()
+    return sort_values
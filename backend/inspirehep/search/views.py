@@ -5,9 +5,10 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
-from flask import Blueprint, abort, request
+from flask import Blueprint, Response, abort, request, stream_with_context
 from inspire_query_parser import parse_query
 
+from inspirehep.search.export import check_export_rate_limit, export_literature
 from inspirehep.serializers import jsonify
 
 blueprint = Blueprint("inspirehep_search", __name__, url_prefix="/search")
@@ -21,3 +22,15 @@ def query_parser():
         return jsonify(result)
     except Exception:
         abort(400)
+
+
+@blueprint.route("/export/literature", methods=["GET"])
+def export_literature_search():
+    requested_format = request.values.get("format", "json", type=str)
+    export, mimetype, extension = export_literature(requested_format)
+    check_export_rate_limit()
+    return Response(
+        stream_with_context(export),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename=literature.{extension}"},
+    )
@@ -10,14 +10,19 @@ import orjson
 import pytz
 from elasticsearch_dsl import Q
 from flask import current_app, request
+from inspire_utils.record import get_value
 from invenio_records_rest.serializers.json import (
     JSONSerializer as InvenioJSONSerializer,
 )
 from invenio_search.utils import build_alias_name
 
 from inspirehep.accounts.api import is_user_logged_in
-from inspirehep.records.links import inspire_search_links
+from inspirehep.records.links import inspire_search_after_links, inspire_search_links
 from inspirehep.search.api import LiteratureSearch
+from inspirehep.search.facets import (
+    get_citations_by_year_from_nested_aggregation,
+    get_h_index_from_terms_aggregation,
+)
 
 
 class ORJSONSerializerMixin:
@@ -62,6 +67,8 @@ class JSONSerializer(ORJSONSerializerMixin, InvenioJSONSerializer):
         :param search_result: Elasticsearch search result.
         :param links: Dictionary of links to add to response.
         """
+        if request and "search_after" in request.values:
+            links = inspire_search_after_links(links, search_result)
         links = inspire_search_links(links)
         data = dict(
             hits=dict(
@@ -132,9 +139,19 @@ class JSONSerializerFacets(ORJSONSerializerMixin, InvenioJSONSerializer):
             ``inspirehep.search.factories.search.search_factory_only_with_aggs``.
         """
 
-        search_result["aggregations"] = self.flatten_aggregations(
-            search_result.get("aggregations", {})
-        )
+        aggregations = search_result.get("aggregations", {})
+        h_index = get_value(aggregations, "citation_summary.h-index", {})
+        if get_value(h_index, "meta.h_index_engine") == "terms":
+            aggregations["citation_summary"][
+                "h-index"
+            ] = get_h_index_from_terms_aggregation(h_index)
+        if "years" in aggregations.get("citations_by_year", {}):
+            aggregations[
+                "citations_by_year"
+            ] = get_citations_by_year_from_nested_aggregation(
+                aggregations["citations_by_year"]
+            )
+        search_result["aggregations"] = self.flatten_aggregations(aggregations)
 
         return orjson.dumps(search_result, **self._format_args())
 
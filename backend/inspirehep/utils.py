@@ -8,9 +8,12 @@
 import hashlib
 import resource
 import signal
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from functools import partial
 from math import ceil
+from time import monotonic
 
 import structlog
 from flask import current_app
@@ -21,6 +24,11 @@ from redis_lock import Lock
 LOGGER = structlog.getLogger()
 
 
+def get_redis():
+    redis_url = current_app.config.get("CACHE_REDIS_URL")
+    return StrictRedis.from_url(redis_url, decode_responses=True)
+
+
 def include_table_check(object, name, type_, *args, **kwargs):
     if type_ == "table" and name in current_app.config.get("ALEMBIC_SKIP_TABLES"):
         return False
@@ -174,3 +182,43 @@ def _exit_handler(record_uuids, task_name, signum, frame):
 def setup_celery_task_signals(record_ids, task_name):
     signal.signal(signal.SIGINT, partial(_exit_handler, record_ids, task_name))
     signal.signal(signal.SIGTERM, partial(_exit_handler, record_ids, task_name))
+
+
+class LRUCache:
+    """In-process LRU cache, shared by the threads of the process.
+
+    The hits, misses and evictions are counted by ``requests_counter``, a
+    prometheus counter with the ``result`` label. The size and the timeout
+    are given on every call, so they can be read from the config.
+    """
+
+    def __init__(self, requests_counter):
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+        self.requests_counter = requests_counter
+
+    def get(self, key):
+        """Return the cached value of the key, or ``None``."""
+        with self.lock:
+            value, expiration_time = self.items.get(key, (None, None))
+            if expiration_time is not None and expiration_time <= monotonic():
+                del self.items[key]
+                value = None
+            if value is not None:
+                self.items.move_to_end(key)
+        self.requests_counter.labels(result="miss" if value is None else "hit").inc()
+        return value
+
+    def set(self, key, value, max_size, timeout=None):
+        """Cache the value, at most ``max_size`` values for ``timeout`` seconds."""
+        expiration_time = monotonic() + timeout if timeout else None
+        with self.lock:
+            self.items[key] = (value, expiration_time)
+            self.items.move_to_end(key)
+            while len(self.items) > max_size:
+                self.items.popitem(last=False)
+                self.requests_counter.labels(result="eviction").inc()
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
@@ -33,6 +33,15 @@ def get_index_alias(index):
     return build_alias_name(index, app=current_app)
 
 
+def get_counter_value(counter, **labels):
+    """Get the current value of a prometheus counter, for the given labels."""
+    for metric in counter.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total") and sample.labels == labels:
+                return sample.value
+    return 0
+
+
 def create_pidstore(object_uuid, pid_type, pid_value):
     return PersistentIdentifierFactory(
         object_uuid=object_uuid, pid_type=pid_type, pid_value=pid_value
@@ -56,6 +56,7 @@ def celery_worker_parameters():
             "celery",
             "matcher",
             "indexer_task",
+            "indexer_references",
             "assign",
             "disambiguation",
         ],
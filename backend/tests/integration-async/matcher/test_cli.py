@@ -5,10 +5,13 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+from datetime import date
+
 from helpers.utils import create_record_async, es_search, retry_until_pass
 from inspire_utils.record import get_value
 from invenio_search import current_search
 
+from inspirehep.matcher.cli import _get_uuids_of_records_citing_records_since
 from inspirehep.records.api import LiteratureRecord
 
 
@@ -57,3 +60,98 @@ def test_match_references(inspire_app, cli, clean_celery_session):
             get_value(updated_citer_record, "references[0].record")
             == cited_record["self"]
         )
+
+
+def test_match_references_since(inspire_app, cli, clean_celery_session):
+    cited_data = {
+        "document_type": ["article"],
+        "arxiv_eprints": [{"value": "1707.05013", "categories": ["hep-th"]}],
+    }
+    cited_record = create_record_async("lit", data=cited_data)
+    cited_record.index(delay=False)
+
+    citer_data = {"references": [{"reference": {"arxiv_eprint": "1707.05013"}}]}
+    citer_record = create_record_async("lit", data=citer_data)
+
+    def assert_all_records_are_indexed():
+        current_search.flush_and_refresh("*")
+        result = es_search("records-hep")
+        uuids = get_value(result, "hits.hits._id")
+        assert str(citer_record.id) in uuids
+
+    retry_until_pass(assert_all_records_are_indexed)
+
+    result = cli.invoke(["match", "references", "--since", "2100-01-01"])
+
+    assert result.exit_code == 0
+    citer_record = LiteratureRecord.get_record(citer_record.id)
+    assert "record" not in citer_record["references"][0]
+
+    today = date.today().isoformat()
+    result = cli.invoke(["match", "references", "--since", today])
+
+    assert result.exit_code == 0
+    citer_record = LiteratureRecord.get_record(citer_record.id)
+    assert get_value(citer_record, "references[0].record") == cited_record["self"]
+
+
+def test_match_references_since_checks_publication_info_by_reference(
+    inspire_app, clean_celery_session
+):
+    cited_data = {
+        "publication_info": [
+            {"journal_title": "Phys.Rev.D", "journal_volume": "98", "artid": "054504"}
+        ]
+    }
+    create_record_async("lit", data=cited_data)
+    citer_data = {
+        "references": [
+            {
+                "reference": {
+                    "publication_info": {
+                        "journal_title": "Phys.Rev.D",
+                        "journal_volume": "98",
+                        "artid": "054504",
+                    }
+                }
+            }
+        ]
+    }
+    citer_record = create_record_async("lit", data=citer_data)
+    not_citer_data = {
+        "references": [
+            {
+                "reference": {
+                    "publication_info": {
+                        "journal_title": "Phys.Rev.D",
+                        "journal_volume": "12",
+                        "artid": "054504",
+                    }
+                }
+            },
+            {
+                "reference": {
+                    "publication_info": {
+                        "journal_title": "Phys.Lett.B",
+                        "journal_volume": "98",
+                        "page_start": "1",
+                    }
+                }
+            },
+        ]
+    }
+    not_citer_record = create_record_async("lit", data=not_citer_data)
+
+    def assert_all_records_are_indexed():
+        current_search.flush_and_refresh("*")
+        result = es_search("records-hep")
+        uuids = get_value(result, "hits.hits._id")
+        assert str(citer_record.id) in uuids
+        assert str(not_citer_record.id) in uuids
+
+    retry_until_pass(assert_all_records_are_indexed)
+
+    uuids = list(_get_uuids_of_records_citing_records_since(date.today(), 100))
+
+    assert str(citer_record.id) in uuids
+    assert str(not_citer_record.id) not in uuids
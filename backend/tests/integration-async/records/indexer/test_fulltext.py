@@ -316,6 +316,8 @@ def test_index_records_batch_fulltext_manually(
             "success_count": 2,
             "failures_count": 0,
             "failures": [],
+            "elapsed_time": mock.ANY,
+            "es_bulk_time": mock.ANY,
         }
 
 
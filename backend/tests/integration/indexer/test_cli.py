@@ -9,6 +9,7 @@ import random
 import re
 
 import mock
+import orjson
 import pytest
 from elasticsearch import NotFoundError
 from elasticsearch.client.ingest import IngestClient
@@ -18,6 +19,7 @@ from invenio_search import current_search
 from invenio_search.utils import build_index_name
 
 from inspirehep.indexer.cli import FULLTEXT_PIPELINE_SETUP
+from inspirehep.indexer.tasks import batch_index
 from inspirehep.records.receivers import index_after_commit
 from inspirehep.search.api import (
     AuthorsSearch,
@@ -60,6 +62,53 @@ def test_reindex_one_type_of_record(inspire_app, cli):
     assert expected_aut_len == results_aut_len
 
 
+def test_reindex_saves_checkpoint(inspire_app, cli, tmpdir):
+    record_lit = create_record_factory("lit")
+    checkpoint_path = str(tmpdir.join("reindex.json"))
+
+    result = cli.invoke(["index", "reindex", "-p", "lit", "-c", checkpoint_path])
+    current_search.flush_and_refresh("*")
+
+    assert result.exit_code == 0
+    assert "lit: 1/1 records" in result.output
+    with open(checkpoint_path, "rb") as checkpoint_file:
+        checkpoint = orjson.loads(checkpoint_file.read())
+    expected_checkpoint = {
+        "pid_types": {"lit": {"last_uuid": str(record_lit.id), "completed": True}},
+        "failed_uuids": [],
+    }
+    assert checkpoint == expected_checkpoint
+    assert LiteratureSearch().execute().hits.hits[0]["_id"] == str(record_lit.id)
+
+
+def test_reindex_resumes_from_checkpoint_and_retries_failed_records(
+    inspire_app, cli, tmpdir
+):
+    record_lit = create_record_factory("lit")
+    failed_record_lit = create_record_factory("lit")
+    checkpoint_path = tmpdir.join("reindex.json")
+    checkpoint_path.write_binary(
+        orjson.dumps(
+            {
+                "pid_types": {"lit": {"last_uuid": None, "completed": True}},
+                "failed_uuids": [str(failed_record_lit.id)],
+            }
+        )
+    )
+
+    result = cli.invoke(
+        ["index", "reindex", "-p", "lit", "-c", str(checkpoint_path), "--resume"]
+    )
+    current_search.flush_and_refresh("*")
+
+    assert result.exit_code == 0
+    assert "Skipping 'lit', already reindexed." in result.output
+    hits = LiteratureSearch().execute().hits.hits
+    assert [hit["_id"] for hit in hits] == [str(failed_record_lit.id)]
+    assert str(record_lit.id) not in [hit["_id"] for hit in hits]
+    assert orjson.loads(checkpoint_path.read_binary())["failed_uuids"] == []
+
+
 @mock.patch("inspirehep.indexer.cli.batch_index_literature_fulltext")
 def test_reindex_one_type_of_record_with_fulltext(
     mock_index_fulltext, inspire_app, cli
@@ -91,6 +140,76 @@ def test_remap_one_index(inspire_app, cli):
     current_search._current_suffix = None
 
 
+def test_rebuild_index_swaps_alias_to_new_index(inspire_app, cli):
+    record = create_record_factory("lit", with_indexing=True)
+    alias = build_index_name("records-hep")
+    old_indexes = set(current_search.client.indices.get_alias(name=alias).keys())
+
+    result = cli.invoke(
+        [
+            "index",
+            "rebuild",
+            "--index",
+            "records-hep",
+            "--yes-i-know",
+            "--delete-old-indexes",
+        ]
+    )
+    current_search.flush_and_refresh("*")
+
+    assert result.exit_code == 0
+    new_indexes = set(current_search.client.indices.get_alias(name=alias).keys())
+    assert len(new_indexes) == 1
+    assert not new_indexes & old_indexes
+    assert not any(
+        current_search.client.indices.exists(index=old_index)
+        for old_index in old_indexes
+    )
+    assert LiteratureSearch.get_record_data_from_es(record)
+
+
+def test_rebuild_index_indexes_records_changed_during_alias_swap(inspire_app, cli):
+    create_record_factory("lit", with_indexing=True)
+    records_changed_during_swap = []
+    update_aliases = current_search.client.indices.update_aliases
+
+    def update_aliases_after_record_change(*args, **kwargs):
+        records_changed_during_swap.append(create_record_factory("lit"))
+        return update_aliases(*args, **kwargs)
+
+    with mock.patch.object(
+        current_search.client.indices,
+        "update_aliases",
+        side_effect=update_aliases_after_record_change,
+    ):
+        result = cli.invoke(
+            ["index", "rebuild", "--index", "records-hep", "--yes-i-know"]
+        )
+    current_search.flush_and_refresh("*")
+
+    assert result.exit_code == 0
+    record = records_changed_during_swap[0]
+    assert LiteratureSearch.get_record_data_from_es(record)
+
+
+def test_rebuild_index_uses_fulltext_task_for_literature(
+    inspire_app, cli, override_config
+):
+    create_record_factory("lit", with_indexing=True)
+
+    with override_config(FEATURE_FLAG_ENABLE_FULLTEXT=True), mock.patch(
+        "inspirehep.indexer.cli.batch_index_literature_fulltext", wraps=batch_index
+    ) as fulltext_task_mock:
+        result = cli.invoke(
+            ["index", "rebuild", "--index", "records-hep", "--yes-i-know"]
+        )
+
+    assert result.exit_code == 0
+    assert fulltext_task_mock.apply_async.called
+    index = fulltext_task_mock.apply_async.call_args[1]["kwargs"]["index"]
+    assert index.startswith("records-hep")
+
+
 def test_remap_two_indexex(inspire_app, cli):
     indexes_before = set(current_search.client.indices.get("*").keys())
     current_search._current_suffix = f"-{random.getrandbits(64)}"
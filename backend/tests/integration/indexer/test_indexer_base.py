@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+import uuid
+
+import mock
+from helpers.utils import create_record
+from invenio_search import current_search
+
+from inspirehep.indexer.base import InspireRecordIndexer
+from inspirehep.records.api import LiteratureRecord
+from inspirehep.search.api import AuthorsSearch, LiteratureSearch
+
+
+def test_bulk_index_indexes_records_of_different_types(inspire_app):
+    literature = create_record("lit")
+    author = create_record("aut")
+    LiteratureSearch().query("match_all").delete()
+    AuthorsSearch().query("match_all").delete()
+    current_search.flush_and_refresh("*")
+
+    result = InspireRecordIndexer().bulk_index([str(literature.id), str(author.id)])
+    current_search.flush_and_refresh("*")
+
+    assert result["success_count"] == 2
+    assert result["failures_count"] == 0
+    assert LiteratureSearch().execute().hits.hits[0]["_id"] == str(literature.id)
+    assert AuthorsSearch().execute().hits.hits[0]["_id"] == str(author.id)
+
+
+def test_bulk_index_removes_deleted_records(inspire_app):
+    record = create_record("lit")
+    record.delete()
+    current_search.flush_and_refresh("*")
+
+    InspireRecordIndexer().bulk_index([str(record.id)])
+    current_search.flush_and_refresh("*")
+
+    assert LiteratureSearch().execute().hits.total.value == 0
+
+
+def test_bulk_index_loads_records_with_one_query_per_batch(
+    inspire_app, override_config
+):
+    records_uuids = [str(create_record("lit").id) for _ in range(4)]
+
+    with override_config(INDEXER_BULK_DB_BATCH_SIZE=2), mock.patch(
+        "inspirehep.records.api.InspireRecord.get_record"
+    ) as get_record_mock:
+        result = InspireRecordIndexer().bulk_index(records_uuids)
+
+    assert result["success_count"] == 4
+    get_record_mock.assert_not_called()
+
+
+def test_bulk_index_skips_missing_records(inspire_app):
+    record = create_record("lit")
+
+    result = InspireRecordIndexer().bulk_index([str(record.id), str(uuid.uuid4())])
+
+    assert result["failures_count"] == 0
+
+
+def test_bulk_index_loads_each_linked_author_once_per_batch(inspire_app):
+    author = create_record(
+        "aut", data={"name": {"value": "Castle, Frank", "preferred_name": "Frank"}}
+    )
+    author_data = {
+        "full_name": "Castle, Frank",
+        "record": {"$ref": author["self"]["$ref"]},
+    }
+    records_uuids = [
+        str(
+            create_record(
+                "lit",
+                data={"authors": [author_data, {"full_name": "Smith, John"}]},
+            ).id
+        )
+        for _ in range(3)
+    ]
+    current_search.flush_and_refresh("*")
+
+    with mock.patch(
+        "inspirehep.records.api.literature.LiteratureRecord.get_authors_facet_names",
+        wraps=LiteratureRecord.get_authors_facet_names,
+    ) as get_authors_facet_names_mock:
+        result = InspireRecordIndexer().bulk_index(records_uuids)
+    current_search.flush_and_refresh("*")
+
+    assert result["success_count"] == 3
+    get_authors_facet_names_mock.assert_called_once()
+    expected_facet_author_name = [
+        f"{author['control_number']}_Frank",
+        "NOREC_John Smith",
+    ]
+    for hit in LiteratureSearch().execute().hits:
+        assert hit.facet_author_name == expected_facet_author_name
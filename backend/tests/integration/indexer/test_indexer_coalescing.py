@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+import pytest
+from elasticsearch import NotFoundError
+from helpers.providers.faker import faker
+from helpers.utils import get_counter_value
+from invenio_search import current_search
+
+from inspirehep.indexer.coalescing import (
+    COALESCED_FIRST_VERSIONS_KEY,
+    COALESCED_PROCESSING_KEYS,
+    indexer_coalesced_saved_operations,
+    take_coalesced_records,
+)
+from inspirehep.indexer.tasks import flush_coalesced_index_records
+from inspirehep.records.api import LiteratureRecord
+from inspirehep.search.api import LiteratureSearch
+
+
+def test_coalesced_commits_of_record_are_indexed_once(
+    inspire_app, redis, override_config
+):
+    saved_operations_before = get_counter_value(indexer_coalesced_saved_operations)
+    with override_config(FEATURE_FLAG_ENABLE_INDEXER_COALESCING=True):
+        record = LiteratureRecord.create(faker.record("lit"))
+        record.index()
+        for title in ["First title", "Final title"]:
+            data = dict(record)
+            data["titles"] = [{"title": title}]
+            record.update(data)
+            record.index()
+        assert redis.hlen(COALESCED_FIRST_VERSIONS_KEY) == 1
+
+        flush_coalesced_index_records()
+    current_search.flush_and_refresh("records-hep")
+
+    assert not redis.exists(COALESCED_FIRST_VERSIONS_KEY)
+    assert not redis.exists(*COALESCED_PROCESSING_KEYS.values())
+    record_from_es = LiteratureSearch.get_record_data_from_es(record)
+    assert record_from_es["titles"] == [{"title": "Final title"}]
+    assert (
+        get_counter_value(indexer_coalesced_saved_operations) - saved_operations_before
+        == 2
+    )
+
+
+def test_coalesced_records_of_interrupted_flush_are_indexed_by_next_flush(
+    inspire_app, redis, override_config
+):
+    with override_config(FEATURE_FLAG_ENABLE_INDEXER_COALESCING=True):
+        record = LiteratureRecord.create(faker.record("lit"))
+        record.index()
+        # a flush interrupted after taking the record
+        take_coalesced_records()
+        other_record = LiteratureRecord.create(faker.record("lit"))
+        other_record.index()
+
+        flush_coalesced_index_records()
+        current_search.flush_and_refresh("records-hep")
+        record_from_es = LiteratureSearch.get_record_data_from_es(record)
+        with pytest.raises(NotFoundError):
+            LiteratureSearch.get_record_data_from_es(other_record)
+
+        flush_coalesced_index_records()
+        current_search.flush_and_refresh("records-hep")
+        other_record_from_es = LiteratureSearch.get_record_data_from_es(other_record)
+
+    assert record_from_es["control_number"] == record["control_number"]
+    assert other_record_from_es["control_number"] == other_record["control_number"]
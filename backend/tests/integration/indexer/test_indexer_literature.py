@@ -39,6 +39,7 @@ def test_index_literature_record(inspire_app, datadir):
 
     result = response["hits"]["hits"][0]["_source"]
     result_ui_display = orjson.loads(result.pop("_ui_display"))
+    result_reference_display = orjson.loads(result.pop("_reference_display"))
     result_latex_us_display = result.pop("_latex_us_display")
     result_latex_eu_display = result.pop("_latex_eu_display")
     result_bibtex_display = result.pop("_bibtex_display")
@@ -49,6 +50,10 @@ def test_index_literature_record(inspire_app, datadir):
     assert response["hits"]["total"]["value"] == expected_count
     assert not DeepDiff(result, expected_metadata, ignore_order=True)
     assert result_ui_display == expected_metadata_ui_display
+    assert result_reference_display["control_number"] == record["control_number"]
+    assert (
+        result_reference_display["titles"] == expected_metadata_ui_display["titles"][:1]
+    )
     assert result_latex_us_display == expected_metadata_latex_us_display
     assert result_latex_eu_display == expected_metadata_latex_eu_display
     assert result_bibtex_display == expected_metadata_bibtex_display
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2019 CERN.
+#
+# inspirehep is free software; you can redistribute it and/or modify it under
+# the terms of the MIT License; see LICENSE file for more details.
+
+import uuid
+
+import mock
+
+from inspirehep.indexer.api import PENDING_REFERENCES_KEY, add_pending_references
+from inspirehep.indexer.tasks import (
+    batch_index_references,
+    schedule_references_indexing,
+)
+
+
+def test_schedule_references_indexing_sends_chunks_of_not_pending_records(
+    inspire_app, redis, override_config
+):
+    records_uuids = [str(uuid.uuid4()) for _ in range(5)]
+    add_pending_references(records_uuids[:1])
+
+    with override_config(INDEXER_REFERENCES_BATCH_SIZE=2), mock.patch(
+        "inspirehep.indexer.tasks.batch_index_references.apply_async"
+    ) as apply_async_mock:
+        schedule_references_indexing(set(records_uuids))
+
+    scheduled_chunks = [call[1]["args"][0] for call in apply_async_mock.call_args_list]
+    assert sorted(sum(scheduled_chunks, [])) == sorted(records_uuids[1:])
+    assert all(len(chunk) <= 2 for chunk in scheduled_chunks)
+    assert all(
+        call[1]["queue"] == "indexer_references"
+        for call in apply_async_mock.call_args_list
+    )
+    assert redis.zcard(PENDING_REFERENCES_KEY) == 5
+
+
+def test_batch_index_references_removes_records_from_pending(inspire_app, redis):
+    records_uuids = [str(uuid.uuid4()) for _ in range(2)]
+    add_pending_references(records_uuids)
+
+    batch_index_references(records_uuids)
+
+    assert not redis.exists(PENDING_REFERENCES_KEY)
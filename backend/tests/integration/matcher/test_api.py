@@ -5,17 +5,22 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+from copy import deepcopy
+
 import pytest
-from helpers.utils import create_record
+from helpers.utils import create_record, get_counter_value
 from inspire_schemas.api import load_schema, validate
 from inspire_utils.record import get_value
+from invenio_search import current_search
 from mock import patch
 
 from inspirehep.matcher.api import (
+    _multi_search,
     get_reference_from_grobid,
     match_reference,
     match_reference_control_numbers_with_relaxed_journal_titles,
     match_references,
+    match_references_batch,
 )
 
 
@@ -863,3 +868,167 @@ def test_match_references_doesnt_use_relaxed_title_matching(inspire_app):
     result = match_references(references)
 
     assert expected_ref == result["matched_references"][0]["record"]
+
+
+def test_match_references_batch_matches_like_match_reference(inspire_app):
+    arxiv_record = create_record(
+        "lit",
+        data={"arxiv_eprints": [{"value": "1707.05013", "categories": ["hep-th"]}]},
+    )
+    journal_record = create_record(
+        "lit",
+        data={
+            "publication_info": [
+                {
+                    "artid": "045",
+                    "journal_title": "JHEP",
+                    "journal_volume": "06",
+                    "page_start": "045",
+                    "year": 2007,
+                }
+            ]
+        },
+    )
+    references_lists = [
+        [
+            {"reference": {"arxiv_eprint": "1707.05013"}},
+            {"reference": {"title": {"title": "Not in INSPIRE"}}},
+        ],
+        [
+            {
+                "reference": {
+                    "publication_info": {
+                        "artid": "045",
+                        "journal_title": "JHEP",
+                        "journal_volume": "06",
+                        "page_start": "045",
+                        "year": 2007,
+                    }
+                }
+            },
+            {"reference": {"arxiv_eprint": "1707.05013"}},
+        ],
+    ]
+    expected_refs = [
+        [
+            get_value(match_reference(deepcopy(reference)), "record.$ref")
+            for reference in references
+        ]
+        for references in references_lists
+    ]
+
+    with patch(
+        "inspirehep.matcher.api._multi_search", wraps=_multi_search
+    ) as multi_search_mock:
+        results = match_references_batch(references_lists)
+
+    assert [
+        [
+            get_value(reference, "record.$ref")
+            for reference in result["matched_references"]
+        ]
+        for result in results
+    ] == expected_refs
+    assert expected_refs[0][0].endswith(f"/{arxiv_record['control_number']}")
+    assert expected_refs[1][0].endswith(f"/{journal_record['control_number']}")
+    assert (
+        results[1]["matched_references"][0]["reference"]["publication_info"]["year"]
+        == 2007
+    )
+    # at most one ``_msearch`` per config, for the references of both lists
+    assert multi_search_mock.call_count <= 5
+
+
+def test_match_references_batch_matches_unique_identifiers_with_pidstore(
+    inspire_app,
+):
+    record = create_record(
+        "lit",
+        data={
+            "arxiv_eprints": [{"value": "1707.05013", "categories": ["hep-th"]}],
+            "dois": [{"value": "10.1103/PhysRevD.96.084029"}],
+        },
+    )
+    references = [
+        {"reference": {"arxiv_eprint": "1707.05013"}},
+        {"reference": {"dois": ["10.1103/physrevd.96.084029"]}},
+    ]
+
+    with patch("inspirehep.matcher.api._multi_search") as multi_search_mock:
+        result = match_references(references)
+
+    expected_ref = f"http://localhost:5000/api/literature/{record['control_number']}"
+    assert [
+        get_value(reference, "record.$ref")
+        for reference in result["matched_references"]
+    ] == [expected_ref, expected_ref]
+    multi_search_mock.assert_not_called()
+
+
+def test_match_references_batch_unique_identifiers_from_pidstore_disabled(
+    inspire_app, override_config
+):
+    record = create_record(
+        "lit",
+        data={"arxiv_eprints": [{"value": "1707.05013", "categories": ["hep-th"]}]},
+    )
+    references = [{"reference": {"arxiv_eprint": "1707.05013"}}]
+
+    with override_config(REFERENCE_MATCHER_UNIQUE_IDENTIFIERS_FROM_PIDSTORE=False):
+        result = match_references(references)
+
+    assert get_value(result, "matched_references[0].record.$ref").endswith(
+        f"/{record['control_number']}"
+    )
+
+
+def test_match_references_batch_caches_matches_until_match_targets_are_deleted(
+    inspire_app, redis, override_config
+):
+    from inspirehep.matcher.cache import reference_matches_cache_requests
+
+    def get_cache_requests(result):
+        return get_counter_value(reference_matches_cache_requests, result=result)
+
+    def match_arxiv_eprint():
+        result = match_references([{"reference": {"arxiv_eprint": "1707.05013"}}])
+        return get_value(result, "matched_references[0].record.$ref")
+
+    record = create_record(
+        "lit",
+        data={"arxiv_eprints": [{"value": "1707.05013", "categories": ["hep-th"]}]},
+    )
+    hits_before, misses_before = get_cache_requests("hit"), get_cache_requests("miss")
+    with override_config(FEATURE_FLAG_ENABLE_REFERENCE_MATCHES_CACHE=True):
+        first, second = match_references_batch(
+            [
+                [{"reference": {"arxiv_eprint": "1707.05013"}}],
+                [{"reference": {"arxiv_eprint": "1707.05013"}}],
+            ]
+        )
+        with patch(
+            "inspirehep.matcher.api._get_matched_recids_by_config"
+        ) as get_matched_recids_mock:
+            cached = match_arxiv_eprint()
+        get_matched_recids_mock.assert_not_called()
+
+        record.delete()
+        record.index(delay=False)
+        current_search.flush_and_refresh("records-hep")
+        after_deletion = match_arxiv_eprint()
+
+        create_record(
+            "lit",
+            data={"arxiv_eprints": [{"value": "1707.05013", "categories": ["hep-th"]}]},
+        )
+        after_creation = match_arxiv_eprint()
+
+    expected_ref = f"http://localhost:5000/api/literature/{record['control_number']}"
+    assert get_value(first, "matched_references[0].record.$ref") == expected_ref
+    assert get_value(second, "matched_references[0].record.$ref") == expected_ref
+    assert cached == expected_ref
+    assert after_deletion is None
+    # new records are matched once the cached matches expire
+    assert after_creation is None
+    assert get_cache_requests("hit") - hits_before == 2
+    assert get_cache_requests("miss") - misses_before == 3
@@ -6,7 +6,10 @@
 # the terms of the MIT License; see LICENSE file for more details.
 
 from helpers.utils import create_record
+from invenio_db import db
+from mock import patch
 
+from inspirehep.matcher.cache import get_cached_journal_dict
 from inspirehep.matcher.utils import create_journal_dict
 
 
@@ -45,3 +48,35 @@ def test_create_journal_dict(inspire_app):
     result = create_journal_dict()
 
     assert expected == result
+
+
+def test_get_cached_journal_dict_is_rebuilt_on_journal_change(inspire_app, redis):
+    journal = create_record(
+        "jou",
+        data={
+            "journal_title": {"title": "Image and Vision Computing"},
+            "short_title": "Image Vision Comput.",
+        },
+    )
+
+    first = get_cached_journal_dict()
+    with patch("inspirehep.matcher.cache.create_journal_dict") as create_mock:
+        second = get_cached_journal_dict()
+    create_mock.assert_not_called()
+
+    journal["title_variants"] = ["IMAGE VISION - COMPUTING"]
+    journal.update(dict(journal))
+    before_commit = get_cached_journal_dict()
+    db.session.commit()
+    after_commit = get_cached_journal_dict()
+
+    assert (
+        first
+        == second
+        == {
+            "IMAGE AND VISION COMPUTING": "Image Vision Comput.",
+            "IMAGE VISION COMPUT": "Image Vision Comput.",
+        }
+    )
+    assert before_commit == first
+    assert after_commit["IMAGE VISION COMPUTING"] == "Image Vision Comput."
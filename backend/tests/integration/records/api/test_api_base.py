@@ -21,7 +21,7 @@ from jsonschema import ValidationError
 
 from inspirehep.pidstore.errors import WrongRedirectionPidStatus
 from inspirehep.pidstore.models import InspireRedirect
-from inspirehep.records.api import InspireRecord, LiteratureRecord
+from inspirehep.records.api import AuthorsRecord, InspireRecord, LiteratureRecord
 from inspirehep.records.errors import (
     CannotUndeleteRedirectedRecord,
     MissingSerializerError,
@@ -890,3 +890,18 @@ def test_get_records_batched_with_deleted(inspire_app):
 
     assert len(records) == 6
     assert [rec.id in ids for rec in records]
+
+
+def test_get_records_batched_returns_proper_subclasses(inspire_app):
+    literature = create_record("lit")
+    author = create_record("aut")
+
+    records = list(
+        InspireRecord.get_records_batched([literature.id, author.id], max_batch=1)
+    )
+    records_classes = {record.id: type(record) for record in records}
+
+    assert records_classes == {
+        literature.id: LiteratureRecord,
+        author.id: AuthorsRecord,
+    }
@@ -377,6 +377,7 @@ def test_dump_for_es(inspire_app):
     dump = record.serialize_for_es()
 
     assert "_ui_display" in dump
+    assert "_reference_display" in dump
     assert "_latex_us_display" in dump
     assert "_latex_eu_display" in dump
     assert "_bibtex_display" in dump
@@ -393,6 +394,11 @@ def test_dump_for_es(inspire_app):
     assert record["titles"] == ui_field["titles"]
     assert record["control_number"] == ui_field["control_number"]
 
+    reference_field = orjson.loads(dump["_reference_display"])
+    assert record["titles"][:1] == reference_field["titles"]
+    assert record["control_number"] == reference_field["control_number"]
+    assert "document_type" not in reference_field
+
 
 @freeze_time("1994-12-19")
 def test_dump_for_es_adds_latex_and_bibtex_displays(inspire_app):
@@ -2523,3 +2529,74 @@ def test_get_documents_for_fulltext_works_for_arxiv(inspire_app, s3):
     record = LiteratureRecord.create(record_data)
     serialized_data = record.serialize_for_es_with_fulltext()
     assert "text" in serialized_data["documents"][0]
+
+
+def test_fetch_document_fulltext_reuses_attachment_if_file_did_not_change(
+    inspire_app, s3
+):
+    create_s3_bucket(KEY)
+    bucket = current_s3_instance.get_bucket_for_file_key(KEY)
+    create_s3_file(bucket, KEY, "this is my data", ContentType="application/pdf")
+    etag = current_s3_instance.get_file_metadata(KEY)["ETag"]
+    document = {
+        "source": "arxiv",
+        "fulltext": True,
+        "key": KEY,
+        "filename": "2105.15193.pdf",
+        "url": "https://arxiv.org/pdf/2105.15193.pdf",
+    }
+    indexed_document = {
+        **document,
+        "_fulltext_etag": etag,
+        "attachment": {"content": "this is my data"},
+    }
+
+    with mock.patch.object(
+        current_s3_instance.client,
+        "get_object",
+        wraps=current_s3_instance.client.get_object,
+    ) as get_object_mock:
+        fulltext = LiteratureRecord.fetch_document_fulltext(
+            document, 1, indexed_document=indexed_document
+        )
+
+    assert fulltext == {
+        "attachment": {"content": "this is my data"},
+        "_fulltext_etag": etag,
+    }
+    get_object_mock.assert_called_once_with(Bucket=bucket, Key=KEY, IfNoneMatch=etag)
+
+    indexed_document["_fulltext_etag"] = '"outdated"'
+    fulltext = LiteratureRecord.fetch_document_fulltext(
+        document, 1, indexed_document=indexed_document
+    )
+
+    assert fulltext["_fulltext_etag"] == etag
+    assert "text" in fulltext
+    assert "attachment" not in fulltext
+
+
+def test_fetch_documents_fulltexts_skips_files_over_max_bytes(inspire_app, s3):
+    create_s3_bucket(KEY)
+    create_s3_file(
+        current_s3_instance.get_bucket_for_file_key(KEY),
+        KEY,
+        "this is my data",
+        ContentType="application/pdf",
+    )
+    data = {
+        "documents": [
+            {
+                "source": "arxiv",
+                "fulltext": True,
+                "key": KEY,
+                "filename": "2105.15193.pdf",
+                "url": "https://arxiv.org/pdf/2105.15193.pdf",
+            }
+        ]
+    }
+    records = [faker.record("lit", with_control_number=True, data=data)]
+
+    assert LiteratureRecord.fetch_documents_fulltexts(records, max_bytes=1) == [{}]
+    fulltexts = LiteratureRecord.fetch_documents_fulltexts(records, max_bytes=1000)
+    assert "text" in fulltexts[0][KEY]
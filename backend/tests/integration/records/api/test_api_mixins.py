@@ -779,3 +779,61 @@ def test_hard_delete_advisor_clears_entries_in_students_advisors_table(
     advisor.hard_delete()
 
     assert StudentsAdvisors.query.filter_by(student_id=student.id).count() == 0
+
+
+def test_prefetch_citation_aggregates_matches_per_record_queries(
+    inspire_app, enable_self_citations
+):
+    author_data = {
+        "authors": [
+            {
+                "full_name": "Jean-Luc Picard",
+                "ids": [{"schema": "INSPIRE BAI", "value": "Jean.L.Picard.1"}],
+            }
+        ]
+    }
+    cited = create_record("lit", data=author_data)
+    other_cited = create_record("lit")
+    citing = create_record(
+        "lit",
+        data={"preprint_date": "2019-05-01"},
+        literature_citations=[cited["control_number"], other_cited["control_number"]],
+    )
+    self_citing = create_record(
+        "lit",
+        data=dict(author_data, preprint_date="2020-05-01"),
+        literature_citations=[cited["control_number"]],
+    )
+
+    records = [
+        LiteratureRecord.get_record(record.id)
+        for record in (cited, other_cited, citing, self_citing)
+    ]
+    expected = [
+        (
+            record.citation_count,
+            record.citation_count_without_self_citations,
+            record.citations_by_year,
+            sorted(record.referenced_authors_bais),
+        )
+        for record in records
+    ]
+
+    LiteratureRecord.prefetch_citation_aggregates(records)
+    with mock.patch(
+        "inspirehep.records.api.mixins.CitationMixin._citation_query"
+    ) as citation_query_mock:
+        result = [
+            (
+                record.citation_count,
+                record.citation_count_without_self_citations,
+                record.citations_by_year,
+                sorted(record.referenced_authors_bais),
+            )
+            for record in records
+        ]
+
+    citation_query_mock.assert_not_called()
+    assert result == expected
+    assert result[0][0] == 2
+    assert result[0][1] == 1
@@ -11,7 +11,13 @@ from uuid import UUID
 import mock
 import orjson
 from helpers.providers.faker import faker
-from helpers.utils import create_record, create_record_factory, create_user, logout
+from helpers.utils import (
+    create_record,
+    create_record_factory,
+    create_user,
+    get_counter_value,
+    logout,
+)
 from invenio_accounts.testutils import login_user_via_session
 
 from inspirehep.accounts.roles import Roles
@@ -621,6 +627,38 @@ def test_literature_references_pagination(inspire_app):
     assert expected_result == response_data_metadata
 
 
+def test_literature_references_resolves_only_requested_page_and_caches_it(
+    inspire_app,
+):
+    from inspirehep.records.utils import reference_display_cache_requests
+
+    def get_cache_requests(result):
+        return get_counter_value(reference_display_cache_requests, result=result)
+
+    records = [create_record("lit", data=faker.record("lit")) for _ in range(4)]
+    data = faker.record(
+        "lit",
+        literature_citations=[record["control_number"] for record in records],
+    )
+    record_with_references = create_record("lit", data=data)
+    url = f"/literature/{record_with_references['control_number']}/references"
+    headers = {"Accept": "application/json"}
+
+    hits_before, misses_before = get_cache_requests("hit"), get_cache_requests("miss")
+    with inspire_app.test_client() as client:
+        first = client.get(url, query_string={"page": 1, "size": 2}, headers=headers)
+        second = client.get(url, query_string={"page": 1, "size": 2}, headers=headers)
+
+    expected_references = [
+        {"control_number": record["control_number"], "titles": record["titles"]}
+        for record in records[:2]
+    ]
+    assert first.json["metadata"]["references"] == expected_references
+    assert second.json["metadata"]["references"] == expected_references
+    assert get_cache_requests("miss") - misses_before == 2
+    assert get_cache_requests("hit") - hits_before == 2
+
+
 def test_literature_references_pagination_with_size_more_than_results(inspire_app):
     record1 = create_record("lit", data=faker.record("lit"))
     record2 = create_record("lit", data=faker.record("lit"))
@@ -5,6 +5,7 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 import mock
+from flask import current_app, g
 from helpers.utils import create_record
 from invenio_pidstore.models import PersistentIdentifier
 from werkzeug import MultiDict
@@ -12,8 +13,10 @@ from werkzeug import MultiDict
 from inspirehep.records.links import (
     find_record_endpoint,
     inspire_detail_links_factory,
+    inspire_search_after_links,
     inspire_search_links,
 )
+from inspirehep.search.utils import encode_search_after_cursor
 
 
 def test_record_endpoint_by_internal_type(inspire_app):
@@ -172,3 +175,25 @@ def test_search_links_with_fields_filtering(inspire_app, override_config):
             mock_request.values = MultiDict([("fields", "ids,authors")])
             links_test = inspire_search_links(links_test)
     assert links_test == expected_links_test
+
+
+def test_search_after_links_use_size_of_search(inspire_app):
+    links = {
+        "self": "http://localhost:5000/api/literature",
+        "next": "http://localhost:5000/api/literature?page=2",
+    }
+    search_result = {"hits": {"hits": [{"sort": [1]}, {"sort": [2]}]}}
+    with current_app.test_request_context("/api/literature?search_after="):
+        g.search_after_size = 2
+        result = inspire_search_after_links(dict(links), search_result)
+        g.search_after_size = 3
+        last_page_result = inspire_search_after_links(dict(links), search_result)
+
+    next_cursor = encode_search_after_cursor([2])
+    assert result == {
+        "self": "http://localhost:5000/api/literature?search_after=",
+        "next": f"http://localhost:5000/api/literature?search_after={next_cursor}",
+    }
+    assert last_page_result == {
+        "self": "http://localhost:5000/api/literature?search_after="
+    }
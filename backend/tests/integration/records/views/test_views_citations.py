@@ -113,6 +113,36 @@ def test_citation_summary_facet(inspire_app):
     assert len(response_data["hits"]["hits"]) == 0
 
 
+def test_citation_summary_facet_with_terms_h_index_engine(inspire_app, override_config):
+    unpublished_paper_data = {
+        "refereed": False,
+        "citation_count": 8,
+        "facet_author_name": "NOREC_N. Girard",
+        "citeable": True,
+    }
+    create_record_factory("lit", data=unpublished_paper_data, with_indexing=True)
+    for count in [409, 83, 26, 153, 114, 97, 137]:
+        data = {
+            "refereed": True,
+            "citation_count": count,
+            "facet_author_name": "NOREC_N. Girard",
+            "citeable": True,
+        }
+        create_record_factory("lit", data=data, with_indexing=True)
+
+    with override_config(
+        CITATION_SUMMARY_H_INDEX_ENGINE="terms"
+    ), inspire_app.test_client() as client:
+        response = client.get(
+            "/literature/facets?author=NOREC_N.%20Girard&facet_name=citation-summary"
+        )
+
+    assert response.status_code == 200
+    assert response.json["aggregations"]["citation_summary"]["h-index"] == {
+        "value": {"all": 8, "published": 7}
+    }
+
+
 def test_citation_summary_without_self_citations_facet(
     inspire_app, enable_self_citations
 ):
@@ -56,6 +56,29 @@ def test_literature_search_application_json_get(inspire_app):
     assert expected_data == response_data_metadata
 
 
+def test_literature_search_with_search_after(inspire_app):
+    records = [create_record("lit") for _ in range(3)]
+
+    with inspire_app.test_client() as client:
+        first_page = client.get(
+            "/api/literature", query_string={"size": 2, "search_after": ""}
+        )
+        next_url = first_page.json["links"]["next"]
+        second_page = client.get(next_url.replace("http://localhost:5000", ""))
+
+    assert first_page.status_code == 200
+    assert second_page.status_code == 200
+    assert "next" not in second_page.json["links"]
+    control_numbers = [
+        hit["metadata"]["control_number"]
+        for page in (first_page, second_page)
+        for hit in page.json["hits"]["hits"]
+    ]
+    assert sorted(control_numbers) == sorted(
+        record["control_number"] for record in records
+    )
+
+
 def test_literature_search_application_json_ui_get(inspire_app):
     data = {
         "control_number": 666,
@@ -678,6 +701,33 @@ def test_literature_citation_annual_summary_for_many_records(inspire_app):
     assert response.json["aggregations"]["citations_by_year"] == expected_response
 
 
+def test_literature_citation_annual_summary_with_nested_engine(
+    inspire_app, override_config
+):
+    literature = create_record("lit", faker.record("lit"))
+    for preprint_date in ["2010-01-01", "2013-01-01", "2013-02-01"]:
+        create_record(
+            "lit",
+            faker.record(
+                "lit",
+                literature_citations=[literature["control_number"]],
+                data={"preprint_date": preprint_date},
+            ),
+        )
+    literature.index(delay=False)
+    request_param = {"facet_name": "citations-by-year"}
+
+    current_search.flush_and_refresh("records-hep")
+
+    with override_config(
+        CITATIONS_BY_YEAR_ENGINE="nested"
+    ), inspire_app.test_client() as client:
+        response = client.get(f"/literature/facets/?{urlencode(request_param)}")
+
+    expected_response = {"value": {"2013": 2, "2010": 1}}
+    assert response.json["aggregations"]["citations_by_year"] == expected_response
+
+
 def test_literature_search_user_does_not_get_fermilab_collection(inspire_app):
     data = {
         "$schema": "http://localhost:5000/schemas/records/hep.json",
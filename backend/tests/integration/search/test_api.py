@@ -12,7 +12,7 @@ import urllib
 import mock
 import orjson
 import pytest
-from helpers.utils import create_record, create_user
+from helpers.utils import create_record, create_user, get_counter_value
 from invenio_accounts.testutils import login_user_via_session
 from requests.exceptions import RequestException
 
@@ -1279,3 +1279,50 @@ def test_literature_journal_title_search_is_case_insensitive(inspire_app):
 
     assert str(record1.id) in result_uppercase_found_record_ids
     assert str(record2.id) in result_uppercase_found_record_ids
+
+
+def test_search_results_are_cached_for_anonymous_users_until_index_write(
+    inspire_app, redis, override_config
+):
+    from inspirehep.search.cache import search_results_cache_requests
+
+    def get_cache_requests(result):
+        return get_counter_value(
+            search_results_cache_requests, index="records-hep", result=result
+        )
+
+    create_record("lit", data={"titles": [{"title": "Cached search"}]})
+    hits_before, misses_before = get_cache_requests("hit"), get_cache_requests("miss")
+    with override_config(FEATURE_FLAG_ENABLE_SEARCH_RESULTS_CACHE=True):
+        with inspire_app.test_client() as client:
+            first = client.get("/api/literature", query_string={"q": "cached"})
+            second = client.get("/api/literature", query_string={"q": "cached"})
+        create_record("lit", data={"titles": [{"title": "Cached search again"}]})
+        with inspire_app.test_client() as client:
+            third = client.get("/api/literature", query_string={"q": "cached"})
+
+    assert first.json == second.json
+    assert first.json["hits"]["total"] == 1
+    assert third.json["hits"]["total"] == 2
+    assert get_cache_requests("hit") - hits_before == 1
+    assert get_cache_requests("miss") - misses_before == 2
+
+
+def test_literature_get_records_by_pids_and_uuids_in_chunks(
+    inspire_app, override_config
+):
+    records = [create_record("lit") for _ in range(3)]
+    pids = [("lit", str(record["control_number"])) for record in records]
+    with override_config(SEARCH_TERMS_QUERY_MAX_SIZE=2):
+        by_pids = LiteratureSearch.get_records_by_pids(pids, source=["control_number"])
+        by_uuids = LiteratureSearch().get_records_by_uuids(
+            [record.id for record in records], source=["control_number"]
+        )
+        limited = LiteratureSearch.get_records_by_pids(pids, size=2)
+
+    expected_control_numbers = {record["control_number"] for record in records}
+    assert {hit.control_number for hit in by_pids} == expected_control_numbers
+    assert {
+        document["_source"]["control_number"] for document in by_uuids
+    } == expected_control_numbers
+    assert len(limited) == 2
@@ -5,16 +5,22 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+from datetime import date
+
 from elasticsearch_dsl import Search
 from flask import current_app
 from mock import patch
 
-from inspirehep.search.factories.query import inspire_query_factory
+from inspirehep.search.factories.query import (
+    inspire_query_factory,
+    parsed_query_cache,
+)
 
 
 @patch("inspirehep.search.factories.query.inspire_query_parser.parse_query")
 def test_inspire_query_parser_is_called(mock_inspire_query_parser, inspire_app):
     query_string = "foo"
+    parsed_query_cache.clear()
     with current_app.test_request_context():
         factory = inspire_query_factory()
         search = Search()
@@ -31,3 +37,46 @@ def test_inspire_query_parser_max_recursion_on_complicated_queries(inspire_app):
         search = Search()
 
         factory(query_string, search)
+
+
+def test_inspire_query_parser_is_called_once_for_repeated_queries(
+    inspire_app, override_config
+):
+    parsed_query_cache.clear()
+    with override_config(SEARCH_PARSED_QUERY_CACHE_SIZE=1), patch(
+        "inspirehep.search.factories.query.inspire_query_parser.parse_query",
+        side_effect=lambda query_string: {"match": {"title": query_string}},
+    ) as mock_inspire_query_parser, current_app.test_request_context():
+        factory = inspire_query_factory()
+        search = Search()
+
+        first_query = factory("t boson", search)
+        second_query = factory("t boson", search)
+        factory("t higgs", search)
+        factory("t boson", search)
+
+    assert first_query == second_query
+    assert first_query is not second_query
+    assert mock_inspire_query_parser.call_count == 3
+
+
+def test_inspire_query_parser_parses_again_queries_on_next_day(
+    inspire_app, override_config
+):
+    parsed_query_cache.clear()
+    with override_config(SEARCH_PARSED_QUERY_CACHE_SIZE=10), patch(
+        "inspirehep.search.factories.query.inspire_query_parser.parse_query",
+        side_effect=lambda query_string: {"match": {"title": query_string}},
+    ) as mock_inspire_query_parser, patch(
+        "inspirehep.search.factories.query.date"
+    ) as mock_date, current_app.test_request_context():
+        factory = inspire_query_factory()
+        search = Search()
+
+        mock_date.today.return_value = date(2020, 1, 1)
+        factory("de > yesterday", search)
+        factory("de > yesterday", search)
+        mock_date.today.return_value = date(2020, 1, 2)
+        factory("de > yesterday", search)
+
+    assert mock_inspire_query_parser.call_count == 2
@@ -10,14 +10,20 @@ from flask import current_app
 from mock import MagicMock
 
 from inspirehep.search.api import InspireSearch, LiteratureSearch
-from inspirehep.search.errors import FieldsParamForbidden
+from inspirehep.search.errors import (
+    FieldsParamForbidden,
+    InvalidSearchAfterCursor,
+    SearchAfterWithPageForbidden,
+)
 from inspirehep.search.factories.search import (
+    get_search_with_search_after,
     get_search_with_source,
     inspire_search_factory,
     search_factory_only_with_aggs,
     search_factory_with_aggs,
     search_factory_without_aggs,
 )
+from inspirehep.search.utils import encode_search_after_cursor
 
 
 def test_get_search_with_source_with_fields_query_param_and_wrong_formats(inspire_app):
@@ -321,3 +327,41 @@ def test_search_factory_only_with_aggs_without_query(inspire_app, override_confi
         assert "aggs" in search_to_dict
         assert "filter" not in search_to_dict
         assert "post_filter" not in search_to_dict
+
+
+def test_get_search_with_search_after(inspire_app):
+    cursor = encode_search_after_cursor([1607990400000, 42])
+    with current_app.test_request_context(f"?search_after={cursor}"):
+        search = LiteratureSearch().sort("-earliest_date")
+        search = get_search_with_search_after(search[20:30]).to_dict()
+
+    assert search["sort"] == [
+        {"earliest_date": {"order": "desc"}},
+        {"control_number": {"order": "desc"}},
+    ]
+    assert search["search_after"] == [1607990400000, 42]
+    assert search["from"] == 0
+
+
+def test_get_search_with_search_after_first_page_and_without_parameter(inspire_app):
+    with current_app.test_request_context("?search_after="):
+        search = get_search_with_search_after(LiteratureSearch()).to_dict()
+    assert search["sort"] == [
+        {"_score": {"order": "desc"}},
+        {"control_number": {"order": "desc"}},
+    ]
+    assert "search_after" not in search
+
+    with current_app.test_request_context("?page=2"):
+        search = get_search_with_search_after(LiteratureSearch()).to_dict()
+    assert "sort" not in search
+
+
+def test_get_search_with_search_after_with_page_or_invalid_cursor(inspire_app):
+    with current_app.test_request_context("?search_after=&page=2"):
+        with pytest.raises(SearchAfterWithPageForbidden):
+            get_search_with_search_after(LiteratureSearch())
+
+    with current_app.test_request_context("?search_after=not-a-cursor"):
+        with pytest.raises(InvalidSearchAfterCursor):
+            get_search_with_search_after(LiteratureSearch())
@@ -102,6 +102,33 @@ def test_facet_configuration_with_fallback_to_default_facet(
             assert expected == result
 
 
+def test_facet_configuration_is_built_once_per_request_signature(
+    inspire_app, override_config
+):
+    facet_mock = Mock(return_value={"aggs": {}})
+    config = {"RECORDS_REST_FACETS": {"records-hep": facet_mock}}
+    with override_config(**config):
+        for author in ["1_Jessica", "1_Jessica", "2_Luke"]:
+            with current_app.test_request_context(f"?author={author}&q=title"):
+                result = get_facet_configuration("records-hep")
+                assert result == {"aggs": {}}
+    assert facet_mock.call_count == 2
+
+
+def test_facet_configuration_is_built_again_on_config_change(
+    inspire_app, override_config
+):
+    facet_mock = Mock(return_value={"aggs": {}})
+    config = {"RECORDS_REST_FACETS": {"records-hep": facet_mock}}
+    with override_config(**config), current_app.test_request_context("?q=title"):
+        result = get_facet_configuration("records-hep")
+        result["aggs"]["modified"] = {}
+        with override_config(CITATIONS_BY_YEAR_ENGINE="nested"):
+            result = get_facet_configuration("records-hep")
+    assert result == {"aggs": {}}
+    assert facet_mock.call_count == 2
+
+
 def test_setting_recursion_limit():
     def recursion_test(max_depth, current_level=1):
         level = current_level
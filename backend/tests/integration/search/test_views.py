@@ -5,6 +5,9 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+import orjson
+from helpers.utils import create_record
+
 
 def test_query_parser(inspire_app):
     query = "title"
@@ -23,3 +26,100 @@ def test_query_parser_should_return_400_when_query_is_malformed(inspire_app):
             "/search/query-parser?query={}", content_type="application/json"
         )
     assert response.status_code == 400
+
+
+def test_export_literature_search_streams_bibtex_and_json(inspire_app, redis):
+    create_record("lit", data={"titles": [{"title": "First exported paper"}]})
+    create_record("lit", data={"titles": [{"title": "Second exported paper"}]})
+
+    with inspire_app.test_client() as client:
+        bibtex_response = client.get(
+            "/search/export/literature", query_string={"format": "bibtex"}
+        )
+        json_response = client.get(
+            "/search/export/literature", query_string={"q": "first"}
+        )
+
+    assert bibtex_response.status_code == 200
+    assert bibtex_response.mimetype == "application/x-bibtex"
+    bibtex = bibtex_response.get_data(as_text=True)
+    assert "First exported paper" in bibtex
+    assert "Second exported paper" in bibtex
+
+    assert json_response.status_code == 200
+    assert json_response.mimetype == "application/x-ndjson"
+    lines = json_response.get_data(as_text=True).splitlines()
+    assert len(lines) == 1
+    exported_record = orjson.loads(lines[0])
+    assert exported_record["titles"] == [{"title": "First exported paper"}]
+    assert "_bibtex_display" not in exported_record
+
+
+def test_export_literature_search_is_rate_limited(inspire_app, redis, override_config):
+    with override_config(SEARCH_EXPORT_RATE_LIMIT=1):
+        with inspire_app.test_client() as client:
+            first = client.get("/search/export/literature")
+            second = client.get("/search/export/literature")
+
+    assert first.status_code == 200
+    assert second.status_code == 429
+
+
+def test_export_literature_search_with_unknown_format(inspire_app, redis):
+    with inspire_app.test_client() as client:
+        response = client.get(
+            "/search/export/literature", query_string={"format": "xml"}
+        )
+    assert response.status_code == 400
+
+
+def test_export_literature_search_keeps_the_requested_order(
+    inspire_app, redis, override_config
+):
+    for preprint_date in ["2012-01-01", "2010-01-01", "2011-01-01"]:
+        create_record(
+            "lit",
+            data={
+                "preprint_date": preprint_date,
+                "titles": [{"title": f"Paper of {preprint_date}"}],
+            },
+        )
+
+    with override_config(SEARCH_EXPORT_SCAN_SIZE=1):
+        with inspire_app.test_client() as client:
+            response = client.get(
+                "/search/export/literature", query_string={"sort": "leastrecent"}
+            )
+
+    assert response.status_code == 200
+    titles = [
+        orjson.loads(line)["titles"][0]["title"]
+        for line in response.get_data(as_text=True).splitlines()
+    ]
+    assert titles == [
+        "Paper of 2010-01-01",
+        "Paper of 2011-01-01",
+        "Paper of 2012-01-01",
+    ]
+
+
+def test_export_literature_search_with_search_after(inspire_app, redis):
+    with inspire_app.test_client() as client:
+        response = client.get(
+            "/search/export/literature", query_string={"search_after": ""}
+        )
+    assert response.status_code == 400
+
+
+def test_export_literature_search_with_unknown_format_is_not_rate_limited(
+    inspire_app, redis, override_config
+):
+    with override_config(SEARCH_EXPORT_RATE_LIMIT=1):
+        with inspire_app.test_client() as client:
+            unknown_format = client.get(
+                "/search/export/literature", query_string={"format": "xml"}
+            )
+            first = client.get("/search/export/literature")
+
+    assert unknown_format.status_code == 400
+    assert first.status_code == 200
@@ -149,3 +149,21 @@ def test_fulltext_indexing_error_is_excluded_from_documents():
 
     result = LiteraturePublicListSchema().dump(data).data
     assert "_error" not in result["documents"][0]
+
+
+def test_fulltext_etag_is_excluded_from_documents():
+    data = {
+        "documents": [
+            {
+                "source": "arxiv",
+                "fulltext": True,
+                "key": "new_doc.pdf",
+                "filename": "new_doc.pdf",
+                "url": "http://www.africau.edu/images/default/sample.pdf",
+                "_fulltext_etag": '"d41d8cd98f00b204e9800998ecf8427e"',
+            }
+        ]
+    }
+
+    result = LiteraturePublicListSchema().dump(data).data
+    assert "_fulltext_etag" not in result["documents"][0]
@@ -5,6 +5,8 @@
 # inspirehep is free software; you can redistribute it and/or modify it under
 # the terms of the MIT License; see LICENSE file for more details.
 
+from copy import deepcopy
+
 import orjson
 from helpers.providers.faker import faker
 from mock import patch
@@ -127,3 +129,93 @@ def test_es_schema_removes_fulltext_indexing_errors(
     serialized = schema.dump(entry_data).data
     result = orjson.loads(schema.dumps(serialized).data)["_ui_display"]
     assert "_error" not in result
+
+
+@patch(
+    "inspirehep.records.marshmallow.literature.es.LiteratureElasticSearchSchema.get_referenced_authors_bais",
+    return_value=[],
+)
+@patch(
+    "inspirehep.records.marshmallow.literature.es.LiteratureElasticSearchSchema.get_cv_format",
+    return_value=[],
+)
+@patch("inspirehep.records.marshmallow.literature.ui.current_app")
+@patch("inspirehep.records.marshmallow.literature.ui.current_s3_instance")
+@patch("inspirehep.records.marshmallow.base.deepcopy", wraps=deepcopy)
+def test_es_schema_deep_copies_record_with_many_authors_only_once(
+    deepcopy_mock,
+    current_s3_mock,
+    current_app_mock,
+    mock_cv_format,
+    mock_referenced_authors,
+):
+    current_app_mock.config = {"FEATURE_FLAG_ENABLE_FILES": True}
+    authors = [
+        {"full_name": f"Author, {number}", "affiliations": [{"value": "CERN"}]}
+        for number in range(3000)
+    ]
+    data = faker.record(
+        "lit",
+        data={
+            "authors": authors,
+            "arxiv_eprints": [{"value": "1607.12345", "categories": ["hep-ex"]}],
+            "dois": [{"value": "10.1000/big_collaboration"}],
+        },
+    )
+    original_data = deepcopy(data)
+    deepcopy_mock.reset_mock()
+
+    result = LiteratureElasticSearchSchema().dump(data).data
+
+    assert deepcopy_mock.call_count == 1
+    assert data == original_data
+    assert len(result["authors"]) == 3000
+    assert len(orjson.loads(result["_ui_display"])["authors"]) == 10
+
+
+@patch(
+    "inspirehep.records.marshmallow.literature.es.LiteratureElasticSearchSchema.get_referenced_authors_bais",
+    return_value=[],
+)
+@patch(
+    "inspirehep.records.marshmallow.literature.es.LiteratureElasticSearchSchema.get_cv_format",
+    return_value=[],
+)
+@patch("inspirehep.records.marshmallow.literature.ui.current_app")
+@patch("inspirehep.records.marshmallow.literature.ui.current_s3_instance")
+@patch("inspirehep.records.marshmallow.literature.ui.get_parent_record")
+@patch("inspirehep.records.marshmallow.literature.bibtex.get_parent_record")
+def test_es_schema_gets_parent_record_only_once_for_all_displays(
+    bibtex_get_parent_record_mock,
+    ui_get_parent_record_mock,
+    current_s3_mock,
+    current_app_mock,
+    mock_cv_format,
+    mock_referenced_authors,
+):
+    current_app_mock.config = {"FEATURE_FLAG_ENABLE_FILES": True}
+    parent_record = {
+        "control_number": 1,
+        "titles": [{"title": "A book"}],
+        "self": {"$ref": "http://localhost:5000/api/literature/1"},
+    }
+    bibtex_get_parent_record_mock.return_value = parent_record
+    ui_get_parent_record_mock.return_value = parent_record
+    data = faker.record(
+        "lit",
+        data={
+            "document_type": ["book chapter"],
+            "publication_info": [
+                {"parent_record": {"$ref": "http://localhost:5000/api/literature/1"}}
+            ],
+        },
+    )
+
+    result = LiteratureElasticSearchSchema().dump(data).data
+
+    assert (
+        bibtex_get_parent_record_mock.call_count + ui_get_parent_record_mock.call_count
+        == 1
+    )
+    assert "A book" in result["_bibtex_display"]
+    assert orjson.loads(result["_ui_display"])["linked_book"]["title"] == "A book"
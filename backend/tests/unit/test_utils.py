@@ -1,4 +1,6 @@
-from inspirehep.utils import chunker
+from mock import Mock, call, patch
+
+from inspirehep.utils import LRUCache, chunker
 
 
 def test_chunker():
@@ -34,3 +36,39 @@ def test_chunker_doesnt_make_chunks_larger_than_max_chunk_size():
     result = chunker(iterable, 2, 2)
 
     assert list(result) == expected
+
+
+def test_lru_cache_evicts_least_recently_used_values():
+    requests_counter = Mock()
+    cache = LRUCache(requests_counter)
+
+    cache.set("first", 1, max_size=2)
+    cache.set("second", 2, max_size=2)
+    cache.get("first")
+    cache.set("third", 3, max_size=2)
+
+    assert cache.get("first") == 1
+    assert cache.get("second") is None
+    assert cache.get("third") == 3
+    assert requests_counter.labels.call_args_list == [
+        call(result="hit"),
+        call(result="eviction"),
+        call(result="hit"),
+        call(result="miss"),
+        call(result="hit"),
+    ]
+
+
+@patch("inspirehep.utils.monotonic")
+def test_lru_cache_expires_values(mock_monotonic):
+    cache = LRUCache(Mock())
+
+    mock_monotonic.return_value = 100
+    cache.set("key", "value", max_size=10, timeout=60)
+    mock_monotonic.return_value = 159
+    before_timeout = cache.get("key")
+    mock_monotonic.return_value = 160
+    after_timeout = cache.get("key")
+
+    assert before_timeout == "value"
+    assert after_timeout is None